@@ -0,0 +1,5 @@
+import sys
+
+from lazy_type_hint.cli import main
+
+sys.exit(main())
@@ -0,0 +1,400 @@
+"""Command-line interface of `lazy-type-hint`.
+
+Type hints JSON, JSON Lines, YAML and CSV files (or the standard input) and writes them into a file, a package or the
+standard output. Run `lazy-type-hint --help` for the available options.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import MISSING, dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, Final, Literal, Optional, Union, get_args, get_type_hints
+
+from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
+from lazy_type_hint.file_modifiers.yaml_file_modifier import YAML_COMMENTS_POSITION
+from lazy_type_hint.generators.lazy_type_hint import (
+    DirectoryTrees,
+    LazyTypeHint,
+    LazyTypeHintError,
+    Tree,
+    _get_class_name,
+)
+from lazy_type_hint.strategies import ParsingStrategies
+
+FORMATS = Literal["json", "jsonl", "yaml", "csv"]
+"""Formats of the inputs that can be type hinted."""
+
+PROFILERS = Literal["auto", "pyinstrument", "cprofile"]
+"""Profilers that can be used with `--profile`. `auto` uses `pyinstrument` if installed and `cProfile` otherwise."""
+
+FORMAT_PER_SUFFIX: Final[dict[str, FORMATS]] = {
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".csv": "csv",
+}
+"""Format of the inputs given by their suffix, if not given by `--format`."""
+
+STDIN: Final = "-"
+"""Input that stands for the standard input."""
+
+
+@dataclass(frozen=True)
+class _Input:
+    """Input to type hint."""
+
+    path: Path
+    """Path to the file holding the input (a temporary file for the standard input)."""
+    name: str
+    """Name of the input shown to the user."""
+    format: FORMATS
+    """Format of the input."""
+    class_name: str
+    """Name of the generated type."""
+
+
+@dataclass(frozen=True)
+class _Result:
+    """Type hints of an input, along with their statistics."""
+
+    tree: Tree
+    seconds: float
+    """Seconds spent loading and parsing the input."""
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the command-line interface.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): Arguments, without the name of the program. Defaults to None
+            (those given to the current process).
+
+    Returns:
+        int: Exit code.
+    """
+    parser = _create_parser()
+    args = parser.parse_args(argv)
+    if not args.profile:
+        return _run(parser, args)
+    return _run_profiled(parser, args, profiler=args.profiler)
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="lazy-type-hint",
+        description="Generate the type hints of JSON, JSON Lines, YAML and CSV files.",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        default=[STDIN],
+        help=f"Files to type hint. Use `{STDIN}` (or nothing) to read from the standard input.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help=(
+            "Where the type hints are written: a `.py` file for a single input, or the directory of a package with "
+            "a module per input for many of them. Defaults to the standard output (only for a single input)."
+        ),
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=get_args(FORMATS),
+        help="Format of the inputs. Defaults to the one given by their suffix. Needed for the standard input.",
+    )
+    parser.add_argument(
+        "-n",
+        "--class-name",
+        help="Name of the generated type (only for a single input). Defaults to the one built from the file name.",
+    )
+    parser.add_argument(
+        "--comments-are",
+        choices=(*get_args(YAML_COMMENTS_POSITION), "none"),
+        default="side",
+        help="Position of the comments of YAML files used as docstrings. Defaults to `side`.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        help="Number of processes used to type hint many inputs. Defaults to 1.",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print the number of nodes, of definitions and the seconds spent on each input to the standard error.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the run and print the report to the standard error. With `--jobs`, only the main process is "
+        "profiled.",
+    )
+    parser.add_argument(
+        "--profiler",
+        choices=get_args(PROFILERS),
+        default="auto",
+        help="Profiler used by `--profile`. Defaults to `auto` (pyinstrument if installed, cProfile otherwise).",
+    )
+    _add_strategies_arguments(parser.add_argument_group("parsing strategies"))
+    return parser
+
+
+def _add_strategies_arguments(group: argparse._ArgumentGroup) -> None:
+    """Add an argument per field of `ParsingStrategies` (e.g. `--list-strategy` for `list_strategy`)."""
+    type_hints = get_type_hints(ParsingStrategies)
+    for field in fields(ParsingStrategies):
+        flag = f"--{field.name.replace('_', '-')}"
+        type_hint = type_hints[field.name]
+        default = field.default if field.default is not MISSING else None
+        # Strategies that are not given are not set, so that the default values of `ParsingStrategies` are used
+        kwargs: dict[str, Any] = {"default": argparse.SUPPRESS, "help": f"Defaults to `{default}`."}
+        if type_hint is bool:
+            group.add_argument(flag, action=argparse.BooleanOptionalAction, **kwargs)
+        elif type_hint is int:
+            group.add_argument(flag, type=int, metavar="INT", **kwargs)
+        elif type_hint == Optional[int]:
+            group.add_argument(flag, type=_optional_int, metavar="INT|none", **kwargs)
+        elif type_hint is str:
+            group.add_argument(flag, metavar="STR", **kwargs)
+        else:
+            group.add_argument(flag, choices=get_args(type_hint), **kwargs)
+
+
+def _get_strategies(args: argparse.Namespace) -> ParsingStrategies:
+    """Get the strategies given by the arguments, with the default value for those not given."""
+    return ParsingStrategies(
+        **{field.name: getattr(args, field.name) for field in fields(ParsingStrategies) if hasattr(args, field.name)}
+    )
+
+
+def _positive_int(string: str) -> int:
+    value = int(string)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {string}")
+    return value
+
+
+def _optional_int(string: str) -> Optional[int]:
+    return None if string.lower() == "none" else int(string)
+
+
+def _run_profiled(parser: argparse.ArgumentParser, args: argparse.Namespace, *, profiler: PROFILERS) -> int:
+    """Run the command-line interface within the given profiler, printing its report to the standard error."""
+    if profiler in ("auto", "pyinstrument"):
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            if profiler == "pyinstrument":
+                parser.error("pyinstrument is not installed. Install it or use `--profiler cprofile`")
+        else:
+            with Profiler() as pyinstrument_profiler:
+                code = _run(parser, args)
+            print(pyinstrument_profiler.output_text(unicode=True, color=False), file=sys.stderr)
+            return code
+
+    import cProfile
+    import pstats
+
+    with cProfile.Profile() as cprofile_profiler:
+        code = _run(parser, args)
+    pstats.Stats(cprofile_profiler, stream=sys.stderr).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(30)
+    return code
+
+
+def _run(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    try:
+        strategies = _get_strategies(args)
+    except ValueError as error:
+        parser.error(str(error))
+    if len(args.inputs) > 1 and args.output is None:
+        parser.error("--output is needed when type hinting multiple inputs")
+    if len(args.inputs) > 1 and args.class_name is not None:
+        parser.error("--class-name can only be given for a single input")
+    if args.inputs.count(STDIN) > 1:
+        parser.error("The standard input can only be given once")
+
+    generator = LazyTypeHint(strategies)
+    comments_are: Optional[YAML_COMMENTS_POSITION] = None if args.comments_are == "none" else args.comments_are
+    start = time.perf_counter()
+    try:
+        with _get_inputs(args.inputs, format_=args.format, class_name=args.class_name) as inputs:
+            results = _type_hint_inputs(generator, inputs, jobs=args.jobs, comments_are=comments_are)
+            if args.stats:
+                _print_stats(inputs, results, seconds=time.perf_counter() - start)
+            if len(inputs) == 1 and args.output is None:
+                results[0].tree.write(sys.stdout)
+                sys.stdout.write("\n")
+            elif len(inputs) == 1:
+                results[0].tree.to_file(args.output, create_non_existing_dir=True)
+            else:
+                trees = DirectoryTrees(
+                    trees={Path(source.name): result.tree for source, result in zip(inputs, results)},
+                    timings={Path(source.name): result.seconds for source, result in zip(inputs, results)},
+                )
+                trees.to_package(args.output, create_non_existing_dir=True)
+    except (LazyTypeHintError, OSError, ValueError) as error:
+        print(f"{parser.prog}: error: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+@contextmanager
+def _get_inputs(
+    names: Sequence[str], *, format_: Optional[FORMATS], class_name: Optional[str]
+) -> Iterator[list[_Input]]:
+    """Get the inputs to type hint, removing the temporary file of the standard input (if any) on exit."""
+    inputs: list[_Input] = []
+    names_taken: set[str] = set()
+    temporary_path: Optional[Path] = None
+    try:
+        for name in names:
+            if name == STDIN:
+                if format_ is None:
+                    raise LazyTypeHintError("--format is needed to type hint the standard input")
+                path = temporary_path = _write_stdin_to_temporary_file(format_)
+                default_class_name = _get_class_name(Path("Data"), names_taken=names_taken)
+            else:
+                path = Path(name)
+                default_class_name = _get_class_name(Path(path.name), names_taken=names_taken)
+            input_format = format_ or FORMAT_PER_SUFFIX.get(path.suffix.lower())
+            if input_format is None:
+                raise LazyTypeHintError(f"Unknown format of {name}. Give it with --format")
+            inputs.append(_Input(path, name, input_format, class_name or default_class_name))
+        yield inputs
+    finally:
+        if temporary_path is not None:
+            os.remove(temporary_path)
+
+
+def _write_stdin_to_temporary_file(format_: FORMATS) -> Path:
+    """Copy the standard input into a temporary file, so that it is read as any other input (e.g. YAML comments)."""
+    suffix = next(suffix for suffix, suffix_format in FORMAT_PER_SUFFIX.items() if suffix_format == format_)
+    descriptor, path = tempfile.mkstemp(suffix=suffix)
+    with open(descriptor, "w", encoding="utf-8") as file:
+        while block := sys.stdin.read(1024**2):
+            file.write(block)
+    return Path(path)
+
+
+def _type_hint_inputs(
+    generator: LazyTypeHint,
+    inputs: Sequence[_Input],
+    *,
+    jobs: int,
+    comments_are: Optional[YAML_COMMENTS_POSITION],
+) -> list[_Result]:
+    """Type hint the inputs, distributing them among `jobs` processes if there is more than one."""
+    file_jobs = [(source.path, source.class_name, _get_loader(source)) for source in inputs]
+    return [
+        _Result(tree, seconds)
+        for tree, seconds in generator._from_files_timed(file_jobs, workers=jobs, comments_are=comments_are)
+    ]
+
+
+def _get_loader(source: _Input) -> Optional[Callable[[Path], object]]:
+    """Get the loader of the input, if it is needed to type hint it. See `LazyTypeHint.from_directory`.
+
+    CSV files are only read in chunks (without any loader) if their suffix tells so, as their format is otherwise
+    unknown to `LazyTypeHint`.
+    """
+    if source.format == "csv":
+        return None if source.path.suffix.lower() == ".csv" else _load_csv
+    return LOADER_PER_FORMAT[source.format]
+
+
+def _load_yaml(path: Path) -> object:
+    try:
+        import yaml
+    except ImportError as error:
+        raise LazyTypeHintError("PyYAML is needed to type hint YAML files") from error
+    with open(path, encoding="utf-8") as file:
+        try:
+            return yaml.safe_load(file)
+        except yaml.YAMLError as error:
+            raise LazyTypeHintError(f"Invalid YAML in {path}: {error}") from error
+
+
+def _load_json(path: Path) -> object:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _load_json_lines(path: Path) -> object:
+    return list(_iter_json_lines(path))
+
+
+def _load_csv(path: Path) -> object:
+    import pandas as pd
+
+    return pd.read_csv(path)
+
+
+def _iter_json_lines(path: Union[Path, str]) -> Iterator[object]:
+    """Lazily load the values of a JSON Lines file, skipping blank lines."""
+    with open(path, encoding="utf-8") as file:
+        for line_idx, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as error:
+                raise LazyTypeHintError(f"Invalid JSON in line {line_idx} of {path}: {error}") from error
+
+
+LOADER_PER_FORMAT: Final[dict[FORMATS, Callable[[Path], object]]] = {
+    "json": _load_json,
+    "jsonl": _load_json_lines,
+    "yaml": _load_yaml,
+    "csv": _load_csv,
+}
+"""Loader of the inputs of each format. They are defined at the top level, as they are sent to other processes."""
+
+
+def _print_stats(inputs: Sequence[_Input], results: Sequence[_Result], *, seconds: float) -> None:
+    """Print the number of nodes and definitions and the seconds spent on each input to the standard error."""
+    rows = [("input", "nodes", "definitions", "seconds")]
+    for source, result in zip(inputs, results):
+        n_nodes, n_definitions = _count_nodes(result.tree._tree)
+        rows.append((source.name, str(n_nodes), str(n_definitions), f"{result.seconds:.3f}"))
+    rows.append(("total", "", "", f"{seconds:.3f}"))
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    for row in rows:
+        line = "  ".join(
+            value.ljust(width) if column == 0 else value.rjust(width)
+            for column, (value, width) in enumerate(zip(row, widths))
+        )
+        print(line.rstrip(), file=sys.stderr)
+
+
+def _count_nodes(tree: DataTypeTree) -> tuple[int, int]:
+    """Count the distinct nodes of the tree and how many of them are defined (e.g. as a `TypedDict`)."""
+    seen: set[int] = set()
+    pending = [tree]
+    while pending:
+        node = pending.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node.children, Mapping):
+            pending.extend(node.children.values())
+        elif node.children is not None:
+            pending.extend(node.children)
+    n_definitions = len({id(node) for node in tree._iter_nodes_to_define()})
+    return len(seen), n_definitions
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,3 +3,12 @@ from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTreeError as Da
 from lazy_type_hint.data_type_tree.factory import data_type_tree_factory as data_type_tree_factory
 from lazy_type_hint.data_type_tree.generic_type.generic_data_type_tree import GenericDataTypeTree  # noqa: F401
 from lazy_type_hint.data_type_tree.simple_data_type_tree import SimpleDataTypeTree  # noqa: F401
+from lazy_type_hint.data_type_tree.serialization import dump_data_type_tree as dump_data_type_tree
+from lazy_type_hint.data_type_tree.serialization import load_data_type_tree as load_data_type_tree
+from lazy_type_hint.data_type_tree.fingerprint import get_fingerprint as get_fingerprint
+from lazy_type_hint.data_type_tree.diff import SchemaChange as SchemaChange
+from lazy_type_hint.data_type_tree.diff import diff_data_type_trees as diff_data_type_trees
+from lazy_type_hint.data_type_tree.package import Module as Module
+from lazy_type_hint.data_type_tree.package import iter_modules as iter_modules
+from lazy_type_hint.data_type_tree.package import iter_modules_of_trees as iter_modules_of_trees
+from lazy_type_hint.data_type_tree.package import share_identical_nodes as share_identical_nodes
@@ -4,10 +4,15 @@ This data can then be parsed to a .py compatible file that will type hint your c
 """
 from __future__ import annotations
 
+import hashlib
+import importlib
 import re
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
-from collections.abc import Hashable, Mapping, Sequence
+from collections.abc import Collection, Hashable, Iterable, Iterator, Mapping, Sequence
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     ClassVar,
@@ -66,8 +71,16 @@ class DataTypeTree(ABC):
 
     subclasses: ClassVar[Mapping[type[object], type[DataTypeTree]]] = {}
     """Available subclasses according to the type they are able to parse."""
+    lazy_subclasses: ClassVar[dict[str, tuple[str, str]]] = {}
+    """Modules and names of the subclasses not imported yet, indexed by the qualified name of the type they parse.
+
+    Used for types of optional libraries (e.g. `pandas.DataFrame`), whose subclasses are only imported once an object
+    of that library is found. See `register_lazy_subclass`.
+    """
     wraps: ClassVar[Sequence[type[object]]] = (object,)
     """Object type that the tree is able to parse."""
+    _docstring_state_keys: ClassVar[Sequence[str]] = ()
+    """Keys returned by `_get_state` that only hold docstrings."""
 
     @final
     def __init__(
@@ -100,6 +113,8 @@ class DataTypeTree(ABC):
     def get_subclass(cls, data: object) -> type[DataTypeTree]:
         if type(data) in DataTypeTree.subclasses:
             return DataTypeTree.subclasses[type(data)]
+        if DataTypeTree.lazy_subclasses and DataTypeTree.import_lazy_subclasses(type(data)):
+            return cls.get_subclass(data)
 
         for subclass in DataTypeTree.subclasses.values():
             for wrap in subclass.wraps:
@@ -107,6 +122,43 @@ class DataTypeTree(ABC):
                     return subclass
         return DataTypeTree.subclasses[int]  # For instances created from any custom class.
 
+    @staticmethod
+    def register_lazy_subclass(qualified_type_name: str, module_name: str, class_name: str) -> None:
+        """Register a subclass that is only imported once an object of the library of the type it parses is found.
+
+        Args:
+            qualified_type_name (str): Qualified name of the type parsed by the subclass (e.g. `pandas.DataFrame`). Its
+                first part is the library whose objects trigger the import.
+            module_name (str): Module that defines the subclass.
+            class_name (str): Name of the subclass.
+        """
+        DataTypeTree.lazy_subclasses[qualified_type_name] = (module_name, class_name)
+
+    @staticmethod
+    def import_lazy_subclasses(type_: Optional[type[object]] = None, *, class_names: Collection[str] = ()) -> bool:
+        """Import the lazy subclasses of the libraries defining the type (or its bases) or with the given names.
+
+        See `lazy_subclasses`.
+
+        Args:
+            type_ (Optional[type[object]], optional): Type found. Defaults to None.
+            class_names (Collection[str], optional): Names of the subclasses to import. Defaults to ().
+
+        Returns:
+            bool: Whether any subclass was imported.
+        """
+        libraries = {base.__module__.partition(".")[0] for base in type_.__mro__} if type_ is not None else set()
+        qualified_type_names = [
+            name
+            for name, (_, class_name) in DataTypeTree.lazy_subclasses.items()
+            if name.partition(".")[0] in libraries or class_name in class_names
+        ]
+        for name in qualified_type_names:
+            importlib.import_module(DataTypeTree.lazy_subclasses[name][0])
+            # Only forgotten once imported, so that it can be imported again if the import failed
+            del DataTypeTree.lazy_subclasses[name]
+        return bool(qualified_type_names)
+
     def _check_tree_is_correct_one(self, data: object) -> None:
         if not any(isinstance(data, wraps_) for wraps_ in self.wraps):
             wraps_str = [element.__name__ for element in self.wraps]
@@ -121,6 +173,22 @@ class DataTypeTree(ABC):
     def __post_child_instantiation__(self) -> None:
         ...
 
+    def _get_state(self) -> dict[str, Any]:
+        """Get the information, apart from its children, that the node needs in order to be rendered.
+
+        Used when serializing the tree. See `_set_state`.
+        """
+        return {}
+
+    def _set_state(self, state: Mapping[str, Any]) -> None:  # noqa: ARG002
+        """Restore the node from the information returned by `_get_state`.
+
+        Used when deserializing the tree once `children` have been assigned. As the original data is not available,
+        `data` is replaced by a surrogate that only holds the information needed to render the node.
+        """
+        self.data = None
+        self.__pre_child_instantiation__()
+
     def _get_height(self) -> int:
         """Get maximum height of the current node in the tree."""
         max_height = 0
@@ -151,6 +219,11 @@ class DataTypeTree(ABC):
                     raise DataTypeTreeError(f"A parser for {type_.__name__} was already found")
                 cls.subclasses[type_] = cls  # type: ignore
 
+    @property
+    def _has_ordered_children(self) -> bool:
+        """Whether the order of the children matters, as opposed to a group of types (e.g. members of a `Union`)."""
+        return True
+
     @abstractmethod
     def _get_hash(self) -> Hashable:
         """Get a unique hash that identifies the current data type."""
@@ -242,21 +315,109 @@ class DataTypeTree(ABC):
     def _get_strs_all_nodes_unformatted(self, *, types: Optional[OrderedSet[str]] = None) -> None:
         if types is None:
             types = OrderedSet()
+        for string in self._iter_strs_all_nodes_unformatted():
+            types.add(string)
 
+    @final
+    def _iter_strs_all_nodes_unformatted(self) -> Iterator[str]:
+        """Lazily get, ordered by dependencies, all strings representing the whole tree. These might be repeated."""
+        for node in self._iter_nodes_to_define():
+            yield node.get_str_top_node()
+
+    @final
+    def _iter_nodes_to_define(self) -> Iterator[DataTypeTree]:
+        """Lazily get, ordered by dependencies, all nodes that are defined on their own. These might be repeated."""
         if self.depth == 0 and not self.children:
             if self.permission_to_be_created_as_type_alias:
-                types.add(self.get_str_top_node())
+                yield self
             return
         if not self.children:
             return
 
         for child in self:
-            child._get_strs_all_nodes_unformatted(types=types)
+            yield from child._iter_nodes_to_define()
             if child.permission_to_be_created_as_type_alias:
-                types.add(child.get_str_top_node())
+                yield child
         if self.permission_to_be_created_as_type_alias:
-            types.add(self.get_str_top_node())
-        return
+            yield self
+
+    @final
+    def write_all_nodes(
+        self,
+        stream: IO[str],
+        *,
+        include_imports: bool = True,
+        make_parent_class_inherit_from_original_type: bool = False,
+    ) -> None:
+        """Write into a text stream the same content returned by `get_str_all_nodes`.
+
+        Definitions are written as soon as they are built, so that the whole content is never held in memory. As the
+        imports are only known once all of them were built, definitions are first written into a temporary file that
+        is then copied after the imports.
+        """
+        with tempfile.SpooledTemporaryFile(max_size=1024**2, mode="w+", encoding="utf-8") as body:
+            offset = 1 if include_imports else 0
+            self._write_formatted_node_strings(
+                body,
+                self._iter_unique_strs_all_nodes_unformatted(),
+                first_idx=offset,
+                make_parent_class_inherit_from_original_type=make_parent_class_inherit_from_original_type,
+            )
+            if include_imports:
+                stream.write(self.imports.format() + "\n\n\n")
+            body.seek(0)
+            shutil.copyfileobj(body, stream)
+
+    @final
+    def _iter_unique_strs_all_nodes_unformatted(self) -> Iterator[str]:
+        """Same as `_iter_strs_all_nodes_unformatted` but without repeated strings.
+
+        Only a digest of each string is kept to detect the repeated ones.
+        """
+        digests: set[bytes] = set()
+        for string in self._iter_strs_all_nodes_unformatted():
+            digest = hashlib.blake2b(string.encode("utf-8"), digest_size=16).digest()
+            if digest not in digests:
+                digests.add(digest)
+                yield string
+
+    @final
+    def _write_formatted_node_strings(
+        self,
+        stream: IO[str],
+        strs_py: Iterable[str],
+        *,
+        first_idx: int,
+        make_parent_class_inherit_from_original_type: bool,
+    ) -> None:
+        """Write the strings as `_format_node_strings` formats them, being `first_idx` the index of the first one."""
+
+        def write(idx: int, string: str) -> None:
+            if idx > first_idx:
+                stream.write("\n\n")
+            if idx >= 2 and string.startswith("class"):
+                stream.write("\n")
+            stream.write(string)
+            if idx == 0:
+                stream.write("\n")
+
+        # The last string needs to be known before being written, as it might need to be renamed
+        previous: Optional[str] = None
+        idx = first_idx
+        for string in strs_py:
+            if previous is not None:
+                write(idx, previous)
+                idx += 1
+            previous = string
+        if previous is None:
+            raise DataTypeTreeError("No type hints could be built")
+
+        if make_parent_class_inherit_from_original_type:
+            previous, old_name = self.rename_declaration(previous, new_name="_{name}")
+            write(idx, previous)
+            write(idx + 1, f"class {old_name}(_{old_name}):\n{TAB}...")
+        else:
+            write(idx, previous)
 
     @final
     def _format_node_strings(self, strs_py: Sequence[str]) -> str:
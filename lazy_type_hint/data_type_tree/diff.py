@@ -0,0 +1,144 @@
+"""Structural differences between two trees.
+
+Nodes are compared by means of their fingerprints (see `get_node_fingerprints`), so subtrees that did not change are
+skipped without being traversed. Names and docstrings are not taken into account.
+"""
+
+from dataclasses import dataclass
+from typing import Literal, Optional
+from collections.abc import Hashable, Mapping
+
+from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
+from lazy_type_hint.data_type_tree.fingerprint import get_node_fingerprints
+
+SCHEMA_CHANGE_KINDS = Literal[
+    "added_key",
+    "removed_key",
+    "required_to_optional",
+    "optional_to_required",
+    "widened_union",
+    "narrowed_union",
+    "changed_container",
+    "changed_type",
+]
+
+
+@dataclass(frozen=True)
+class SchemaChange:
+    """Change found between two trees."""
+
+    kind: SCHEMA_CHANGE_KINDS
+    """Kind of change."""
+    path: tuple[Hashable, ...]
+    """Keys or indexes that lead from the root to the node that changed.
+
+    `...` represents any of the elements of those containers whose elements are not indexed, such as lists or sets.
+    """
+    old: Optional[str] = None
+    """Description of the type found in the old tree (if any)."""
+    new: Optional[str] = None
+    """Description of the type found in the new tree (if any)."""
+
+    def __str__(self) -> str:
+        location = "".join("[*]" if key is ... else f"[{key!r}]" for key in self.path)
+        string = f"{location or '<root>'}: {self.kind.replace('_', ' ')}"
+        if self.old is not None and self.new is not None:
+            return f"{string} ({self.old} -> {self.new})"
+        if self.old is not None or self.new is not None:
+            return f"{string} ({self.old if self.new is None else self.new})"
+        return string
+
+
+def diff_data_type_trees(old: DataTypeTree, new: DataTypeTree) -> list[SchemaChange]:
+    """Get the structural changes needed to go from the `old` tree to the `new` one.
+
+    Args:
+        old (DataTypeTree): Reference tree.
+        new (DataTypeTree): Tree to compare against the reference one.
+
+    Returns:
+        list[SchemaChange]: All changes found. Empty if both trees share the same structure.
+    """
+    old_fingerprints = get_node_fingerprints(old, include_docstrings=False, include_names=False)
+    new_fingerprints = get_node_fingerprints(new, include_docstrings=False, include_names=False)
+    changes: list[SchemaChange] = []
+
+    def compare(old_node: DataTypeTree, new_node: DataTypeTree, path: tuple[Hashable, ...]) -> None:
+        if old_fingerprints[id(old_node)] == new_fingerprints[id(new_node)]:
+            return
+        if type(old_node) is not type(new_node) or old_node.holding_type is not new_node.holding_type:
+            both_are_containers = old_node.children is not None and new_node.children is not None
+            kind: SCHEMA_CHANGE_KINDS = "changed_container" if both_are_containers else "changed_type"
+            changes.append(SchemaChange(kind, path, old=_describe(old_node), new=_describe(new_node)))
+            if isinstance(old_node.children, Mapping) and isinstance(new_node.children, Mapping):
+                compare_mappings(old_node, new_node, path)
+            return
+
+        if isinstance(old_node.children, Mapping) and isinstance(new_node.children, Mapping):
+            compare_mappings(old_node, new_node, path)
+        elif old_node.children is not None and new_node.children is not None and not old_node._has_ordered_children:
+            compare_unions(old_node.children, new_node.children, path)  # type: ignore[arg-type]
+        elif old_node.children is not None and new_node.children is not None and len(old_node) == len(new_node):
+            for idx, (old_child, new_child) in enumerate(zip(old_node, new_node)):
+                compare(old_child, new_child, (*path, idx))
+        else:
+            changes.append(SchemaChange("changed_type", path, old=_describe(old_node), new=_describe(new_node)))
+
+    def compare_mappings(old_node: DataTypeTree, new_node: DataTypeTree, path: tuple[Hashable, ...]) -> None:
+        old_children: Mapping[Hashable, DataTypeTree] = old_node.children  # type: ignore[assignment]
+        new_children: Mapping[Hashable, DataTypeTree] = new_node.children  # type: ignore[assignment]
+        old_not_required = set(old_node._get_state().get("not_required", ()))
+        new_not_required = set(new_node._get_state().get("not_required", ()))
+        for key, old_child in old_children.items():
+            if key not in new_children:
+                changes.append(SchemaChange("removed_key", (*path, key), old=_describe(old_child)))
+                continue
+            if key not in old_not_required and key in new_not_required:
+                changes.append(SchemaChange("required_to_optional", (*path, key)))
+            elif key in old_not_required and key not in new_not_required:
+                changes.append(SchemaChange("optional_to_required", (*path, key)))
+            compare(old_child, new_children[key], (*path, key))
+        for key, new_child in new_children.items():
+            if key not in old_children:
+                changes.append(SchemaChange("added_key", (*path, key), new=_describe(new_child)))
+
+    def compare_unions(
+        old_members: "tuple[DataTypeTree, ...]", new_members: "tuple[DataTypeTree, ...]", path: tuple[Hashable, ...]
+    ) -> None:
+        old_fingerprints_ = {old_fingerprints[id(member)] for member in old_members}
+        new_fingerprints_ = {new_fingerprints[id(member)] for member in new_members}
+        removed = [member for member in old_members if old_fingerprints[id(member)] not in new_fingerprints_]
+        added = [member for member in new_members if new_fingerprints[id(member)] not in old_fingerprints_]
+        # Members of the same kind that changed are compared between them, as long as they can be paired
+        for removed_member in list(removed):
+            candidates = [
+                member
+                for member in added
+                if type(member) is type(removed_member) and member.holding_type is removed_member.holding_type
+            ]
+            n_removed_of_same_kind = sum(
+                type(member) is type(removed_member) and member.holding_type is removed_member.holding_type
+                for member in removed
+            )
+            if len(candidates) == 1 and n_removed_of_same_kind == 1 and removed_member.children is not None:
+                removed.remove(removed_member)
+                added.remove(candidates[0])
+                compare(removed_member, candidates[0], (*path, ...))
+        for member in added:
+            changes.append(SchemaChange("widened_union", (*path, ...), new=_describe(member)))
+        for member in removed:
+            changes.append(SchemaChange("narrowed_union", (*path, ...), old=_describe(member)))
+
+    compare(old, new, ())
+    return changes
+
+
+def _describe(node: DataTypeTree) -> str:
+    """Short description of the type held by the node that does not require rendering it."""
+    name = node.holding_type.__name__
+    if node.children is not None and not isinstance(node.children, Mapping) and node._has_ordered_children:
+        return f"{name} of {len(node)} elements"
+    state = {key: value for key, value in node._get_state().items() if key not in node._docstring_state_keys}
+    if node.children is not None or not state:
+        return name
+    return f"{name}({', '.join(f'{key}={value!r}' for key, value in state.items())})"
@@ -0,0 +1,79 @@
+"""Stable fingerprint that identifies the type hints a `DataTypeTree` renders to, without rendering them.
+
+Two trees share the same fingerprint whenever they were built with the same strategies and render to the same type
+hints, regardless of the order in which the members of their unions are rendered. Unlike `hash`, fingerprints are
+stable across different processes and Python sessions, so they can be stored and compared later on.
+"""
+
+import hashlib
+import json
+from typing import Any
+from collections.abc import Mapping
+
+from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
+from lazy_type_hint.data_type_tree.serialization import _encode, _get_type_reference
+from lazy_type_hint.strategies import ParsingStrategies
+
+
+def get_fingerprint(tree: DataTypeTree, *, include_docstrings: bool = True) -> str:
+    """Get a hexadecimal fingerprint of the tree.
+
+    Args:
+        tree (DataTypeTree): Tree to get the fingerprint from.
+        include_docstrings (bool, optional): If False, two trees that only differ in their docstrings will share the
+            same fingerprint. Defaults to True.
+
+    Returns:
+        str: Fingerprint of the tree.
+    """
+    fingerprints = get_node_fingerprints(tree, include_docstrings=include_docstrings)
+    strategies = {key: getattr(tree.strategies, key) for key in ParsingStrategies.__dataclass_fields__}
+    return _hash([fingerprints[id(tree)], strategies])
+
+
+def get_node_fingerprints(
+    tree: DataTypeTree, *, include_docstrings: bool = True, include_names: bool = True
+) -> dict[int, str]:
+    """Get the fingerprint of every node within the tree, indexed by the `id` of the node.
+
+    Each node is hashed together with the fingerprints of its children, so nodes shared among multiple parents are
+    only hashed once. Unlike `get_fingerprint`, the strategies used to build the tree are not taken into account.
+
+    Args:
+        tree (DataTypeTree): Tree to get the fingerprints from.
+        include_docstrings (bool, optional): Whether docstrings are taken into account. Defaults to True.
+        include_names (bool, optional): Whether the names of the nodes are taken into account. If False, nodes with
+            the same structure share the same fingerprint even if they belong to trees with different names.
+            Defaults to True.
+
+    Returns:
+        dict[int, str]: Fingerprint of each node.
+    """
+    fingerprints: dict[int, str] = {}
+
+    def get_node_fingerprint(node: DataTypeTree) -> str:
+        if id(node) in fingerprints:
+            return fingerprints[id(node)]
+        children: Any = None
+        if isinstance(node.children, Mapping):
+            children = [[_encode(key), get_node_fingerprint(child)] for key, child in node.children.items()]
+        elif node.children is not None:
+            children = [get_node_fingerprint(child) for child in node.children]
+            if not node._has_ordered_children:
+                children.sort()
+        state = {
+            key: _encode(value)
+            for key, value in node._get_state().items()
+            if include_docstrings or key not in node._docstring_state_keys
+        }
+        name = node.name if include_names else None
+        record = [type(node).__name__, name, _get_type_reference(node.holding_type), node.height, children, state]
+        fingerprints[id(node)] = _hash(record)
+        return fingerprints[id(node)]
+
+    get_node_fingerprint(tree)
+    return fingerprints
+
+
+def _hash(value: object) -> str:
+    return hashlib.sha256(json.dumps(value, separators=(",", ":")).encode("utf-8")).hexdigest()
@@ -1,18 +1,12 @@
-from contextlib import suppress
+import importlib
+from typing import Any
 
+from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
 from lazy_type_hint.data_type_tree.generic_type.dict_data_type_tree import DictDataTypeTree as DictDataTypeTree
 from lazy_type_hint.data_type_tree.generic_type.list_data_type_tree import ListDataTypeTree as ListDataTypeTree
 from lazy_type_hint.data_type_tree.generic_type.mapping_data_type_tree import (
     MappingDataTypeTree as MappingDataTypeTree,
 )
-
-with suppress(ImportError):
-    from lazy_type_hint.data_type_tree.generic_type.pandas_data_frame_data_type_tree import (
-        PandasDataFrameDataTypeTree as PandasDataFrameDataTypeTree,
-    )
-    from lazy_type_hint.data_type_tree.generic_type.pandas_series_data_type_tree import (
-        PandasSeriesDataTypeTree as PandasSeriesDataTypeTree,
-    )
 from lazy_type_hint.data_type_tree.generic_type.iterator_data_type_tree import (
     IteratorDataTypeTree as IteratorDataTypeTree,
 )
@@ -23,3 +17,24 @@ from lazy_type_hint.data_type_tree.generic_type.set_data_type_tree import SetDat
 from lazy_type_hint.data_type_tree.generic_type.tuple_data_type_tree import (
     TupleDataTypeTree as TupleDataTypeTree,
 )
+from lazy_type_hint.data_type_tree.generic_type.union_data_type_tree import (
+    UnionDataTypeTree as UnionDataTypeTree,
+)
+
+# Importing pandas is slow, so these trees are only imported once a pandas object is found
+_LAZY_MODULES = {
+    "PandasDataFrameDataTypeTree": "lazy_type_hint.data_type_tree.generic_type.pandas_data_frame_data_type_tree",
+    "PandasSeriesDataTypeTree": "lazy_type_hint.data_type_tree.generic_type.pandas_series_data_type_tree",
+}
+DataTypeTree.register_lazy_subclass(
+    "pandas.DataFrame", _LAZY_MODULES["PandasDataFrameDataTypeTree"], "PandasDataFrameDataTypeTree"
+)
+DataTypeTree.register_lazy_subclass(
+    "pandas.Series", _LAZY_MODULES["PandasSeriesDataTypeTree"], "PandasSeriesDataTypeTree"
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_MODULES:
+        return getattr(importlib.import_module(_LAZY_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
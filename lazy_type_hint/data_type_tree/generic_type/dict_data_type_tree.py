@@ -199,6 +199,7 @@ class DictMetadata:
 
 class DictDataTypeTree(MappingDataTypeTree):
     wraps = (dict,)
+    _docstring_state_keys = ("docstrings", "class_docstring")
     data: dict[Hashable, object]
     dict_metadata: DictMetadata
 
@@ -335,6 +336,31 @@ class DictDataTypeTree(MappingDataTypeTree):
             lines = self._insert_class_docstring(lines, key_used_as_doc=key_used_as_class_docstring)
         return "\n".join(lines)
 
+    @override
+    def _get_state(self) -> dict[str, Any]:
+        key_info = self.dict_metadata.key_info
+        state: dict[str, Any] = {
+            "not_required": [key for key in self.children if key in key_info and not key_info[key].required],
+            "docstrings": dict(self.dict_metadata.get_key_docstrings()),
+        }
+        key_used_as_doc = self.strategies.key_used_as_doc
+        if key_used_as_doc and isinstance(self.data.get(key_used_as_doc), str):
+            state["class_docstring"] = (key_used_as_doc, self.data[key_used_as_doc])
+        return state
+
+    @override
+    def _set_state(self, state: Mapping[str, Any]) -> None:
+        data: dict[Hashable, object] = dict.fromkeys(self.children)
+        for key, docstring in state["docstrings"].items():
+            data[f"{self.hidden_keys_prefix}{key}"] = docstring
+        if "class_docstring" in state:
+            key_used_as_doc, class_docstring = state["class_docstring"]
+            data[key_used_as_doc] = class_docstring
+        self.data = data
+        self.__pre_child_instantiation__()
+        for key in state["not_required"]:
+            self.dict_metadata.key_info[key].required = False
+
     def update_data_and_metadata(self, other: "DictDataTypeTree") -> None:
         """Given another child, this will update the current node with all the data and metadata."""
         self.data = dict(self.dict_metadata.update(other.dict_metadata))
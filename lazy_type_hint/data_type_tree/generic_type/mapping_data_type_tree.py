@@ -1,7 +1,7 @@
 import re
 from collections import defaultdict
 from collections.abc import Hashable, Iterator, Mapping
-from typing import Final, Literal, Optional
+from typing import Any, Final, Literal, Optional
 
 from typing_extensions import Self, override
 
@@ -131,6 +131,11 @@ class MappingDataTypeTree(GenericDataTypeTree):
             hashes.append(("mapping", hash(type(name)), child._get_hash()))
         return frozenset(hashes)
 
+    @override
+    def _set_state(self, state: Mapping[str, Any]) -> None:
+        self.data = dict.fromkeys(self.children)
+        self.__pre_child_instantiation__()
+
     @override
     def __iter__(self) -> "Self":
         self._iterator = iter(self.children.keys())
@@ -1,6 +1,7 @@
 from itertools import islice
 from types import MappingProxyType
 from typing import Any
+from collections.abc import Mapping
 
 from typing_extensions import override
 
@@ -15,3 +16,8 @@ class MappingProxyDataTypeTree(MappingDataTypeTree):
     def __pre_child_instantiation__(self) -> None:
         if check_n_max := self.strategies.check_max_n_elements_within_container:
             self.data = MappingProxyType(dict(islice(self.data.items(), check_n_max)))
+
+    @override
+    def _set_state(self, state: Mapping[str, Any]) -> None:
+        self.data = MappingProxyType(dict.fromkeys(self.children))
+        self.__pre_child_instantiation__()
@@ -1,10 +1,17 @@
-from collections.abc import Hashable, Mapping
+import hashlib
+from collections import defaultdict
+from collections.abc import Hashable, Iterable, Iterator, Mapping, Sequence
+from functools import cache
 from typing import (
+    Any,
     Final,
+    Optional,
     Union,
     cast,
 )
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from typing_extensions import override
 
@@ -12,6 +19,10 @@ from lazy_type_hint.data_type_tree import data_type_tree_factory
 from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
 from lazy_type_hint.data_type_tree.generic_type.dict_data_type_tree import DictDataTypeTree
 from lazy_type_hint.data_type_tree.generic_type.mapping_data_type_tree import MappingDataTypeTree
+from lazy_type_hint.data_type_tree.generic_type.pandas_series_data_type_tree import (
+    get_missing_value,
+    is_dtype_describing_elements,
+)
 from lazy_type_hint.utils.utils import cache_returned_value_per_instance
 
 LITERAL_OVERLOAD_TEMPLATE: Final = """    @overload  # type: ignore
@@ -22,6 +33,15 @@ OVERLOAD_TEMPLATE: Final = """    @overload  # type: ignore
     def __getitem__(self, key: {input_type}) -> {rtype}:
         ...
 """
+UNAMBIGUOUS_INFERRED_TYPES: Final = frozenset({"string", "bytes", "integer", "floating", "boolean", "empty"})
+"""Types inferred by pandas for object arrays whose elements are all hashed differently by `pd.util.hash_array`.
+
+Otherwise, elements are hashed by their string representation, so `1` and `"1"` would share the same hash.
+"""
+MISSING_LABEL_HASH: Final = np.uint64(2**64 - 2)
+"""Hash used for missing labels of a `MultiIndex`."""
+MAX_LITERALS_PER_OVERLOAD: Final = 1_000
+"""Maximum number of columns gathered within the same overload when these are grouped by type."""
 TEMPLATE: Final = """class {class_name}(pd.DataFrame):
 
     attrs: {class_name}Attrs
@@ -91,7 +111,10 @@ class PandasDataFrameDataTypeTree(MappingDataTypeTree):
 
         Otherwise delegate to super class
         """
-        if all(isinstance(column, tuple) for column in self.data.columns):
+        if isinstance(self.data.columns, pd.MultiIndex):
+            if all(isinstance(label, (str, bool, int)) for label, _ in self._get_first_level_groups()):
+                return True
+        elif all(isinstance(column, tuple) for column in self.data.columns):
             if all(isinstance(column[0], (str, bool, int)) for column in self.data.columns):
                 return True
         else:
@@ -102,12 +125,21 @@ class PandasDataFrameDataTypeTree(MappingDataTypeTree):
     @property
     @cache_returned_value_per_instance
     def can_be_accessed_multilevel(self) -> bool:
-        return self.all_columns_are(tuple)
+        return isinstance(self.data.columns, pd.MultiIndex) or self.all_columns_are(tuple)
 
     @property
     def are_column_same_type(self) -> bool:
         return len({type(column) for column in self.data.columns}) == 1
 
+    @property
+    @cache_returned_value_per_instance
+    def duplicated_columns(self) -> list[Hashable]:
+        """Labels shared by several columns, which return a DataFrame with all of them instead of a Series."""
+        if self.can_be_accessed_multilevel or not self.are_all_columns_literal_compatible:
+            return []
+        columns = self.data.columns
+        return cast(list[Hashable], columns[columns.duplicated()].unique().tolist())
+
     def all_columns_are(self, type_: type[object]) -> bool:
         return all(isinstance(column, type_) for column in self.data.columns)
 
@@ -121,6 +153,10 @@ class PandasDataFrameDataTypeTree(MappingDataTypeTree):
 
     @property
     def are_all_columns_literal_compatible(self) -> bool:
+        if isinstance(self.data.columns, pd.MultiIndex):
+            return all(
+                isinstance(label, self.literal_compatible_types) for label, _ in self._get_first_level_groups()
+            )
         column: Hashable
         for column in self.data.columns:
             if isinstance(column, tuple):
@@ -129,11 +165,11 @@ class PandasDataFrameDataTypeTree(MappingDataTypeTree):
                 return False
         return True
 
-    def _create_child(self, column: Hashable) -> DataTypeTree:
+    def _create_child(self, column: Hashable, data: Union[pd.DataFrame, "pd.Series[Any]"]) -> DataTypeTree:
         suffix = self._to_camel_case(str(column))
         suffix = suffix if suffix else "WSpace"
         return data_type_tree_factory(  # type: ignore
-            data=self.data[column],
+            data=data,
             name=f"{self.name}{suffix}",
             imports=self.imports,
             depth=self.depth + 1,
@@ -148,30 +184,169 @@ class PandasDataFrameDataTypeTree(MappingDataTypeTree):
             return {}
 
         # Corner case to avoid infinite recursion
-        if all(isinstance(column, tuple) and len(column) == 1 for column in self.data.columns):
+        if isinstance(data.columns, pd.MultiIndex):
+            if data.columns.nlevels == 1:
+                return {}
+        elif all(isinstance(column, tuple) and len(column) == 1 for column in self.data.columns):
             return {}
 
         columns_processed: set[Union[bool, str, int]] = set()
-        for column in data.columns:
-            if not self.can_be_accessed_multilevel:  # Here all columns will  be Hashable
-                column = cast(Hashable, column)
-                children[column] = self._create_child(column)
-            else:  # Here all columns will be tuple
+        if not self.can_be_accessed_multilevel:  # Here all columns will  be Hashable
+            duplicated_columns = set(self.duplicated_columns)
+            for column, column_data in zip(data.columns, self._iter_columns_data(data)):
+                if column not in duplicated_columns:
+                    children[column] = self._create_child(column, column_data)
+        elif isinstance(data.columns, pd.MultiIndex):
+            for label, positions in self._get_first_level_groups():
+                if isinstance(label, self.literal_compatible_types):
+                    children[label] = self._create_child(label, self._get_first_level_data(data, label, positions))
+        else:  # Here all columns will be tuple
+            for column in data.columns:
                 multi_column = cast(tuple[Hashable, ...], column)
                 if multi_column[0] not in columns_processed:
                     if isinstance(multi_column[0], self.literal_compatible_types):
                         columns_processed.add(multi_column[0])
-                        children[column[0]] = self._create_child(column[0])
+                        children[column[0]] = self._create_child(column[0], self.data[column[0]])
 
             
         children["Attrs"] = data_type_tree_factory(self.data.attrs, name=self.attrs_class_name, imports=self.imports, depth=self.depth + 1, strategies=self.strategies, parent=self)
         return children
 
+    @cache_returned_value_per_instance
+    def _get_first_level_groups(self) -> list[tuple[Hashable, "npt.NDArray[np.intp]"]]:
+        """Get the labels of the first level of the columns, in order of appearance, and the positions of their columns.
+
+        They are obtained from the levels and codes of the `MultiIndex`, without building the tuples of all columns.
+        Missing labels are represented by `NaN`.
+        """
+        columns = cast(pd.MultiIndex, self.data.columns)
+        codes = np.asarray(columns.codes[0])
+        if not len(codes):
+            return []
+        order = np.argsort(codes, kind="stable")
+        groups = np.split(order, np.flatnonzero(np.diff(codes[order])) + 1)
+        groups.sort(key=lambda positions: positions[0])
+        labels = [*columns.levels[0].tolist(), np.nan]  # Code -1 is used for missing labels
+        return [(labels[codes[positions[0]]], positions) for positions in groups]
+
+    @staticmethod
+    def _get_first_level_data(
+        data: pd.DataFrame, label: Hashable, positions: "npt.NDArray[np.intp]"
+    ) -> Union[pd.DataFrame, "pd.Series[Any]"]:
+        """Get the same data as `data[label]` does, given the positions of the columns whose first level is `label`.
+
+        Contiguous columns are taken as a view and the remaining levels of the columns are built from their codes.
+        """
+        columns = cast(pd.MultiIndex, data.columns)
+        if positions[-1] - positions[0] + 1 == len(positions):
+            result = data.iloc[:, positions[0] : positions[-1] + 1]
+        else:
+            result = data.iloc[:, positions]
+        if columns.nlevels > 2:
+            result_columns: pd.Index = pd.MultiIndex(
+                levels=columns.levels[1:],
+                codes=[np.asarray(codes)[positions] for codes in columns.codes[1:]],
+                names=columns.names[1:],
+                verify_integrity=False,
+            )
+        else:
+            result_columns = columns[positions].get_level_values(1)
+        result = result.set_axis(result_columns, axis=1)
+
+        # Same as pandas, an empty string is taken as a placeholder for a single column
+        if len(result_columns) == 1:
+            top = result_columns[0]
+            if (top[0] if isinstance(top, tuple) else top) == "":
+                result = result.iloc[:, 0].rename(label) if columns.nlevels == 2 else result[""]
+        return result
+
+    def _iter_columns_data(self, data: pd.DataFrame) -> Iterator["pd.Series[Any]"]:
+        """Get, for each column, a series from which the type hint of the column can be inferred.
+
+        Dtypes are read at once and columns are not sliced out of the DataFrame unless their dtype is not enough to
+        know the type of their elements (such as object columns). In that case, only the rows to check (see
+        `check_max_n_elements_within_container`) are taken. Otherwise, all columns sharing the same dtype (and whether
+        they hold missing values) share the same series.
+        """
+        dtypes = data.dtypes.tolist()
+        positions_with_missing_values = self._get_positions_with_missing_values(data, dtypes)
+        n_elements = self.strategies.check_max_n_elements_within_container
+        sample = data if n_elements is None else data.iloc[:n_elements]
+        for position, dtype in enumerate(dtypes):
+            if is_dtype_describing_elements(dtype):
+                yield _create_representative_series(dtype, has_missing_values=position in positions_with_missing_values)
+            else:
+                yield sample.iloc[:, position]
+
+    @staticmethod
+    def _get_positions_with_missing_values(data: pd.DataFrame, dtypes: Sequence[Any]) -> set[int]:
+        """Get the positions of the columns holding missing values, only among those where this changes their type."""
+        positions_per_dtype: dict[Any, list[int]] = defaultdict(list)
+        for position, dtype in enumerate(dtypes):
+            if is_dtype_describing_elements(dtype) and get_missing_value(dtype) is not None:
+                positions_per_dtype[dtype].append(position)
+        positions_with_missing_values: set[int] = set()
+        for positions in positions_per_dtype.values():
+            has_missing_values = data.iloc[:, positions].isna().any().to_numpy()
+            positions_with_missing_values.update(np.asarray(positions)[has_missing_values].tolist())
+        return positions_with_missing_values
+
+    @override
+    def _get_state(self) -> dict[str, Any]:
+        return {"columns": list(self.data.columns), "dtypes": [str(dtype) for dtype in self.data.dtypes]}
+
+    @override
+    def _set_state(self, state: Mapping[str, Any]) -> None:
+        self.data = self._create_empty_data_frame(state["columns"], state["dtypes"])
+
+    @staticmethod
+    def _create_empty_data_frame(columns: Sequence[Hashable], dtypes: Sequence[str]) -> pd.DataFrame:
+        """Create a DataFrame with no rows given its columns and their dtypes.
+
+        Columns sharing the same dtype are created at once so that its cost does not grow with the number of columns.
+        """
+        if not columns:
+            return pd.DataFrame()
+        positions_per_dtype: dict[str, list[int]] = defaultdict(list)
+        for position, dtype in enumerate(dtypes):
+            positions_per_dtype[dtype].append(position)
+        blocks: list[pd.DataFrame] = []
+        for dtype, positions in positions_per_dtype.items():
+            block = pd.DataFrame(np.empty((0, len(positions)), dtype=object), columns=positions)
+            try:
+                blocks.append(block.astype(dtype))
+            except (TypeError, ValueError):
+                blocks.append(block)
+        data_frame = pd.concat(blocks, axis=1).reindex(columns=range(len(columns)))
+        data_frame.columns = pd.Index(columns)
+        return data_frame
+
     @override
     def _get_hash(self) -> str:
+        """Get a hash computed from the labels of the columns and their dtypes.
+
+        Contrary to the representation of the columns, it is never truncated. It is computed in a vectorized way, so
+        that it remains fast for DataFrames with many columns.
+        """
         if self.strategies.pandas_strategies == "Do not type hint columns":
             return "pd.DataFrame"
-        return str(self.data.columns)
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(_get_label_hashes(self.data.columns).tobytes())
+        dtype_codes, unique_dtypes = pd.factorize(self.data.dtypes.to_numpy())
+        hasher.update(dtype_codes.astype(np.int64).tobytes())
+        for dtype in unique_dtypes:
+            hasher.update(f"\0{dtype}".encode())
+            if isinstance(dtype, pd.CategoricalDtype):
+                hasher.update(f"\0{dtype.ordered}".encode())
+                hasher.update(_get_label_hashes(dtype.categories).tobytes())
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _get_column_rtype(child: DataTypeTree) -> str:
+        """Get the type returned when accessing the column represented by the child."""
+        if child.permission_to_be_created_as_type_alias:
+            return child.name
+        return child.get_str_top_node_without_lvalue()
 
     @override
     def _get_str_top_node(self) -> str:
@@ -188,31 +363,126 @@ class PandasDataFrameDataTypeTree(MappingDataTypeTree):
         self.imports.add("pd.Scalar")
 
         overloads: list[str] = []
-        for literal, child in self.children.items():
-            if literal == "Attrs":
-                continue
-            if isinstance(literal, self.literal_compatible_types):
-                if child.permission_to_be_created_as_type_alias:
-                    overloads.append(LITERAL_OVERLOAD_TEMPLATE.format(literal=repr(literal), rtype=child.name))
-                else:
-                    rtype = child.get_str_top_node_without_lvalue()
-                    overloads.append(LITERAL_OVERLOAD_TEMPLATE.format(literal=repr(literal), rtype=rtype))
+        literals_per_rtype: dict[str, list[str]] = defaultdict(list)
+        rtypes: dict[Hashable, str] = {
+            literal: self._get_column_rtype(child)
+            for literal, child in self.children.items()
+            if literal != "Attrs" and isinstance(literal, self.literal_compatible_types)
+        }
+        rtypes.update(dict.fromkeys(self.duplicated_columns, "pd.DataFrame"))
+        for literal, rtype in rtypes.items():
+            if self.strategies.pandas_columns_overloads == "per column":
+                overloads.append(LITERAL_OVERLOAD_TEMPLATE.format(literal=repr(literal), rtype=rtype))
+            else:
+                literals_per_rtype[rtype].append(repr(literal))
+        for rtype, literals in literals_per_rtype.items():
+            for idx in range(0, len(literals), MAX_LITERALS_PER_OVERLOAD):
+                literal = ", ".join(literals[idx : idx + MAX_LITERALS_PER_OVERLOAD])
+                overloads.append(LITERAL_OVERLOAD_TEMPLATE.format(literal=literal, rtype=rtype))
         if self.strategies.pandas_strategies == "Full type hint":
-            literal_compatible_keys: list[str] = []
+            literal_compatible_keys: list[Hashable] = []
             extra_types = ""
-            for key in self.children:
+            for key in [*self.children, *self.duplicated_columns]:
                 if key == "Attrs":
                     continue
                 if isinstance(key, self.literal_compatible_types):
-                    literal_compatible_keys.append(repr(key))
+                    literal_compatible_keys.append(key)
                 else:
                     self.imports.add("Hashable")
                     extra_types = ", Hashable"  # This can be more precise, but not supported yet
-            all_literals = ", ".join(literal_compatible_keys)
-            allowed_types = f"Literal[{all_literals}]" + extra_types
+            if self.strategies.pandas_columns_overloads == "per column":
+                all_literals = ", ".join(repr(key) for key in literal_compatible_keys)
+                allowed_types = f"Literal[{all_literals}]" + extra_types
+            else:
+                # Labels are already listed by the overloads, so only their types are repeated by the implementation
+                key_types = {type(key) for key in literal_compatible_keys}
+                allowed_types = ", ".join(
+                    type_.__name__ for type_ in self.literal_compatible_types if type_ in key_types
+                )
+                allowed_types += extra_types
             template = TEMPLATE_NO_PD
         else:
             allowed_types = "str"
             template = TEMPLATE
         
         return template.format(class_name=self.name, overloads="\n".join(overloads), allowed_types=allowed_types)
+
+
+@cache
+def _create_representative_series(dtype: Any, *, has_missing_values: bool) -> "pd.Series[Any]":
+    """Create a series with the given dtype, holding a missing value if required. Never modified, so it is shared."""
+    if has_missing_values:
+        return pd.Series([get_missing_value(dtype)], dtype=dtype)
+    return pd.Series(dtype=dtype)
+
+
+def _get_label_hashes(labels: "pd.Index[Any]") -> "npt.NDArray[np.uint64]":
+    """Get, for each label, one or more hashes (one per row) that identify both its value and its type."""
+    if isinstance(labels, pd.MultiIndex):
+        rows: list[npt.NDArray[np.uint64]] = []
+        for level, codes in zip(labels.levels, labels.codes):
+            level_hashes = _get_label_hashes(level)
+            # The last column is taken for the code -1, used for missing labels
+            missing_label_hashes = np.full((len(level_hashes), 1), MISSING_LABEL_HASH, dtype=np.uint64)
+            level_hashes = np.concatenate([level_hashes, missing_label_hashes], axis=1)
+            rows.extend(level_hashes[:, np.asarray(codes)])
+        return np.stack(rows) if rows else np.empty((0, len(labels)), dtype=np.uint64)
+
+    values = labels.to_numpy()
+    dtype_hash = pd.util.hash_array(np.array([str(labels.dtype)], dtype=object))
+    rows = [pd.util.hash_array(values), np.broadcast_to(dtype_hash, len(values))]
+    if values.dtype == object and pd.api.types.infer_dtype(values, skipna=False) not in UNAMBIGUOUS_INFERRED_TYPES:
+        types = np.array([type(value).__qualname__ for value in values], dtype=object)
+        rows.append(pd.util.hash_array(types))
+    return np.stack(rows)
+
+
+def fold_data_frames(data_frames: Iterable[pd.DataFrame], *, n_rows: Optional[int]) -> pd.DataFrame:
+    """Fold data frames with the same columns (such as the chunks of a CSV file) into a small one with their types.
+
+    The dtype of each column is widened across data frames as `pd.read_csv` does when reading them as a whole (e.g.
+    integers and floats into floats). Only the first `n_rows` rows of those data frames in which any column has a new
+    dtype are kept, plus a row per column with missing values, so that the memory used does not depend on the number
+    of data frames.
+
+    Args:
+        data_frames (Iterable[pd.DataFrame]): Data frames to fold.
+        n_rows (Optional[int]): Maximum number of rows kept per data frame. If None, all of them are kept.
+    """
+    dtypes: dict[Hashable, Any] = {}
+    seen_dtypes: defaultdict[Hashable, set[Any]] = defaultdict(set)
+    columns_with_missing_values: set[Hashable] = set()
+    samples: list[pd.DataFrame] = []
+    for data_frame in data_frames:
+        columns = data_frame.columns.tolist()
+        chunk_dtypes = data_frame.dtypes.tolist()
+        if any(dtype not in seen_dtypes[column] for column, dtype in zip(columns, chunk_dtypes)):
+            sample = data_frame if n_rows is None else data_frame.iloc[:n_rows]
+            samples.append(sample)
+            columns_with_missing_values.update(sample.columns[sample.isna().any().to_numpy()])
+        for column, dtype in zip(columns, chunk_dtypes):
+            seen_dtypes[column].add(dtype)
+            dtypes[column] = _widen_dtype(dtypes[column], dtype) if column in dtypes else dtype
+        for position in np.flatnonzero(data_frame.isna().any().to_numpy()):
+            if columns[position] not in columns_with_missing_values:
+                samples.append(data_frame[data_frame.iloc[:, position].isna().to_numpy()].iloc[:1])
+                columns_with_missing_values.add(columns[position])
+
+    if not samples:
+        return pd.DataFrame()
+    return pd.concat(
+        [sample.astype({column: dtypes[column] for column in sample.columns}) for sample in samples],
+        ignore_index=True,
+    )
+
+
+def _widen_dtype(first: Any, second: Any) -> Any:
+    """Get the dtype of a column read as a whole by `pd.read_csv`, given the dtypes of two of its parts."""
+    if first == second:
+        return first
+    if first.kind in "iuf" and second.kind in "iuf":
+        return np.result_type(first, second)
+    for dtype, other in ((first, second), (second, first)):
+        if isinstance(dtype, pd.StringDtype) and other.kind in "iufb":
+            return dtype
+    return np.dtype(object)
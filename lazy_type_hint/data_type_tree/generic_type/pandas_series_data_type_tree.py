@@ -1,5 +1,6 @@
-from typing import Any
-from collections.abc import Hashable, Sequence
+from functools import cache
+from typing import Any, Final, Optional, Union
+from collections.abc import Hashable, Mapping, Sequence
 
 import pandas as pd
 from typing_extensions import Self, override
@@ -8,11 +9,36 @@ from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
 from lazy_type_hint.data_type_tree.generic_type.generic_data_type_tree import GenericDataTypeTree
 from lazy_type_hint.data_type_tree.generic_type.set_and_sequence_operations import SetAndSequenceOperations
 
+REPRESENTATIVE_PER_DTYPE_KIND: Final[Mapping[str, object]] = {
+    "b": False,
+    "i": 0,
+    "u": 0,
+    "f": 0.0,
+    "c": 0j,
+    "M": pd.Timestamp(0),
+    "m": pd.Timedelta(0),
+    "S": b"",
+    "U": "",
+}
+"""Value whose type hint is the one of the elements of a series, given the kind of its dtype."""
+REPRESENTATIVE_PER_INFERRED_TYPE: Final[Mapping[str, object]] = {
+    "string": "",
+    "bytes": b"",
+    "integer": 0,
+    "floating": 0.0,
+    "complex": 0j,
+    "boolean": False,
+}
+"""Value whose type hint is the one of the elements of an object series, given its type as inferred by pandas."""
+
 
 class PandasSeriesDataTypeTree(GenericDataTypeTree):
     wraps = (pd.Series,)
+    data: "pd.Series[Any]"
     children: Sequence[DataTypeTree]
     operations: SetAndSequenceOperations
+    categories: Optional[tuple[Union[str, int, bool], ...]]
+    """Categories of categorical series, only if they are type hinted with a `Literal`."""
 
     _iterator: int
 
@@ -21,20 +47,93 @@ class PandasSeriesDataTypeTree(GenericDataTypeTree):
         self.operations = SetAndSequenceOperations(self)
 
     @override
-    def _instantiate_children(self, data: Sequence[Any]) -> tuple[DataTypeTree, ...]:  # type: ignore
-        return self.operations.instantiate_children(data, allow_repeated_children=False)
+    def _instantiate_children(self, data: "pd.Series[Any]") -> tuple[DataTypeTree, ...]:
+        """Instantiate the children from the dtype of the series, without iterating over its elements if possible.
+
+        Only object series (and those whose dtype does not state the type of their elements) are scanned, and just up
+        to `check_max_n_elements_within_container` elements. Categorical series whose categories can be represented
+        with a `Literal` (see `max_n_categories_as_literal`) only have a child for their missing values (if any).
+        """
+        self.categories = self._get_literal_categories(data.dtype)
+        return self.operations.instantiate_children(
+            self._get_representatives(data), allow_repeated_children=False
+        )
+
+    def _get_representatives(self, data: "pd.Series[Any]") -> Sequence[Any]:
+        """Get a few values whose types are the same as the ones of all elements of the series."""
+        dtype = data.dtype
+        if isinstance(dtype, pd.CategoricalDtype) and self.categories is not None:
+            representatives = []
+        elif isinstance(dtype, pd.CategoricalDtype):
+            representatives = list(self._get_representatives(pd.Series(dtype.categories)))
+        elif isinstance(dtype, pd.StringDtype):
+            representatives = [""]
+        elif is_dtype_describing_elements(dtype):
+            representatives = [REPRESENTATIVE_PER_DTYPE_KIND[dtype.kind]]
+        else:
+            n_elements = self.strategies.check_max_n_elements_within_container
+            sample: Sequence[Any] = data if n_elements is None else data.iloc[:n_elements]
+            if dtype != object:
+                return sample
+            inferred_type = pd.api.types.infer_dtype(sample, skipna=False)
+            if inferred_type == "empty":
+                return []
+            if inferred_type not in REPRESENTATIVE_PER_INFERRED_TYPE:
+                return sample
+            return [REPRESENTATIVE_PER_INFERRED_TYPE[inferred_type]]
+
+        na_value = get_missing_value(dtype)
+        if na_value is not None and data.hasnans:
+            representatives.append(na_value)
+        return representatives
+
+    def _get_literal_categories(self, dtype: Any) -> Optional[tuple[Union[str, int, bool], ...]]:
+        """Get the categories of the dtype if they can be type hinted with a `Literal`."""
+        if not isinstance(dtype, pd.CategoricalDtype):
+            return None
+        if not 0 < len(dtype.categories) <= self.strategies.max_n_categories_as_literal:
+            return None
+        categories = dtype.categories.tolist()
+        if not all(isinstance(category, (str, int, bool)) for category in categories):
+            return None
+        return tuple(categories)
+
+    @override
+    def get_type_alias_children(self) -> str:
+        if self.categories is None:
+            return super().get_type_alias_children()
+        self.imports.add("Literal")
+        literal = f"Literal[{', '.join(map(repr, self.categories))}]"
+        return self._format_types([literal, *(self._get_types() if self.children else ())])
 
     @override
     def _get_str_top_node(self) -> str:
         self.imports.add("annotations").add("TypeAlias").add("pandas")
         return f"{self.name}: TypeAlias = pd.Series[{self.get_type_alias_children()}]"
 
+    @override
+    def _get_state(self) -> dict[str, Any]:
+        if self.categories is None:
+            return {"dtype": str(self.data.dtype)}
+        return {"dtype": str(self.data.dtype), "categories": list(self.categories)}
+
+    @override
+    def _set_state(self, state: Mapping[str, Any]) -> None:
+        self.data = _create_empty_series(state["dtype"])
+        self.categories = tuple(state["categories"]) if "categories" in state else None
+        self.__pre_child_instantiation__()
+
+    @override
+    @property
+    def _has_ordered_children(self) -> bool:
+        return False
+
     @override
     def _get_hash(self) -> Hashable:
         hashes: set[object] = set()
         for child in self:
             hashes.add(child._get_hash())
-        return frozenset(hashes)
+        return frozenset(hashes), self.categories
 
     @override
     def __iter__(self) -> "Self":
@@ -49,3 +148,25 @@ class PandasSeriesDataTypeTree(GenericDataTypeTree):
             return element
         else:
             raise StopIteration
+
+
+def is_dtype_describing_elements(dtype: Any) -> bool:
+    """Whether the dtype of a series is enough to know the type of its elements, without checking them."""
+    return isinstance(dtype, (pd.CategoricalDtype, pd.StringDtype)) or dtype.kind in REPRESENTATIVE_PER_DTYPE_KIND
+
+
+def get_missing_value(dtype: Any) -> Optional[object]:
+    """Get the value used for missing elements of the given dtype, unless its type is already the one of the elements.
+
+    For instance, `None` is returned for float dtypes, as their missing values (`NaN`) are already `float`.
+    """
+    na_value = getattr(dtype, "na_value", pd.NaT if dtype.kind in "Mm" else None)
+    if dtype.kind == "f" and na_value is not pd.NA:
+        return None
+    return na_value
+
+
+@cache
+def _create_empty_series(dtype: str) -> "pd.Series[Any]":
+    """Create an empty series of the given dtype. Shared among all nodes as it is never modified."""
+    return pd.Series(dtype=dtype)
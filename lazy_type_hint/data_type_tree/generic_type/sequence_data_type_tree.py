@@ -21,6 +21,11 @@ class SequenceDataTypeTree(GenericDataTypeTree):
     def __pre_child_instantiation__(self) -> None:
         self.operations = SetAndSequenceOperations(self)
 
+    @override
+    @property
+    def _has_ordered_children(self) -> bool:
+        return False
+
     @override
     def _get_hash(self) -> Hashable:
         hashes: list[object] = []
@@ -21,11 +21,20 @@ if TYPE_CHECKING:
     from lazy_type_hint.data_type_tree.generic_type.pandas_series_data_type_tree import PandasSeriesDataTypeTree
     from lazy_type_hint.data_type_tree.generic_type.sequence_data_type_tree import SequenceDataTypeTree
     from lazy_type_hint.data_type_tree.generic_type.set_data_type_tree import SetDataTypeTree
+    from lazy_type_hint.data_type_tree.generic_type.union_data_type_tree import UnionDataTypeTree
+
+
+class InferredElements(list):  # type: ignore[type-arg]
+    """Trees of the elements of a list, inferred beforehand (e.g. while the elements were loaded).
+
+    They are used as the children of the list instead of being inferred again. They must have been created with the
+    `imports` and `depth` of the children of the list, as only their names and parents are updated.
+    """
 
 
 @dataclass(frozen=True)
 class SetAndSequenceOperations:
-    data_type_tree: "Union[SetDataTypeTree, SequenceDataTypeTree, PandasSeriesDataTypeTree]"
+    data_type_tree: "Union[SetDataTypeTree, SequenceDataTypeTree, PandasSeriesDataTypeTree, UnionDataTypeTree]"
 
     def instantiate_children(self, data: Sequence[Any], *, allow_repeated_children: bool) -> tuple["DataTypeTree", ...]:
         """Instantiate the children for sets and sequences.
@@ -43,7 +52,8 @@ class SetAndSequenceOperations:
         for idx, element in enumerate(data):
             if n_elements_to_check and idx >= n_elements_to_check:
                 break
-            name = f"{self.data_type_tree.name}{type(element).__name__.capitalize()}"
+            element_type = element.holding_type if isinstance(data, InferredElements) else type(element)
+            name = f"{self.data_type_tree.name}{element_type.__name__.capitalize()}"
             # Generate new name in case this one was already added
             if name in names_added.values():
                 modified_name = name
@@ -52,14 +62,19 @@ class SetAndSequenceOperations:
                     modified_name = f"{name}{count}"
                     count += 1
                 name = modified_name
-            child = data_type_tree_factory(
-                data=element,
-                name=name,
-                imports=self.data_type_tree.imports,
-                depth=self.data_type_tree.depth + 1,
-                parent=self.data_type_tree,
-                strategies=self.data_type_tree.strategies,
-            )
+            if isinstance(data, InferredElements):
+                child = element
+                child.rename(name)
+                child.parent = self.data_type_tree
+            else:
+                child = data_type_tree_factory(
+                    data=element,
+                    name=name,
+                    imports=self.data_type_tree.imports,
+                    depth=self.data_type_tree.depth + 1,
+                    parent=self.data_type_tree,
+                    strategies=self.data_type_tree.strategies,
+                )
             if allow_repeated_children:
                 # Tuple case
                 children = cast("list[DataTypeTree]", children)
@@ -34,6 +34,11 @@ class SetDataTypeTree(GenericDataTypeTree):
             return f"{self.name}: TypeAlias = frozenset[{self.get_type_alias_children()}]"
         return f"{self.name}: TypeAlias = set[{self.get_type_alias_children()}]"
 
+    @override
+    @property
+    def _has_ordered_children(self) -> bool:
+        return False
+
     @override
     def _get_hash(self) -> Hashable:
         hashes: set[object] = set()
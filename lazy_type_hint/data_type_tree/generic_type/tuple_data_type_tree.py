@@ -45,6 +45,11 @@ class TupleDataTypeTree(SequenceDataTypeTree):
             self.imports.add("Union")
             return f"Union[{', '.join(sorted(names_set))}], ..."
 
+    @override
+    @property
+    def _has_ordered_children(self) -> bool:
+        return self.strategies.tuple_size_strategy == "fixed"
+
     @override
     def _get_hash(self) -> Hashable:
         if self.strategies.tuple_size_strategy == "any size":
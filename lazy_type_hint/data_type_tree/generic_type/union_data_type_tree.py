@@ -0,0 +1,86 @@
+from collections.abc import Hashable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Final
+
+from typing_extensions import Self, override
+
+from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
+from lazy_type_hint.data_type_tree.generic_type.generic_data_type_tree import GenericDataTypeTree
+from lazy_type_hint.data_type_tree.generic_type.set_and_sequence_operations import SetAndSequenceOperations
+
+NONE_TYPE_HINT: Final = "Optional[object]"
+"""Type hint used for `None` values when they are not part of a `Union`. See `InstanceDataTypeTree`."""
+
+
+@dataclass(frozen=True)
+class Alternatives:
+    """Values that a single element can take, such as those found in a column of a table.
+
+    Type hinted as the `Union` of their types, so that they can be used where a single value is expected (e.g. as the
+    value of a key in a dictionary).
+    """
+
+    values: tuple[object, ...]
+
+    def __iter__(self) -> Iterator[object]:
+        return iter(self.values)
+
+
+class UnionDataTypeTree(GenericDataTypeTree):
+    """Tree that holds the alternative values of a single element. See `Alternatives`."""
+
+    wraps = (Alternatives,)
+    children: Sequence[DataTypeTree]
+    operations: SetAndSequenceOperations
+
+    _iterator: int
+
+    @override
+    def __pre_child_instantiation__(self) -> None:
+        self.operations = SetAndSequenceOperations(self)
+
+    @override
+    def _instantiate_children(self, data: Alternatives) -> tuple[DataTypeTree, ...]:  # type: ignore
+        return self.operations.instantiate_children(data.values, allow_repeated_children=False)
+
+    @override
+    def get_type_alias_children(self) -> str:
+        """Get the `Union` of the types of the children, using `Optional` if any of them is `None`."""
+        if not any(child.holding_type is type(None) for child in self.children):
+            return super().get_type_alias_children()
+        child_types = [child_type for child_type in self._get_types() if child_type != NONE_TYPE_HINT]
+        if not child_types:
+            return "None"
+        self.imports.add("Optional")
+        return f"Optional[{self._format_types(child_types)}]"
+
+    @override
+    def _get_str_top_node(self) -> str:
+        self.imports.add("TypeAlias")
+        return f"{self.name}: TypeAlias = {self.get_type_alias_children()}"
+
+    @override
+    @property
+    def _has_ordered_children(self) -> bool:
+        return False
+
+    @override
+    def _get_hash(self) -> Hashable:
+        hashes: set[object] = set()
+        for child in self:
+            hashes.add(child._get_hash())
+        return id(self.holding_type), frozenset(hashes)
+
+    @override
+    def __iter__(self) -> "Self":
+        self._iterator = 0  # Reset the index to zero when starting a new iteration
+        return self
+
+    @override
+    def __next__(self) -> "DataTypeTree":
+        if self._iterator < len(self.children):
+            element = list(self.children)[self._iterator]
+            self._iterator += 1
+            return element
+        else:
+            raise StopIteration
@@ -0,0 +1,286 @@
+"""Split the type hints of a `DataTypeTree` into multiple modules that can be written as a package.
+
+Definitions are gathered into modules following the same order, given by their dependencies, in which they are
+rendered by `get_str_all_nodes`. Therefore, a module only imports names from the modules that precede it and no
+circular imports are created.
+"""
+
+import keyword
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Final, Literal, Optional
+from collections.abc import Iterator, Mapping, Sequence
+
+from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree, DataTypeTreeError
+from lazy_type_hint.data_type_tree.fingerprint import get_node_fingerprints
+from lazy_type_hint.utils import ImportManager
+
+SPLIT_STRATEGIES = Literal["key", "size"]
+
+INIT_MODULE_NAME: Final = "__init__"
+"""Name of the module that re-exports all the names defined within the package."""
+SHARED_MODULE_NAME: Final = "_shared"
+"""Name of the module holding the definitions shared by multiple trees. See `iter_modules_of_trees`."""
+
+
+@dataclass(frozen=True)
+class Module:
+    """Module of a package holding part of the type hints."""
+
+    name: str
+    """Name of the module, without the `.py` suffix."""
+    content: str
+    """Content of the module."""
+    names: tuple[str, ...]
+    """Names defined within the module."""
+
+
+@dataclass
+class _ModuleBuilder:
+    name: str
+    definitions: list[str]
+    names: list[str]
+    imports: ImportManager
+    size: int = 0
+    references: list[str] = field(default_factory=list)
+    """Names of other definitions used by the definitions of the module."""
+
+
+def iter_modules(
+    tree: DataTypeTree, *, split_by: SPLIT_STRATEGIES = "key", max_module_size: int = 100_000
+) -> Iterator[Module]:
+    """Lazily split the type hints of the tree into modules, followed by an `__init__` module re-exporting them.
+
+    Args:
+        tree (DataTypeTree): Tree to split.
+        split_by (SPLIT_STRATEGIES, optional): If "key", there will be a module for each child of the root node
+            (e.g. each top-level key of a dictionary) and another one for the root node itself. If "size", definitions
+            are gathered into modules whose size, in characters, does not exceed `max_module_size` (unless a single
+            definition exceeds it). Defaults to "key".
+        max_module_size (int, optional): Maximum size of each module when splitting by size. Defaults to 100_000.
+
+    Yields:
+        Module: Modules with at least one definition, followed by the `__init__` one.
+    """
+    if split_by not in ("key", "size"):
+        raise DataTypeTreeError(f"The given split strategy ({split_by}) is not available.")
+    if max_module_size <= 0:
+        raise DataTypeTreeError("`max_module_size` must be greater than 0")
+
+    module_per_name: dict[str, str] = {}
+    module_names: set[str] = {INIT_MODULE_NAME}
+    definitions_added: set[str] = set()
+    modules: list[Module] = []
+
+    def new_module(name: str) -> _ModuleBuilder:
+        name = _get_module_name(name)
+        unique_name = name
+        count = 2
+        while unique_name in module_names:
+            unique_name = f"{name}_{count}"
+            count += 1
+        module_names.add(unique_name)
+        return _ModuleBuilder(name=unique_name, definitions=[], names=[], imports=ImportManager())
+
+    def build(builder: _ModuleBuilder) -> Optional[Module]:
+        if not builder.definitions:
+            return None
+        module = Module(
+            name=builder.name,
+            content=_format_module(tree, builder, module_per_name),
+            names=tuple(builder.names),
+        )
+        module_per_name.update(dict.fromkeys(builder.names, builder.name))
+        modules.append(module)
+        return module
+
+    # When splitting by size, there is a single group holding all nodes
+    for group_name, nodes in _iter_groups_of_nodes(tree, split_by=split_by):
+        builder = new_module(group_name if split_by == "key" else f"{tree.name}0")
+        for node in nodes:
+            with tree.imports.record() as imports:
+                definition = node.get_str_top_node()
+            if definition in definitions_added:
+                continue
+            definitions_added.add(definition)
+            if split_by == "size" and builder.definitions and builder.size + len(definition) > max_module_size:
+                if (module := build(builder)) is not None:
+                    yield module
+                builder = new_module(f"{tree.name}{len(modules)}")
+            builder.definitions.append(definition)
+            builder.names.append(node.name)
+            builder.references.extend(_get_referenced_names(node))
+            builder.size += len(definition)
+            builder.imports.update(imports)
+        if (module := build(builder)) is not None:
+            yield module
+
+    if not modules:
+        raise DataTypeTreeError("No type hints could be built")
+    yield Module(name=INIT_MODULE_NAME, content=_format_init_module(modules), names=tuple(module_per_name))
+
+
+def share_identical_nodes(trees: Sequence[DataTypeTree]) -> None:
+    """Rename the nodes defined with the same structure and docstrings within multiple trees to a single name.
+
+    Each group of identical nodes takes the name of its first node (with a numeric suffix if it is already taken), so
+    that they are rendered the same in all trees and can be defined only once (see `iter_modules_of_trees`). Root
+    nodes are never renamed.
+    """
+    groups: dict[str, dict[int, DataTypeTree]] = {}
+    trees_per_group: dict[str, set[int]] = {}
+    for tree_idx, tree in enumerate(trees):
+        fingerprints = get_node_fingerprints(tree, include_names=False)
+        for node in tree._iter_nodes_to_define():
+            if node.parent is not None:
+                fingerprint = fingerprints[id(node)]
+                groups.setdefault(fingerprint, {})[id(node)] = node
+                trees_per_group.setdefault(fingerprint, set()).add(tree_idx)
+
+    shared_groups = [list(group.values()) for key, group in groups.items() if len(trees_per_group[key]) > 1]
+    shared_ids = {id(node) for group in shared_groups for node in group}
+    names_taken = {tree.name for tree in trees}
+    names_taken.update(node.name for group in groups.values() for node in group.values() if id(node) not in shared_ids)
+    for group in shared_groups:
+        name = unique_name = group[0].name
+        count = 2
+        while unique_name in names_taken:
+            unique_name = f"{name}{count}"
+            count += 1
+        names_taken.add(unique_name)
+        for node in group:
+            node.name = unique_name
+
+
+def iter_modules_of_trees(trees: Sequence[DataTypeTree]) -> Iterator[Module]:
+    """Lazily split the type hints of multiple trees into a module per tree, followed by an `__init__` module.
+
+    Definitions rendered the same by more than one tree (see `share_identical_nodes`) are only written once, in a
+    shared module that precedes the rest and from which they import them. Each tree is rendered as a whole, as its
+    definitions are needed to know which ones are shared.
+
+    Args:
+        trees (Sequence[DataTypeTree]): Trees to split, with different names.
+
+    Yields:
+        Module: The shared module (if any definition is shared), the module of each tree and the `__init__` one.
+    """
+    if len({tree.name for tree in trees}) != len(trees):
+        raise DataTypeTreeError("All trees must have different names")
+
+    definitions_per_tree: list[dict[str, tuple[DataTypeTree, ImportManager]]] = []
+    for tree in trees:
+        definitions: dict[str, tuple[DataTypeTree, ImportManager]] = {}
+        for node in tree._iter_nodes_to_define():
+            with tree.imports.record() as imports:
+                definition = node.get_str_top_node()
+            definitions.setdefault(definition, (node, imports))
+        definitions_per_tree.append(definitions)
+    counts = Counter(definition for definitions in definitions_per_tree for definition in definitions)
+
+    module_names: set[str] = {INIT_MODULE_NAME, SHARED_MODULE_NAME}
+    shared_builder = _ModuleBuilder(name=SHARED_MODULE_NAME, definitions=[], names=[], imports=ImportManager())
+    shared_definitions: set[str] = set()
+    builders: list[_ModuleBuilder] = []
+    for tree, definitions in zip(trees, definitions_per_tree):
+        name = unique_name = _get_module_name(tree.name)
+        count = 2
+        while unique_name in module_names:
+            unique_name = f"{name}_{count}"
+            count += 1
+        module_names.add(unique_name)
+        builder = _ModuleBuilder(name=unique_name, definitions=[], names=[], imports=ImportManager())
+        for definition, (node, imports) in definitions.items():
+            target = shared_builder if counts[definition] > 1 else builder
+            if target is shared_builder:
+                if definition in shared_definitions:
+                    continue
+                shared_definitions.add(definition)
+            target.definitions.append(definition)
+            target.names.append(node.name)
+            target.references.extend(_get_referenced_names(node))
+            target.imports.update(imports)
+        builders.append(builder)
+
+    modules: list[Module] = []
+    shared_module_per_name: dict[str, str] = {}
+    if shared_builder.definitions:
+        modules.append(
+            Module(
+                name=SHARED_MODULE_NAME,
+                content=_format_module(trees[0], shared_builder, {}),
+                names=tuple(shared_builder.names),
+            )
+        )
+        shared_module_per_name = dict.fromkeys(shared_builder.names, SHARED_MODULE_NAME)
+        yield modules[-1]
+    for tree, builder in zip(trees, builders):
+        modules.append(
+            Module(
+                name=builder.name,
+                content=_format_module(tree, builder, shared_module_per_name),
+                names=tuple(builder.names),
+            )
+        )
+        yield modules[-1]
+    yield Module(
+        name=INIT_MODULE_NAME,
+        content=_format_init_module(modules),
+        names=tuple(name for module in modules for name in module.names),
+    )
+
+
+def _iter_groups_of_nodes(
+    tree: DataTypeTree, *, split_by: SPLIT_STRATEGIES
+) -> Iterator[tuple[str, Iterator[DataTypeTree]]]:
+    """Get the nodes to define grouped by the child of the root node they belong to, and the root node at last."""
+    if split_by == "size" or not tree.children:
+        yield tree.name, tree._iter_nodes_to_define()
+        return
+    for child in tree:
+        yield child.name, _iter_nodes_to_define_including_itself(child)
+    yield tree.name, iter((tree,))
+
+
+def _iter_nodes_to_define_including_itself(node: DataTypeTree) -> Iterator[DataTypeTree]:
+    yield from node._iter_nodes_to_define()
+    if node.permission_to_be_created_as_type_alias:
+        yield node
+
+
+def _get_referenced_names(node: DataTypeTree) -> Iterator[str]:
+    """Get the names of the definitions used by the definition of the node: those of its closest defined descendants."""
+    children = node.children.values() if isinstance(node.children, Mapping) else node.children or ()
+    for child in children:
+        if child.permission_to_be_created_as_type_alias:
+            yield child.name
+        else:
+            yield from _get_referenced_names(child)
+
+
+def _format_module(tree: DataTypeTree, builder: _ModuleBuilder, module_per_name: dict[str, str]) -> str:
+    names_to_import: dict[str, list[str]] = {}
+    for name in dict.fromkeys(builder.references):
+        if name in module_per_name:
+            names_to_import.setdefault(module_per_name[name], []).append(name)
+    relative_imports = "\n".join(
+        f"from .{module} import {', '.join(sorted(set(names)))}" for module, names in names_to_import.items()
+    )
+    header = "\n\n".join(string for string in (builder.imports.format(), relative_imports) if string)
+    if not header:
+        return tree._format_node_strings(builder.definitions) + "\n"
+    return tree._format_node_strings([header, *builder.definitions]) + "\n"
+
+
+def _format_init_module(modules: list[Module]) -> str:
+    lines = [f"from .{module.name} import {name} as {name}" for module in modules for name in module.names]
+    return "\n".join(lines) + "\n"
+
+
+def _get_module_name(name: str) -> str:
+    """Get a valid module name in snake case from a class name."""
+    module_name = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name).lower()
+    if keyword.iskeyword(module_name):
+        return f"{module_name}_"
+    return module_name
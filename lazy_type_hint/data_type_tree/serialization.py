@@ -0,0 +1,203 @@
+"""Serialize a `DataTypeTree` into a compact JSON-compatible object and load it back without the original data.
+
+The serialized object has the following structure:
+
+    {
+        "version": 1,
+        "strategies": {...},  # Fields of `ParsingStrategies`
+        "kinds": ["DictDataTypeTree", ...],  # Names of the tree classes used
+        "types": ["builtins:dict", ...],  # References to the types held by each node
+        "nodes": [[kind, name, type, depth, height, parent, children, state], ...],
+    }
+
+Nodes are stored in post-order, so the root node is always the last one and children are always defined before
+their parents. `kind` and `type` are indexes within `kinds` and `types`, `parent` is the index of the parent node (if
+any) and `children` is either None, a list of node indexes or a `[keys, node indexes]` pair for mapping-based trees.
+Nodes shared among multiple parents are only stored once.
+"""
+
+import builtins
+import sys
+import types
+from functools import cache
+from typing import Any, Final, Optional
+from collections.abc import Hashable, Mapping
+
+from lazy_type_hint.data_type_tree.data_type_tree import ChildrenStructure, DataTypeTree, DataTypeTreeError
+from lazy_type_hint.strategies import ParsingStrategies
+from lazy_type_hint.utils import ImportManager
+
+SERIALIZATION_VERSION: Final = 1
+"""Version of the format. Serialized trees with a different version cannot be loaded."""
+
+_TYPES_NOT_REACHABLE_BY_NAME: Final = {
+    f"{type_.__module__}:{type_.__qualname__}": type_
+    for type_ in (type(None), type(Ellipsis), type(NotImplemented), *vars(types).values())
+    if isinstance(type_, type)
+}
+"""Types whose name cannot be used to retrieve them from their module, such as `NoneType`."""
+
+
+def dump_data_type_tree(tree: DataTypeTree) -> dict[str, Any]:
+    """Serialize the tree into a JSON-compatible object."""
+    kinds: dict[str, int] = {}
+    type_references: dict[str, int] = {}
+    node_indexes: dict[int, int] = {}
+    nodes: list[DataTypeTree] = []
+    records: list[list[Any]] = []
+
+    def dump_node(node: DataTypeTree) -> int:
+        if id(node) in node_indexes:
+            return node_indexes[id(node)]
+        children: Any = None
+        if isinstance(node.children, Mapping):
+            keys = [_encode(key) for key in node.children]
+            children = [keys, [dump_node(child) for child in node.children.values()]]
+        elif node.children is not None:
+            children = [dump_node(child) for child in node.children]
+        kind = kinds.setdefault(type(node).__name__, len(kinds))
+        type_reference = type_references.setdefault(_get_type_reference(node.holding_type), len(type_references))
+        state = {key: _encode(value) for key, value in node._get_state().items()}
+        node_indexes[id(node)] = len(records)
+        nodes.append(node)
+        records.append([kind, node.name, type_reference, node.depth, node.height, None, children, state])
+        return node_indexes[id(node)]
+
+    dump_node(tree)
+    for node, record in zip(nodes, records):
+        if node.parent is not None:
+            record[5] = node_indexes.get(id(node.parent))
+    return {
+        "version": SERIALIZATION_VERSION,
+        "strategies": {key: getattr(tree.strategies, key) for key in ParsingStrategies.__dataclass_fields__},
+        "kinds": list(kinds),
+        "types": list(type_references),
+        "nodes": records,
+    }
+
+
+def load_data_type_tree(
+    serialized: Mapping[str, Any], *, strategies: Optional[ParsingStrategies] = None
+) -> DataTypeTree:
+    """Load a tree serialized with `dump_data_type_tree`.
+
+    Args:
+        serialized (Mapping[str, Any]): Object returned by `dump_data_type_tree`.
+        strategies (Optional[ParsingStrategies], optional): Strategies to use when rendering the loaded tree. Only
+            those that affect how the tree is rendered (not how it was built) will have an effect. Defaults to the
+            ones used when the tree was created.
+
+    Returns:
+        DataTypeTree: Root node of the loaded tree.
+    """
+    if serialized.get("version") != SERIALIZATION_VERSION:
+        raise DataTypeTreeError(
+            f"Only serialized trees with version {SERIALIZATION_VERSION} can be loaded but "
+            f"{serialized.get('version')} was given"
+        )
+    if strategies is None:
+        strategies = ParsingStrategies(**serialized["strategies"])
+    classes = _get_data_type_tree_classes()
+    missing_kinds = {kind for kind in serialized["kinds"] if kind not in classes}
+    if missing_kinds and DataTypeTree.import_lazy_subclasses(class_names=missing_kinds):
+        classes = _get_data_type_tree_classes()
+    try:
+        kinds = [classes[kind] for kind in serialized["kinds"]]
+    except KeyError as error:
+        raise DataTypeTreeError(f"The serialized tree requires an unknown parser: {error}") from error
+    holding_types = [_resolve_type_reference(reference) for reference in serialized["types"]]
+
+    imports = ImportManager()
+    nodes: list[DataTypeTree] = []
+    for kind, name, type_index, depth, height, _, children, _ in serialized["nodes"]:
+        node = kinds[kind].__new__(kinds[kind])
+        node.name = name
+        node.depth = depth
+        node.height = height
+        node.holding_type = holding_types[type_index]
+        node.strategies = strategies
+        node.imports = imports
+        node.parent = None
+        node.children = _load_children(children, nodes)
+        nodes.append(node)
+
+    for node, record in zip(nodes, serialized["nodes"]):
+        if record[5] is not None:
+            node.parent = nodes[record[5]]
+        node._set_state({key: _decode(value) for key, value in record[7].items()})
+    return nodes[-1]
+
+
+def _load_children(children: Any, nodes: list[DataTypeTree]) -> Optional[ChildrenStructure[DataTypeTree]]:
+    if children is None:
+        return None
+    if len(children) == 2 and isinstance(children[0], list) and isinstance(children[1], list):
+        keys, indexes = children
+        return {_decode(key): nodes[index] for key, index in zip(keys, indexes)}
+    return tuple(nodes[index] for index in children)
+
+
+def _get_data_type_tree_classes() -> dict[str, type[DataTypeTree]]:
+    return {subclass.__name__: subclass for subclass in DataTypeTree.subclasses.values()}
+
+
+def _get_type_reference(type_: type[object]) -> str:
+    return f"{type_.__module__}:{type_.__qualname__}"
+
+
+@cache
+def _resolve_type_reference(reference: str) -> type[object]:
+    """Get the type associated to the reference.
+
+    Only modules that were already imported are searched. If the type cannot be found, a placeholder type with the
+    same name is returned instead, as the name is everything that is needed to render it.
+    """
+    if reference in _TYPES_NOT_REACHABLE_BY_NAME:
+        return _TYPES_NOT_REACHABLE_BY_NAME[reference]
+    module_name, _, qualname = reference.partition(":")
+    object_: object = sys.modules.get(module_name, builtins if module_name == "builtins" else None)
+    for attribute in qualname.split("."):
+        object_ = getattr(object_, attribute, None)
+    if isinstance(object_, type):
+        return object_
+    return _get_placeholder_type(reference)
+
+
+@cache
+def _get_placeholder_type(reference: str) -> type[object]:
+    module_name, _, qualname = reference.partition(":")
+    return type(qualname.split(".")[-1], (), {"__module__": module_name, "__qualname__": qualname})
+
+
+def _encode(value: object) -> Any:
+    """Encode any value into a JSON-compatible one, keeping the information needed to decode it back."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, list):
+        return [_encode(element) for element in value]
+    if isinstance(value, tuple):
+        return {"tuple": [_encode(element) for element in value]}
+    if isinstance(value, Mapping):
+        return {"dict": [[_encode(key), _encode(element)] for key, element in value.items()]}
+    if isinstance(value, type):
+        return {"type": _get_type_reference(value)}
+    return {"object": _get_type_reference(type(value))}
+
+
+def _decode(value: Any) -> Any:
+    """Decode a value encoded with `_encode`.
+
+    Objects that cannot be represented are decoded as unique instances of a placeholder type with the same name.
+    """
+    if isinstance(value, list):
+        return [_decode(element) for element in value]
+    if not isinstance(value, dict):
+        return value
+    if "tuple" in value:
+        return tuple(_decode(element) for element in value["tuple"])
+    if "dict" in value:
+        dct: dict[Hashable, Any] = {_decode(key): _decode(element) for key, element in value["dict"]}
+        return dct
+    if "type" in value:
+        return _resolve_type_reference(value["type"])
+    return _get_placeholder_type(value["object"])()
@@ -1,16 +1,13 @@
-from contextlib import suppress
+import importlib
+from typing import Any
 
+from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
 from lazy_type_hint.data_type_tree.simple_data_type_tree.function_data_type_tree import (
     FunctionDataTypeTree as FunctionDataTypeTree,
 )
 from lazy_type_hint.data_type_tree.simple_data_type_tree.instance_data_type_tree import (
     InstanceDataTypeTree as InstanceDataTypeTree,
 )
-
-with suppress(ImportError):
-    from lazy_type_hint.data_type_tree.simple_data_type_tree.numpy_data_type_tree import (
-        NumpyDataTypeTree as NumpyDataTypeTree,
-    )
 from lazy_type_hint.data_type_tree.simple_data_type_tree.io_data_type_tree import IoDataTypeTree as IoDataTypeTree
 from lazy_type_hint.data_type_tree.simple_data_type_tree.module_data_type_tree import (
     ModuleTypeDataTypeTree as ModuleTypeDataTypeTree,
@@ -21,3 +18,15 @@ from lazy_type_hint.data_type_tree.simple_data_type_tree.simple_data_type_tree i
 from lazy_type_hint.data_type_tree.simple_data_type_tree.type_data_type_tree import (
     TypeDataTypeTree as TypeDataTypeTree,
 )
+
+# Importing numpy is slow, so this tree is only imported once a numpy object is found
+_LAZY_MODULES = {
+    "NumpyDataTypeTree": "lazy_type_hint.data_type_tree.simple_data_type_tree.numpy_data_type_tree",
+}
+DataTypeTree.register_lazy_subclass("numpy.ndarray", _LAZY_MODULES["NumpyDataTypeTree"], "NumpyDataTypeTree")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_MODULES:
+        return getattr(importlib.import_module(_LAZY_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
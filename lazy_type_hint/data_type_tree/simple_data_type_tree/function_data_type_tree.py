@@ -3,8 +3,8 @@ import inspect
 import textwrap
 from inspect import Parameter
 from types import BuiltinFunctionType, FunctionType, MappingProxyType, MethodType
-from typing import Any, Callable, Optional
-from collections.abc import Hashable
+from typing import Any, Callable, NamedTuple, Optional
+from collections.abc import Hashable, Mapping
 
 from typing_extensions import override
 
@@ -12,13 +12,36 @@ from lazy_type_hint.data_type_tree.simple_data_type_tree.simple_data_type_tree i
 from lazy_type_hint.utils import TAB
 
 
+class CallableInfo(NamedTuple):
+    """Information extracted from the callable that is needed to build its type hint."""
+
+    is_lambda: bool
+    signature: Optional[str]
+    """String representation of the signature. None if it cannot be inspected."""
+    n_params: int
+    has_return: Optional[bool]
+    """Whether a `return` statement was found. Only computed if the signature does not annotate it."""
+
+
+def _loaded_callable(*args: Any, **kwargs: Any) -> Any:  # noqa: ARG001
+    """Surrogate of the callable held by those trees that were loaded without the original data."""
+
+
 class FunctionDataTypeTree(SimpleDataTypeTree):
     wraps = (FunctionType, staticmethod, classmethod, BuiltinFunctionType, MethodType)
     data: Callable[[Any], Any]
 
+    _callable_info: Optional[CallableInfo] = None
+
+    @property
+    def callable_info(self) -> CallableInfo:
+        if self._callable_info is None:
+            self._callable_info = self._get_callable_info()
+        return self._callable_info
+
     @property
     def is_lambda(self) -> bool:
-        return bool(self.data.__name__ == "<lambda>")
+        return self.callable_info.is_lambda
 
     @override
     @property
@@ -29,11 +52,19 @@ class FunctionDataTypeTree(SimpleDataTypeTree):
 
     @property
     def can_be_inspected(self) -> bool:
+        return self.callable_info.signature is not None
+
+    def _get_callable_info(self) -> CallableInfo:
+        is_lambda = bool(self.data.__name__ == "<lambda>")
         try:
-            inspect.signature(self.data)
-            return True
+            signature = inspect.signature(self.data)
         except ValueError:
-            return False
+            return CallableInfo(is_lambda=is_lambda, signature=None, n_params=0, has_return=None)
+        signature_str = str(signature)
+        has_return = None if is_lambda or "->" in signature_str else self._has_return()
+        return CallableInfo(
+            is_lambda=is_lambda, signature=signature_str, n_params=len(signature.parameters), has_return=has_return
+        )
 
     def _get_str_top_node(self) -> str:
         if not self.can_be_inspected:
@@ -44,12 +75,12 @@ class FunctionDataTypeTree(SimpleDataTypeTree):
         return self._get_protocol_str()
 
     def _get_protocol_str(self) -> str:
-        args = str(inspect.signature(self.data)).replace("collections.abc.", "")
+        args = str(self.callable_info.signature).replace("collections.abc.", "")
         self.imports.add("Protocol")
         self.imports.import_all_unkown_symbols_from_signature(args)
 
         if "->" not in args:
-            if not self._has_return():
+            if not self.callable_info.has_return:
                 return f"""class {self.name}(Protocol):\n{TAB}def __call__{args} -> None: ..."""
             self.imports.add("Any")
             return f"""class {self.name}(Protocol):\n{TAB}def __call__{args} -> Any: ..."""
@@ -62,22 +93,32 @@ class FunctionDataTypeTree(SimpleDataTypeTree):
     def _get_lambda_str(self) -> str:
         self.imports.add("Callable").add("Any").add("TypeAlias")
         if self.can_be_inspected:
-            return (
-                f"{self.name}: TypeAlias = Callable[[{', '.join(['Any']*len(self.get_func_params().values()))}], Any]"
-            )
+            return f"{self.name}: TypeAlias = Callable[[{', '.join(['Any']*self.callable_info.n_params)}], Any]"
         return f"{self.name}: TypeAlias = Callable"
 
     @override
     def _get_hash(self) -> Hashable:
         if self.is_lambda and self.can_be_inspected:
-            return str(f"Callable[[{', '.join(['Any']*len(self.get_func_params().values()))}], Any]")
+            return str(f"Callable[[{', '.join(['Any']*self.callable_info.n_params)}], Any]")
         else:
             if self.can_be_inspected:
-                return str(inspect.signature(self.data))
+                return str(self.callable_info.signature)
             return "Callable"
 
+    @override
+    def _get_state(self) -> dict[str, Any]:
+        return dict(self.callable_info._asdict())
+
+    @override
+    def _set_state(self, state: Mapping[str, Any]) -> None:
+        self.data = _loaded_callable
+        self._callable_info = CallableInfo(**state)
+
     def _has_return(self) -> Optional[bool]:
-        code = textwrap.dedent(inspect.getsource(self.data))
+        try:
+            code = textwrap.dedent(inspect.getsource(self.data))
+        except (OSError, TypeError):
+            return None
         try:
             tree = ast.parse(code)
         except:  # noqa: E722
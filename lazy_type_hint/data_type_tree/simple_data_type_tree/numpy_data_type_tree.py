@@ -1,15 +1,198 @@
+import ast
+import struct
+from typing import IO, Any, Final, Optional
+from collections.abc import Hashable, Mapping, Sequence
+
 import numpy as np
 from numpy.typing import NDArray
 from typing_extensions import override
 
 from lazy_type_hint.data_type_tree.simple_data_type_tree.simple_data_type_tree import SimpleDataTypeTree
 
+FIELD_OVERLOAD_TEMPLATE: Final = """    @overload  # type: ignore
+    def __getitem__(self, key: Literal[{field!r}]) -> {rtype}:
+        ...
+"""
+ELEMENT_OVERLOAD_TEMPLATE: Final = """    @overload  # type: ignore
+    def __getitem__(self, key: {key}) -> {rtype}:
+        ...
+"""
+TEMPLATE: Final = """class {class_name}({array_type}):
+
+{overloads}
+    @overload
+    def __getitem__(self, key: Any) -> Any:
+        ...
+
+    def __getitem__(self, key: Any) -> Any:
+        return super().__getitem__(key)"""
+
 
 class NumpyDataTypeTree(SimpleDataTypeTree):
+    """Tree that holds a numpy array.
+
+    Type hints are inferred from the dtype and the shape of the array, so that the cost does not depend on its size.
+    Structured arrays are type hinted with a class that maps each field to its own array type. Elements of object
+    arrays are only checked up to `check_max_n_elements_within_container` elements.
+    """
+
     wraps = (np.ndarray,)
-    data: NDArray[np.generic]
+    data: NDArray[Any]
+    element_types: Optional[tuple[str, ...]]
+    """Types of the elements of object arrays. None if the array does not hold objects or it is empty."""
+
+    @override
+    def __pre_child_instantiation__(self) -> None:
+        self.element_types = self._get_element_types()
+
+    def _get_element_types(self) -> Optional[tuple[str, ...]]:
+        if self.data.dtype != object or not self.data.size:
+            return None
+        n_elements = self.strategies.check_max_n_elements_within_container
+        sample = self.data.flat[:n_elements] if n_elements is not None else self.data.flat
+        types = {type(element) for element in sample}
+        if not all(type_.__module__ == "builtins" for type_ in types):
+            return ("Any",)
+        names = {"None" if type_ is type(None) else type_.__name__ for type_ in types}
+        if "float" in names:
+            names.discard("int")
+        return tuple(sorted(names))
+
+    @property
+    def is_class(self) -> bool:
+        """Whether the array is type hinted with a class (structured and object arrays) instead of a type alias."""
+        return self.data.dtype.names is not None or self.element_types is not None
+
+    @override
+    @property
+    def permission_to_be_created_as_type_alias(self) -> bool:
+        return self.is_class or super().permission_to_be_created_as_type_alias
 
     @override
     def _get_str_top_node(self) -> str:
-        self.imports.add("NDArray").add("numpy").add("TypeAlias")
-        return f'{self.name}: TypeAlias = "NDArray[np.{self.data.dtype}]"'
+        self.imports.add("numpy")
+        if not self.is_class:
+            self.imports.add("TypeAlias")
+            return f'{self.name}: TypeAlias = "{self._get_array_type(self.data.dtype, self.data.shape)}"'
+
+        self.imports.add("Any").add("overload")
+        overloads: list[str] = []
+        for field in self.data.dtype.names or ():
+            self.imports.add("Literal")
+            field_dtype: np.dtype[Any] = self.data.dtype.fields[field][0]  # type: ignore[index]
+            rtype = self._get_array_type(field_dtype.base, (*self.data.shape, *field_dtype.shape))
+            overloads.append(FIELD_OVERLOAD_TEMPLATE.format(field=field, rtype=f'"{rtype}"'))
+        if self.element_types is not None:
+            if self.data.ndim == 1:
+                key = "int"
+            else:
+                key = f"tuple[{', '.join(['int'] * self.data.ndim) if self.data.ndim else '()'}]"
+            overloads.append(ELEMENT_OVERLOAD_TEMPLATE.format(key=key, rtype=self._format_element_types()))
+        array_type = self._get_array_type(self.data.dtype, self.data.shape, alias=False)
+        return TEMPLATE.format(class_name=self.name, array_type=array_type, overloads="\n".join(overloads))
+
+    def _get_array_type(self, dtype: "np.dtype[Any]", shape: Sequence[int], *, alias: bool = True) -> str:
+        """Get the type of an array given its dtype and its shape. Shape is only included if required by strategy.
+
+        Args:
+            dtype (np.dtype[Any]): Dtype of the array.
+            shape (Sequence[int]): Shape of the array.
+            alias (bool, optional): Whether to use `NDArray` when possible. Subclassing requires `np.ndarray` instead.
+                Defaults to True.
+        """
+        scalar_type = f"np.{dtype.type.__name__}"
+        strategy = self.strategies.numpy_shape_strategy
+        if strategy == "Do not type hint shape" and alias:
+            self.imports.add("NDArray")
+            return f"NDArray[{scalar_type}]"
+        if strategy == "Do not type hint shape":
+            self.imports.add("Any")
+            return f"np.ndarray[Any, np.dtype[{scalar_type}]]"
+        if strategy == "Type hint number of dimensions":
+            dimensions = ["int"] * len(shape)
+        else:
+            self.imports.add("Literal")
+            dimensions = [f"Literal[{dimension}]" for dimension in shape]
+        return f"np.ndarray[tuple[{', '.join(dimensions) if dimensions else '()'}], np.dtype[{scalar_type}]]"
+
+    def _format_element_types(self) -> str:
+        element_types = self.element_types or ()
+        if "Any" in element_types:
+            self.imports.add("Any")
+        if len(element_types) == 1:
+            return element_types[0]
+        self.imports.add("Union")
+        return f"Union[{', '.join(element_types)}]"
+
+    @override
+    def _get_hash(self) -> Hashable:
+        strategy = self.strategies.numpy_shape_strategy
+        if strategy == "Do not type hint shape":
+            shape: Hashable = None
+        else:
+            shape = self.data.ndim if strategy == "Type hint number of dimensions" else self.data.shape
+        return id(self.holding_type), str(self.data.dtype), shape, self.element_types
+
+    @override
+    def _get_state(self) -> dict[str, Any]:
+        state: dict[str, Any] = {"dtype": np.lib.format.dtype_to_descr(self.data.dtype), "shape": self.data.shape}
+        if self.element_types is not None:
+            state["element_types"] = list(self.element_types)
+        return state
+
+    @override
+    def _set_state(self, state: Mapping[str, Any]) -> None:
+        """Use an array that does not allocate memory for its elements as surrogate. See `create_surrogate_array`."""
+        self.data = create_surrogate_array(np.lib.format.descr_to_dtype(state["dtype"]), state["shape"])
+        self.element_types = tuple(state["element_types"]) if "element_types" in state else None
+
+
+class _UnknownElement:
+    """Element of object arrays whose type is not known, so that they are type hinted with `Any`."""
+
+
+def create_surrogate_array(dtype: "np.dtype[Any]", shape: Sequence[int]) -> NDArray[Any]:
+    """Create a read-only array with the given dtype and shape that does not allocate memory for its elements.
+
+    Elements of object arrays are of an unknown type, so they are type hinted with `Any`.
+    """
+    element = np.empty((), dtype=dtype)
+    if dtype == object:
+        element[()] = _UnknownElement()
+    return np.broadcast_to(element, tuple(shape))
+
+
+def read_array_header(stream: IO[bytes]) -> NDArray[Any]:
+    """Read the header of an array stored in `.npy` format and create a surrogate array with its dtype and shape.
+
+    Only the header is read, so the cost does not depend on the size of the array. See `create_surrogate_array`.
+
+    Args:
+        stream (IO[bytes]): Binary stream placed at the beginning of the `.npy` content.
+
+    Raises:
+        ValueError: If the content is not in `.npy` format or its version is not supported.
+    """
+    version = np.lib.format.read_magic(stream)
+    if version == (1, 0):
+        shape, _, dtype = np.lib.format.read_array_header_1_0(stream)
+    elif version == (2, 0):
+        shape, _, dtype = np.lib.format.read_array_header_2_0(stream)
+    elif version == (3, 0):
+        shape, dtype = _read_array_header_3_0(stream)
+    else:
+        raise ValueError(f"Unsupported version of the `.npy` format: {version}")
+    return create_surrogate_array(dtype, shape)
+
+
+def _read_array_header_3_0(stream: IO[bytes]) -> tuple[tuple[int, ...], "np.dtype[Any]"]:
+    """Read the header of the version 3.0 of the `.npy` format, which numpy does not expose publicly.
+
+    It has the same layout as the version 2.0 (a 4-byte length followed by a dictionary literal), but it is encoded in
+    utf-8 so that field names are not restricted to latin-1.
+    """
+    (header_length,) = struct.unpack("<I", stream.read(4))
+    header = ast.literal_eval(stream.read(header_length).decode("utf-8"))
+    if not isinstance(header, dict) or not {"descr", "fortran_order", "shape"} <= header.keys():
+        raise ValueError(f"Invalid header of the `.npy` format: {header!r}")
+    return tuple(header["shape"]), np.lib.format.descr_to_dtype(header["descr"])
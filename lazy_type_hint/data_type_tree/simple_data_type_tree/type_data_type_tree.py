@@ -1,4 +1,6 @@
 import builtins
+from collections.abc import Mapping
+from typing import Any
 
 from typing_extensions import override
 
@@ -22,3 +24,11 @@ class TypeDataTypeTree(SimpleDataTypeTree):
             return isinstance(cls, type)
         except AttributeError:
             return False
+
+    @override
+    def _get_state(self) -> dict[str, Any]:
+        return {"type": self.data}
+
+    @override
+    def _set_state(self, state: Mapping[str, Any]) -> None:
+        self.data = state["type"]
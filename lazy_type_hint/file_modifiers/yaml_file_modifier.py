@@ -1,22 +1,32 @@
 """Tool that allows to read comments from yaml files and re-introduce them as part of the dictionary."""
 
+import io
+import os
 import re
 import tempfile
-from collections import defaultdict
-from contextlib import suppress
-from dataclasses import dataclass
+from collections import deque
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import (
     Final,
     Literal,
     Optional,
+    TextIO,
     Union,
 )
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 
 YAML_COMMENTS_POSITION = Literal["above", "below", "side"]
 """Possible locations where comments can be written."""
 
+_LEADING_SPACING: Final = re.compile(r"[ \t-]*")
+"""Spaces, tabs and hyphens (list elements) found before the first key of a line."""
+_BLOCK_COMMENT_COLUMN: Final = re.compile(r"[\s-]*")
+"""Characters skipped before the column where comments above or below a key must start."""
+_COMMENT_START: Final = re.compile("#")
+"""Character starting a comment, which must be in the same column for all the lines of a block of comments."""
+
 
 @dataclass(frozen=True)
 class Comment:
@@ -38,6 +48,21 @@ class Comment:
         return "".join(lst)
 
 
+@dataclass
+class _KeyLine:
+    """Line containing a key, found while scanning the file."""
+
+    line_idx: int
+    key: str
+    spacing: int
+    is_first_element_within_list: bool
+    comments: dict[YAML_COMMENTS_POSITION, str] = field(default_factory=dict)
+    """Comments found so far, except the ones below, which are only known once their block ends."""
+    comments_below: list[str] = field(default_factory=list)
+    reading_comments_below: bool = False
+    """Whether the block of comments below the key did not end yet, so that the line cannot be yielded."""
+
+
 class YamlFileModifierError(Exception):
     ...
 
@@ -45,8 +70,6 @@ class YamlFileModifierError(Exception):
 class YamlFileModifier:
     path: Path
     """Path where the file lies."""
-    lines: tuple[str, ...]
-    """Content of the file parsed as multiple lines."""
     comments_are: tuple[YAML_COMMENTS_POSITION, ...]
     """Potential location of the comments. Order matters."""
     prefix: Final = "___docstring_hidden_key_"
@@ -76,10 +99,15 @@ class YamlFileModifier:
         self.path = Path(path)
         if not self.path.suffix.endswith((".yaml", ".yml")):
             raise YamlFileModifierError(f"Only `.yaml` or `.yml` are allowed. File given is: {self.path}")
-        self.lines = tuple(Path(path).read_text().splitlines())
         comments_are = (comments_are,) if isinstance(comments_are, str) else tuple(comments_are)
         self.comments_are = comments_are
 
+    def _read_lines(self) -> Iterator[str]:
+        """Stream the lines of the file, split as `str.splitlines` would do."""
+        with open(self.path) as file:
+            for line in file:
+                yield from line.splitlines()
+
     @staticmethod
     def _capitalize_only_first_letter(string: str) -> str:
         try:
@@ -89,7 +117,8 @@ class YamlFileModifier:
 
     @staticmethod
     def _remove_spacing(line: str) -> str:
-        line.strip()
+        if "\t" not in line:
+            return line.lstrip()
         lines = line.split("\t")
         lines = [line.lstrip() for line in lines]
         return "".join(lines)
@@ -166,51 +195,6 @@ class YamlFileModifier:
             return comment + "."
         return comment
 
-    def _extract_single_block_comment(self, line_idx: int, *, comments_are: Literal["above", "below"]) -> str:
-        """
-        Extracts a single block comment from the specified line index.
-
-        It is important that the comment is perfectly aligned with the key that is commenting.
-        It also merges multiple lines.
-        Only comments attached to dictionary keys will be returned.
-
-        Example:
-            # Comment above
-            key: value
-            # Comment below
-            # that can be multiple lines
-
-        Args:
-            line_idx (int): The index of the line to extract the comment from.
-            comments_are (Literal["above", "below"]): Specifies whether the comments are located above
-                or below the line.
-        """
-        # Find first non space/tab character
-        try:
-            line = self.lines[line_idx]
-        except IndexError:
-            return ""
-        if not self._find_first_occurrence_that_is_not_between(line, ":"):
-            return ""
-        idx_first_char = line.find(line.strip().replace("-", "").strip()[0])
-
-        step: Final = -1 if comments_are == "above" else 1
-        increment = step
-        multi_line_comments: list[str] = []
-        with suppress(IndexError):
-            while self.lines[line_idx + increment][idx_first_char] == "#":
-                multi_line_comments.append(self.lines[line_idx + increment][idx_first_char + 1 :].strip())
-                increment += step
-
-        if not multi_line_comments:
-            return ""
-
-        if comments_are == "above":
-            string = self._join_multi_line_comments(multi_line_comments[::-1])
-        else:
-            string = self._join_multi_line_comments(multi_line_comments)
-        return string.replace("'''", "").replace('"""', "")
-
     @staticmethod
     def _find_first_occurrence_that_is_not_between(
         line: str, occurrence: str, not_between: frozenset[str] = frozenset({"'", '"'})
@@ -227,6 +211,11 @@ class YamlFileModifier:
         Returns:
             Optional[int]: The index of the first occurrence that is not between quotes, or None if not found.
         """
+        idx = line.find(occurrence)
+        if idx == -1:
+            return None
+        if not_between.isdisjoint(line[:idx]):
+            return idx
         between_quotes = False
         for i, char in enumerate(line):
             if char in not_between:
@@ -247,6 +236,8 @@ class YamlFileModifier:
         line = YamlFileModifier._remove_spacing(line)
         if line[0] == "-":  # Detect list cases
             line = " " + line[1:]
+        if not line.strip():
+            return ""
 
         idx_first_char = line.find(line.strip()[0])
         idx_last_char = YamlFileModifier._find_first_occurrence_that_is_not_between(line=line, occurrence=":")
@@ -260,22 +251,20 @@ class YamlFileModifier:
         else:
             return line
 
-    @staticmethod
-    def _detect_indentation(lines: Sequence[str]) -> Literal["spaces", "tabs", "??"]:
+    def _detect_indentation(self) -> Literal["spaces", "tabs", "??"]:
         """
-        Detects the type of indentation used in the given lines.
-
-        Args:
-            lines (Sequence[str]): The lines of code to analyze.
+        Detects the type of indentation used in the file, streaming it in blocks.
 
         Returns:
             Literal["spaces", "tabs", "??"]: The type of indentation used. It can be "spaces" if spaces are
                 used for indentation, "tabs" if tabs are used for indentation, or "??" if both spaces and
                 tabs are used.
-
         """
-        tabs_used = any("\t" in line for line in lines)
-        spaces_used = any(" " in line for line in lines)
+        tabs_used = spaces_used = False
+        with open(self.path) as file:
+            while (block := file.read(io.DEFAULT_BUFFER_SIZE * 64)) and not (tabs_used and spaces_used):
+                tabs_used = tabs_used or "\t" in block
+                spaces_used = spaces_used or " " in block
         if tabs_used and spaces_used:
             return "??"
         elif tabs_used:
@@ -285,29 +274,6 @@ class YamlFileModifier:
         else:
             return "??"
 
-    @staticmethod
-    def _count_spaces_or_tabs_at_start(line: str, *, indentation: Literal["spaces", "tabs"]) -> Optional[int]:
-        """
-        Counts the number of spaces or tabs at the start of a line.
-
-        Args:
-            line (str): The line to count spaces or tabs from.
-            indentation (Literal["spaces", "tabs"]): The type of indentation to count.
-
-        Returns:
-            Optional[int]: The number of spaces or tabs at the start of the line, or None if the line contains a
-                hyphen and the indentation is set to "tabs".
-        """
-        if "-" in line and indentation == "tabs":
-            return None
-        line = line.replace("-", " ")
-        pattern = re.compile(r"^[ \t]*")
-        result = pattern.match(line)
-        if result:
-            spaces_tabs = result.group()
-            return len(spaces_tabs)
-        return 0
-
     def _extract_comments(self) -> tuple[Comment, ...]:
         """
         Extracts comments associated with keys in the YAML file.
@@ -318,44 +284,132 @@ class YamlFileModifier:
         Returns:
             A tuple of Comment objects representing the extracted comments.
         """
-        comments: list[Comment] = []
-        indentation = self._detect_indentation(self.lines)
+        return tuple(comment for _, comment in self._iter_lines_with_comments() if comment is not None)
+
+    def _iter_lines_with_comments(self) -> Iterator[tuple[str, Optional[Comment]]]:
+        """
+        Stream the lines of the file together with the comment of the key they hold, if any.
+
+        Each line is only tokenized once. Comments above a key are gathered while reading the lines before it and
+        comments below while reading the lines after it, so that lines are only held back until the block of comments
+        below them ends. Memory is thus bounded by the largest block of comments and not by the size of the file.
+        """
+        indentation = self._detect_indentation()
         if indentation == "??":
-            return ()
-
-        for idx, line in enumerate(self.lines):
-            line_with_no_spacing = self._remove_spacing(line)
-            if len(line_with_no_spacing) > 0 and (line_with_no_spacing[0].isalpha() or line_with_no_spacing[0] == "-"):
-                spaces_or_tabs = self._count_spaces_or_tabs_at_start(line, indentation=indentation)
-                if spaces_or_tabs is None:
-                    continue
-
-                key = self._extract_key_from_line(line)
-                if not key:
-                    continue
-
-                for comments_are in self.comments_are:
-                    if comments_are == "above" or comments_are == "below":
-                        comment = self._extract_single_block_comment(idx, comments_are=comments_are)
-                        comment = self._capitalize_only_first_letter(comment)
-                    elif comments_are == "side":
-                        comment = self._extract_side_comment(line)
-                    is_key_first_element_within_list = line_with_no_spacing[0] == "-"
-
-                    if not comment:
-                        continue
-                    # Comments that are either below or above the keyword
-                    comments.append(
-                        Comment(
-                            full_string=comment,
-                            key_line=idx,
-                            spacing_element=(indentation, spaces_or_tabs),
-                            associated_with_key=key,
-                            must_replace_its_key_as_first_element_of_list=is_key_first_element_within_list,
-                        )
-                    )
-
-        return self._merge_comments(comments)
+            yield from ((line, None) for line in self._read_lines())
+            return
+
+        pending_lines: deque[tuple[str, Optional[_KeyLine]]] = deque()
+        """Lines read but not yielded yet, as there is a key before them whose comments below are being read."""
+        comments_above: dict[int, list[str]] = {}
+        """Comment blocks ending in the previous line, indexed by the column where their `#` is."""
+        comments_below: dict[int, list[_KeyLine]] = {}
+        """Keys whose block of comments below is still being read, indexed by the column where it must start."""
+        for line_idx, line in enumerate(self._read_lines()):
+            columns = [match.start() for match in _COMMENT_START.finditer(line)] if "#" in line else []
+
+            for column in [column for column in comments_below if column not in columns]:
+                for pending_key_line in comments_below.pop(column):
+                    pending_key_line.reading_comments_below = False
+            for column, pending_key_lines in comments_below.items():
+                for pending_key_line in pending_key_lines:
+                    pending_key_line.comments_below.append(line[column + 1 :].strip())
+
+            key_line: Optional[_KeyLine] = None
+            first_char = line.lstrip()[:1]
+            if (first_char.isalpha() or first_char == "-") and not (indentation == "tabs" and "-" in line):
+                key_line = self._tokenize_key_line(line_idx, line, comments_above, comments_below)
+            pending_lines.append((line, key_line))
+
+            if "above" in self.comments_are and (columns or comments_above):
+                previous_comments_above, comments_above = comments_above, {}
+                for column in columns:
+                    comments_above[column] = previous_comments_above.get(column, [])
+                    comments_above[column].append(line[column + 1 :].strip())
+
+            while pending_lines and not (pending_lines[0][1] and pending_lines[0][1].reading_comments_below):
+                yield self._pop_line_with_comment(pending_lines, indentation=indentation)
+
+        while pending_lines:
+            yield self._pop_line_with_comment(pending_lines, indentation=indentation)
+
+    def _pop_line_with_comment(
+        self, pending_lines: deque[tuple[str, Optional[_KeyLine]]], *, indentation: Literal["spaces", "tabs"]
+    ) -> tuple[str, Optional[Comment]]:
+        line, key_line = pending_lines.popleft()
+        if key_line is None:
+            return line, None
+        comment = self._create_comment(key_line, indentation=indentation)
+        return line, comment if comment.full_string else None
+
+    def _tokenize_key_line(
+        self,
+        line_idx: int,
+        line: str,
+        comments_above: Mapping[int, Sequence[str]],
+        comments_below: dict[int, list[_KeyLine]],
+    ) -> Optional[_KeyLine]:
+        """Read the key of a line and its comments, except the ones below it, which are registered in `comments_below`.
+
+        Returns `None` if the line has no key or if the key has no comments and no comments below it are expected.
+
+        Args:
+            line_idx (int): Index of the line.
+            line (str): Line whose first non-space character is either a letter or a hyphen.
+            comments_above (Mapping[int, Sequence[str]]): Comment blocks ending in the previous line, indexed by the
+                column where their `#` is.
+            comments_below (dict[int, list[_KeyLine]]): Keys whose block of comments below is still being read,
+                indexed by the column where it must start.
+        """
+        key = self._extract_key_from_line(line)
+        if not key:
+            return None
+        key_line = _KeyLine(
+            line_idx=line_idx,
+            key=key,
+            spacing=_LEADING_SPACING.match(line).end(),  # type: ignore[union-attr]
+            is_first_element_within_list=line.lstrip()[0] == "-",
+        )
+        if "side" in self.comments_are:
+            key_line.comments["side"] = self._extract_side_comment(line)
+        if (
+            "above" in self.comments_are or "below" in self.comments_are
+        ) and self._find_first_occurrence_that_is_not_between(line, ":"):
+            column = _BLOCK_COMMENT_COLUMN.match(line).end()  # type: ignore[union-attr]
+            if "above" in self.comments_are:
+                key_line.comments["above"] = self._join_block_comment(comments_above.get(column, ()))
+            if "below" in self.comments_are:
+                key_line.reading_comments_below = True
+                comments_below.setdefault(column, []).append(key_line)
+                return key_line
+        return key_line if any(key_line.comments.values()) else None
+
+    def _join_block_comment(self, lines: Sequence[str]) -> str:
+        """Join the lines of a comment above or below a key, removing any triple quotes.
+
+        Example:
+            # Comment above
+            key: value
+            # Comment below
+            # that can be multiple lines
+        """
+        if not lines:
+            return ""
+        string = self._join_multi_line_comments(lines).replace("'''", "").replace('"""', "")
+        return self._capitalize_only_first_letter(string)
+
+    def _create_comment(self, key_line: _KeyLine, *, indentation: Literal["spaces", "tabs"]) -> Comment:
+        """Create the comment of a key, merging all the ones found for it in the order given by `comments_are`."""
+        if "below" in self.comments_are:
+            key_line.comments["below"] = self._join_block_comment(key_line.comments_below)
+        strings = (key_line.comments.get(comments_are, "") for comments_are in self.comments_are)
+        return Comment(
+            full_string="\n\n".join(string for string in strings if string),
+            key_line=key_line.line_idx,
+            spacing_element=(indentation, key_line.spacing),
+            associated_with_key=key_line.key,
+            must_replace_its_key_as_first_element_of_list=key_line.is_first_element_within_list,
+        )
 
     @staticmethod
     def _format_comment_as_multiline_yaml(comment: Comment) -> str:
@@ -372,56 +426,48 @@ class YamlFileModifier:
         multiple_indentation = indent * (comment.spacing_element[1] + 1)
         return f"\n{multiple_indentation}".join(lines)
 
-    @staticmethod
-    def _merge_comments(comments: Sequence[Comment]) -> tuple[Comment, ...]:
-        """
-        Merge comments that are associated with the same key.
-
-        This can heppen if the user requests to read from "below" and "side" for example.
-        """
-        comments_in_line: Mapping[int, list[Comment]] = defaultdict(list)
-        for comment in comments:
-            comments_in_line[comment.key_line].append(comment)
-
-        merged_comments: list[Comment] = []
-        for comments_lst in comments_in_line.values():
-            string = "\n\n".join(comment.full_string for comment in comments_lst)
-            merged_comments.append(
-                Comment(
-                    full_string=string,
-                    key_line=comments_lst[0].key_line,
-                    associated_with_key=comments_lst[0].associated_with_key,
-                    spacing_element=comments_lst[0].spacing_element,
-                    must_replace_its_key_as_first_element_of_list=any(
-                        comment.must_replace_its_key_as_first_element_of_list for comment in comments_lst
-                    ),
-                )
-            )
-        return tuple(merged_comments)
-
-    def _create_temporary_string_with_comments_as_keys(self) -> str:
-        """Create the YAML-based string representation of the new dictionary containing new doc-based keys."""
-        comments = self._extract_comments()
-        reverse_order_comments = sorted(comments, key=lambda comment: comment.key_line, reverse=True)
-        new_lines = list(self.lines).copy()
-        for comment in reverse_order_comments:
+    def _write_with_comments_as_keys(self, file: TextIO) -> None:
+        """Stream the lines of the file into `file`, writing the new doc-based keys right before their keys."""
+        for line_idx, (line, comment) in enumerate(self._iter_lines_with_comments()):
+            if line_idx:
+                file.write("\n")
+            if comment is None:
+                file.write(line)
+                continue
             key = self.prefix + comment.associated_with_key
-            string = f"{comment.spacing}{key}: |{self._format_comment_as_multiline_yaml(comment)}"
+            file.write(f"{comment.spacing}{key}: |{self._format_comment_as_multiline_yaml(comment)}\n")
             if comment.must_replace_its_key_as_first_element_of_list:
-                new_lines[comment.key_line] = new_lines[comment.key_line].replace("-", " ", 1)
-            new_lines.insert(comment.key_line, string)
-        return "\n".join(new_lines)
+                line = line.replace("-", " ", 1)
+            file.write(line)
 
     def create_temporary_file_with_comments_as_keys(self) -> Path:
         """Create a new YAML file with new keys containing the documentation.
 
         This method creates a new YAML file by converting the comments in the original file into keys in the new file.
-        The comments are extracted from the original file and added as keys in the new file.
+        The comments are extracted from the original file and added as keys in the new file. Each call creates its own
+        file (ending with the name of the original one), so concurrent calls never overwrite each other's files.
 
         Returns:
-            Path: The path to the newly created YAML file.
+            Path: The path to the newly created YAML file. It must be removed by the caller.
+        """
+        file_descriptor, name = tempfile.mkstemp(prefix="_", suffix=f"_{self.path.name}")
+        try:
+            with open(file_descriptor, "w") as file:
+                self._write_with_comments_as_keys(file)
+        except BaseException:
+            os.remove(name)
+            raise
+        return Path(name)
+
+    @contextmanager
+    def temporary_file_with_comments_as_keys(self) -> Iterator[Path]:
+        """Create a new YAML file with new keys containing the documentation, removing it when exiting the context.
+
+        See `create_temporary_file_with_comments_as_keys`.
         """
-        string = self._create_temporary_string_with_comments_as_keys()
-        path = Path(tempfile.gettempdir()) / f"_{self.path.name}"
-        path.write_text(string)
-        return path
+        path = self.create_temporary_file_with_comments_as_keys()
+        try:
+            yield path
+        finally:
+            with suppress(OSError):
+                os.remove(path)
@@ -1,28 +1,65 @@
+import hashlib
+import json
 import os
-from collections.abc import Sequence
+import re
+import sqlite3
+import sys
+import threading
+import time
+import zipfile
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from types import BuiltinFunctionType, CodeType
 from typing import (
+    IO,
     Any,
     Callable,
+    Final,
     Optional,
     TypeVar,
     Union,
 )
 
-from lazy_type_hint.data_type_tree import DataTypeTree
+from lazy_type_hint.data_type_tree import (
+    DataTypeTree,
+    SchemaChange,
+    data_type_tree_factory,
+    diff_data_type_trees,
+    dump_data_type_tree,
+    get_fingerprint,
+    iter_modules,
+    iter_modules_of_trees,
+    load_data_type_tree,
+    share_identical_nodes,
+)
 from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
-from lazy_type_hint.file_modifiers.yaml_file_modifier import YAML_COMMENTS_POSITION
+from lazy_type_hint.data_type_tree.generic_type.set_and_sequence_operations import InferredElements
+from lazy_type_hint.data_type_tree.generic_type.union_data_type_tree import Alternatives
+from lazy_type_hint.data_type_tree.package import SPLIT_STRATEGIES
+from lazy_type_hint.data_type_tree.serialization import SERIALIZATION_VERSION
+from lazy_type_hint.file_modifiers.yaml_file_modifier import (
+    YAML_COMMENTS_POSITION,
+    YamlFileModifier,
+    YamlFileModifierError,
+)
 from lazy_type_hint.generators.lazy_type_hint_abc import LazyTypeHintABC
+from lazy_type_hint.generators.lazy_type_hint_abc import LazyTypeHintError as LazyTypeHintError
 from lazy_type_hint.strategies import ParsingStrategies
-
-
-class LazyTypeHintError(Exception):
-    """Raised by `LazyTypeHint` class."""
+from lazy_type_hint.utils.file_cache import FileCache
+from lazy_type_hint.utils.file_writer import write_file_if_changed
+from lazy_type_hint.utils.import_manager import ImportManager
+from lazy_type_hint.utils.xml_reader import read_xml_file
 
 
 PathT = TypeVar("PathT", str, Path)
 
+_SQLITE_QUERY_VIEW: Final = "_lazy_type_hint_query"
+"""Name of the temporary view created to read the declared types of the columns of a query."""
+
 
 @dataclass(frozen=True)
 class Tree:
@@ -31,7 +68,20 @@ class Tree:
     def to_string(self, *, include_imports: bool = True) -> str:
         return self._tree.get_str_all_nodes(include_imports=include_imports)
 
-    def to_file(self, path_to_py: Union[Path, str], *, create_non_existing_dir: bool = False) -> None:
+    def to_file(self, path_to_py: Union[Path, str], *, create_non_existing_dir: bool = False) -> bool:
+        """Write the type hints into a file.
+
+        The file is written atomically and only if its content changed, so that unchanged files keep their
+        modification time and are not checked again by type checkers or build tools.
+
+        Args:
+            path_to_py (Union[Path, str]): Path to the file.
+            create_non_existing_dir (bool, optional): Whether to create the parent directory if it does not exist.
+                Defaults to False.
+
+        Returns:
+            bool: Whether the file was written.
+        """
         path_to_py = Path(path_to_py)
         if not path_to_py.parent.exists():
             if not create_non_existing_dir:
@@ -39,20 +89,309 @@ class Tree:
                     "The given directory does not exist and permissions to create the folder "
                     "(create_non_existing_dir input argument) were not set"
                 )
-            os.makedirs(path_to_py.parent)
-        path_to_py.write_text(self.to_string(include_imports=True))
+            os.makedirs(path_to_py.parent, exist_ok=True)
+        return write_file_if_changed(path_to_py, partial(self.write, include_imports=True))
+
+    @staticmethod
+    def write_many(
+        trees: Union[Mapping[Path, "Tree"], Mapping[str, "Tree"]], *, create_non_existing_dir: bool = False
+    ) -> list[Path]:
+        """Write multiple trees into their files. See `to_file`.
+
+        Args:
+            trees (Union[Mapping[Path, Tree], Mapping[str, Tree]]): Trees to write, indexed by the path of their file.
+            create_non_existing_dir (bool, optional): Whether to create the parent directories that do not exist.
+                Defaults to False.
+
+        Returns:
+            list[Path]: Paths of the files that were written. Those whose content did not change are not included.
+        """
+        paths = {Path(path): tree for path, tree in trees.items()}
+        for directory in {path.parent for path in paths}:
+            if not directory.exists():
+                if not create_non_existing_dir:
+                    raise ValueError(
+                        f"The directory {directory} does not exist and permissions to create the folder "
+                        "(create_non_existing_dir input argument) were not set"
+                    )
+                os.makedirs(directory, exist_ok=True)
+        return [
+            path
+            for path, tree in paths.items()
+            if write_file_if_changed(path, partial(tree.write, include_imports=True))
+        ]
+
+    def to_package(
+        self,
+        path_to_dir: Union[Path, str],
+        *,
+        split_by: SPLIT_STRATEGIES = "key",
+        max_module_size: int = 100_000,
+        create_non_existing_dir: bool = False,
+    ) -> list[Path]:
+        """Write the type hints into a package made of multiple modules.
+
+        Very large outputs slow down type checkers and IDEs, which have to check a single huge file every time it
+        changes. Each module imports only what it uses and an `__init__` module re-exports all names, so they can be
+        imported from the package as if it was a single file. As with `to_file`, only the modules that changed are
+        written.
+
+        Args:
+            path_to_dir (Union[Path, str]): Path to the directory of the package.
+            split_by (SPLIT_STRATEGIES, optional): If "key", there will be a module for each child of the root node
+                (e.g. each top-level key of a dictionary). If "size", modules will not exceed `max_module_size`
+                characters. Defaults to "key".
+            max_module_size (int, optional): Maximum size of each module when splitting by size. Defaults to 100_000.
+            create_non_existing_dir (bool, optional): Whether to create the directory if it does not exist.
+                Defaults to False.
+
+        Returns:
+            list[Path]: Paths of the modules that were written. Those whose content did not change are not included.
+        """
+        path_to_dir = Path(path_to_dir)
+        if not path_to_dir.exists():
+            if not create_non_existing_dir:
+                raise ValueError(
+                    "The given directory does not exist and permissions to create the folder "
+                    "(create_non_existing_dir input argument) were not set"
+                )
+            os.makedirs(path_to_dir, exist_ok=True)
+        paths: list[Path] = []
+        for module in iter_modules(self._tree, split_by=split_by, max_module_size=max_module_size):
+            path = path_to_dir / f"{module.name}.py"
+            if write_file_if_changed(path, partial(_write_string, module.content)):
+                paths.append(path)
+        return paths
+
+    def write(self, stream: IO[str], *, include_imports: bool = True) -> None:
+        """Write the type hints into a text stream.
+
+        The content is the same as the one returned by `to_string`, but it is written as it is built instead of being
+        held in memory as a whole.
+        """
+        self._tree.write_all_nodes(stream, include_imports=include_imports)
+
+    def fingerprint(self, *, include_docstrings: bool = True) -> str:
+        """Get a stable fingerprint that identifies the type hints of the tree without rendering them.
+
+        Fingerprints can be stored and compared across different sessions to check whether the type hints changed.
+
+        Args:
+            include_docstrings (bool, optional): If False, trees that only differ in their docstrings will share the
+                same fingerprint. Defaults to True.
+        """
+        return get_fingerprint(self._tree, include_docstrings=include_docstrings)
+
+    def diff(self, new: "Tree") -> list[SchemaChange]:
+        """Get the structural changes (such as added keys or widened unions) needed to go from this tree to `new`.
+
+        Names and docstrings are not taken into account. Empty if both trees share the same structure.
+        """
+        return diff_data_type_trees(self._tree, new._tree)
+
+    def dumps(self) -> str:
+        """Serialize the tree into a compact JSON string that can be loaded back without the original data."""
+        return json.dumps(dump_data_type_tree(self._tree), separators=(",", ":"))
+
+    def dump(self, path: Union[Path, str]) -> None:
+        """Serialize the tree into a file. See `dumps`."""
+        Path(path).write_text(self.dumps(), encoding="utf-8")
+
+    @classmethod
+    def loads(cls, string: str, *, strategies: Optional[ParsingStrategies] = None) -> "Tree":
+        """Load a tree serialized with `dumps`.
+
+        Args:
+            string (str): Serialized tree.
+            strategies (Optional[ParsingStrategies], optional): Strategies used to render the loaded tree. Only those
+                affecting how the tree is rendered (and not how the data was parsed) will have an effect. Defaults to
+                the ones used to create the tree.
+        """
+        return cls(load_data_type_tree(json.loads(string), strategies=strategies))
+
+    @classmethod
+    def load(cls, path: Union[Path, str], *, strategies: Optional[ParsingStrategies] = None) -> "Tree":
+        """Load a tree serialized with `dump`. See `loads`."""
+        return cls.loads(Path(path).read_text(encoding="utf-8"), strategies=strategies)
+
+
+@dataclass(frozen=True)
+class DirectoryTrees:
+    """Trees inferred from the files of a directory. See `LazyTypeHint.from_directory`."""
+
+    trees: dict[Path, Tree]
+    """Tree of each file, indexed by its path relative to the directory."""
+    timings: dict[Path, float]
+    """Seconds spent loading and parsing each file, indexed by its path relative to the directory."""
+
+    def to_package(self, path_to_dir: Union[Path, str], *, create_non_existing_dir: bool = False) -> list[Path]:
+        """Write the type hints into a package with a module per file.
+
+        Definitions shared by multiple files are only written once, in a `_shared` module from which the modules of
+        the files import them. An `__init__` module re-exports all names. As with `Tree.to_file`, only the modules
+        that changed are written.
+
+        Args:
+            path_to_dir (Union[Path, str]): Path to the directory of the package.
+            create_non_existing_dir (bool, optional): Whether to create the directory if it does not exist.
+                Defaults to False.
+
+        Returns:
+            list[Path]: Paths of the modules that were written. Those whose content did not change are not included.
+        """
+        path_to_dir = Path(path_to_dir)
+        if not path_to_dir.exists():
+            if not create_non_existing_dir:
+                raise ValueError(
+                    "The given directory does not exist and permissions to create the folder "
+                    "(create_non_existing_dir input argument) were not set"
+                )
+            os.makedirs(path_to_dir, exist_ok=True)
+        paths: list[Path] = []
+        for module in iter_modules_of_trees([tree._tree for tree in self.trees.values()]):
+            path = path_to_dir / f"{module.name}.py"
+            if write_file_if_changed(path, partial(_write_string, module.content)):
+                paths.append(path)
+        return paths
+
+
+def _write_string(string: str, stream: IO[str]) -> None:
+    stream.write(string)
+
+
+def _get_class_name(relative_path: Path, *, names_taken: set[str]) -> str:
+    """Get a unique class name in camel case from the path of a file, without its suffix."""
+    parts = re.split(r"[^0-9a-zA-Z]+", str(relative_path.with_suffix("")))
+    name = "".join(part[:1].upper() + part[1:] for part in parts)
+    if not name or name[0].isnumeric():
+        name = f"File{name}"
+    unique_name = name
+    count = 2
+    while unique_name in names_taken:
+        unique_name = f"{name}{count}"
+        count += 1
+    names_taken.add(unique_name)
+    return unique_name
+
+
+def _get_loader_identity(loader: Callable[..., object]) -> Optional[str]:
+    """Get a string identifying what a loader does, or None if it cannot be identified.
+
+    Functions (including lambdas) are identified by their name and their code, so that different functions with the
+    same name do not share the same identity. Values they capture (from closures, defaults or the arguments of a
+    `functools.partial`) are also part of it, but only if they are constants, such as strings or numbers, as the rest
+    might change without changing their representation. Other callables cannot be identified.
+    """
+    if isinstance(loader, partial):
+        values: tuple[object, ...] = (*loader.args, *sorted(loader.keywords.items()))
+        func_identity = _get_loader_identity(loader.func)
+        if func_identity is None or not _are_constants(values):
+            return None
+        return f"{func_identity}:partial{values!r}"
+    if isinstance(loader, BuiltinFunctionType):
+        return f"{loader.__module__}:{loader.__qualname__}"
+    code = getattr(loader, "__code__", None)
+    if not isinstance(code, CodeType):
+        return None
+    closure = tuple(cell.cell_contents for cell in getattr(loader, "__closure__", None) or ())
+    keyword_defaults = getattr(loader, "__kwdefaults__", None) or {}
+    defaults = (getattr(loader, "__defaults__", None), tuple(sorted(keyword_defaults.items())))
+    if not _are_constants((*closure, *defaults)):
+        return None
+    code_hash = hashlib.sha256()
+    _update_hash_with_code(code_hash, code)
+    return f"{loader.__module__}:{loader.__qualname__}:{code_hash.hexdigest()}:{closure!r}:{defaults!r}"
+
+
+def _are_constants(values: Iterable[object]) -> bool:
+    """Whether all values are immutable values of builtin types (e.g. strings, numbers or tuples of them)."""
+    for value in values:
+        if isinstance(value, (tuple, frozenset)):
+            if not _are_constants(value):
+                return False
+        elif value is not None and type(value) not in (str, bytes, int, float, complex, bool):
+            return False
+    return True
+
+
+def _update_hash_with_code(code_hash: "hashlib._Hash", code: CodeType) -> None:
+    """Hash the bytecode and the constants of a code object, including those of the code objects it holds."""
+    code_hash.update(code.co_code)
+    code_hash.update(repr(code.co_names).encode())
+    for constant in code.co_consts:
+        if isinstance(constant, CodeType):
+            _update_hash_with_code(code_hash, constant)
+        else:
+            code_hash.update(repr(constant).encode())
+
+
+def _get_group_key(value: object) -> tuple[type, object]:
+    """Get the key of the group of documents with the given value, by its string if the value is not hashable."""
+    try:
+        hash(value)
+    except TypeError:
+        return type(value), str(value)
+    return type(value), value
+
+
+def _get_errors_with_comments_as_keys() -> tuple[type[Exception], ...]:
+    """Get the errors expected when loading a YAML file after writing its comments as keys.
+
+    Besides the errors writing the file, these are the errors raised for invalid YAML by the YAML libraries that have
+    been imported (e.g. by the loader), as the new keys might not be valid for them.
+    """
+    modules = (sys.modules.get(name) for name in ("yaml", "ruamel.yaml"))
+    yaml_errors = tuple(module.YAMLError for module in modules if module is not None and hasattr(module, "YAMLError"))
+    return (YamlFileModifierError, OSError, *yaml_errors)
+
+
+def _get_values_with_affinity(declared_type: str) -> tuple[object, ...]:
+    """Get values with the types that SQLite stores in a column with the given declared type.
+
+    See https://www.sqlite.org/datatype3.html#determination_of_column_affinity. Columns without any declared type
+    can hold values of any type, so no values are returned for them.
+    """
+    declared_type = declared_type.upper()
+    if "INT" in declared_type:
+        return (0,)
+    if any(name in declared_type for name in ("CHAR", "CLOB", "TEXT")):
+        return ("",)
+    if not declared_type:
+        return ()
+    if "BLOB" in declared_type:
+        return (b"",)
+    if any(name in declared_type for name in ("REAL", "FLOA", "DOUB")):
+        return (0.0,)
+    return (0, 0.0)
 
 
 class LazyTypeHint(LazyTypeHintABC):
     strategies: ParsingStrategies
     """Strategies to follow when parsing the objects."""
+    cache: Optional[FileCache]
+    """Cache where the trees inferred from files are stored (if any)."""
 
     def __init__(
         self,
         strategies: ParsingStrategies = ParsingStrategies(),  # noqa: B008
+        *,
+        cache_dir: Optional[Union[str, Path]] = None,
+        cache_max_size: int = 100 * 1024**2,
         **kwargs: Any,
     ) -> None:
+        """Initialize the generator.
+
+        Args:
+            strategies (ParsingStrategies, optional): Strategies to follow when parsing the objects.
+            cache_dir (Optional[Union[str, Path]], optional): Directory used to cache the trees inferred from files.
+                Entries are looked up by the content of the file, the loader and the strategies used, so that files
+                that did not change are neither loaded nor parsed again. Defaults to None (no cache).
+            cache_max_size (int, optional): Maximum size, in bytes, of the cache. Least recently used entries are
+                removed when exceeded. Defaults to 100 MB.
+            **kwargs (Any): Not used.
+        """
         self.strategies = strategies
+        self.cache = None if cache_dir is None else FileCache(cache_dir, max_size=cache_max_size)
 
     def from_yaml_file(
         self,
@@ -63,7 +402,146 @@ class LazyTypeHint(LazyTypeHintABC):
         comments_are: Optional[Union[YAML_COMMENTS_POSITION, Sequence[YAML_COMMENTS_POSITION]]] = "side",
         **kwargs: Any,
     ) -> Tree:
-        return super().from_yaml_file(loader=loader, path=path, class_name=class_name, comments_are=comments_are)  # type: ignore
+        key = self._get_cache_key(loader, path, class_name=class_name, comments_are=comments_are)
+        if self.cache is None or key is None:
+            return super().from_yaml_file(loader=loader, path=path, class_name=class_name, comments_are=comments_are)  # type: ignore
+        return self._get_cached_tree(
+            self.cache,
+            key,
+            partial(super().from_yaml_file, loader=loader, path=path, class_name=class_name, comments_are=comments_are),
+        )
+
+    def from_yaml_documents(
+        self,
+        loader: Callable[[PathT], Iterable[object]],
+        path: PathT,
+        *,
+        class_name: str,
+        comments_are: Optional[Union[YAML_COMMENTS_POSITION, Sequence[YAML_COMMENTS_POSITION]]] = "side",
+        group_by_key: Optional[str] = None,
+    ) -> Tree:
+        """Generate the type hints of the documents of a multi-document YAML file, as a list of documents.
+
+        Documents are merged as they are loaded, keeping only the first one of each different structure, so `loader`
+        should iterate them lazily (e.g. with `yaml.safe_load_all`) for the file not to be loaded at once. As with
+        `from_yaml_file`, comments are used as docstrings of the document they belong to.
+
+        Args:
+            loader (Callable[[PathT], Iterable[object]]): Function that iterates the documents of the given file.
+            path (PathT): Path to the YAML file.
+            class_name (str): Name of the generated type.
+            comments_are (Optional[Union[YAML_COMMENTS_POSITION, Sequence[YAML_COMMENTS_POSITION]]], optional):
+                Position of the comments used as docstrings. None to ignore them. Defaults to "side".
+            group_by_key (Optional[str], optional): If given, documents are grouped by the value of this key (such as
+                `kind` in Kubernetes manifests) and type hinted as a dictionary with the list of documents of each
+                group. Documents without this key are grouped under "None". Defaults to None (no groups).
+        """
+        key = self._get_cache_key(
+            loader, path, class_name=class_name, comments_are=comments_are, extra=("documents", repr(group_by_key))
+        )
+        if self.cache is None or key is None:
+            return self._load_yaml_documents(
+                loader, path, class_name=class_name, comments_are=comments_are, group_by_key=group_by_key
+            )
+        return self._get_cached_tree(
+            self.cache,
+            key,
+            partial(
+                self._load_yaml_documents,
+                loader,
+                path,
+                class_name=class_name,
+                comments_are=comments_are,
+                group_by_key=group_by_key,
+            ),
+        )
+
+    def _load_yaml_documents(
+        self,
+        loader: Callable[[PathT], Iterable[object]],
+        path: PathT,
+        *,
+        class_name: str,
+        comments_are: Optional[Union[YAML_COMMENTS_POSITION, Sequence[YAML_COMMENTS_POSITION]]],
+        group_by_key: Optional[str],
+    ) -> Tree:
+        if comments_are is not None:
+            yaml_file_modifier = YamlFileModifier(path, comments_are=comments_are)
+            # Documents are merged again from scratch without comments if the ones with comments cannot be loaded
+            try:
+                with yaml_file_modifier.temporary_file_with_comments_as_keys() as new_path:
+                    documents = loader(type(path)(new_path))
+                    return self._merge_yaml_documents(documents, class_name=class_name, group_by_key=group_by_key)
+            except _get_errors_with_comments_as_keys():
+                pass
+        return self._merge_yaml_documents(loader(path), class_name=class_name, group_by_key=group_by_key)
+
+    def _merge_yaml_documents(
+        self, documents: Iterable[object], *, class_name: str, group_by_key: Optional[str]
+    ) -> Tree:
+        """Keep the first document of each different structure (within each group, if `group_by_key` is given).
+
+        The trees of the kept documents are used as the elements of the list, so that documents are only inferred once.
+        Groups are indexed by the string of the value of `group_by_key`. Values whose strings are the same (such as
+        `None` and `"None"`) are still different groups, indexed by their string followed by the name of their type.
+        """
+        imports = ImportManager()
+        depth = 1 if group_by_key is None else 2
+        groups: dict[tuple[type, object], dict[DataTypeTree, None]] = {}
+        for document in documents:
+            group = document.get(group_by_key) if group_by_key is not None and isinstance(document, Mapping) else None
+            tree = data_type_tree_factory(
+                document, name=class_name, imports=imports, depth=depth, strategies=self.strategies
+            )
+            groups.setdefault(_get_group_key(group), {}).setdefault(tree)
+        if group_by_key is None:
+            data: object = InferredElements(groups.get(_get_group_key(None), ()))
+        else:
+            n_groups_per_name = Counter(str(value) for _, value in groups)
+            data = {
+                str(value) if n_groups_per_name[str(value)] == 1 else f"{value} ({type_.__name__})": InferredElements(
+                    trees
+                )
+                for (type_, value), trees in groups.items()
+            }
+        return Tree(data_type_tree_factory(data, name=class_name, imports=imports, strategies=self.strategies))
+
+    def _get_cached_tree(self, cache: FileCache, key: str, create_tree: Callable[[], Tree]) -> Tree:
+        """Get the tree stored in the cache under the given key, creating and storing it if not found."""
+        serialized = cache.get(key)
+        if serialized is not None:
+            return Tree.loads(serialized, strategies=self.strategies)
+        tree = create_tree()
+        cache.set(key, tree.dumps())
+        return tree
+
+    def _get_cache_key(
+        self,
+        loader: Callable[[PathT], object],
+        path: PathT,
+        *,
+        class_name: str,
+        comments_are: Optional[Union[YAML_COMMENTS_POSITION, Sequence[YAML_COMMENTS_POSITION]]],
+        extra: Sequence[str] = (),
+    ) -> Optional[str]:
+        """Get the key of the tree of a file within the cache, or None if it cannot be cached.
+
+        Trees are not cached if there is no cache or if the loader cannot be identified. See `_get_loader_identity`.
+        """
+        loader_identity = _get_loader_identity(loader) if self.cache is not None else None
+        if loader_identity is None:
+            return None
+        if not isinstance(comments_are, str) and comments_are is not None:
+            comments_are = tuple(comments_are)
+        return FileCache.create_key(
+            Path(path).read_bytes(),
+            loader_identity,
+            repr(self.strategies),
+            repr(comments_are),
+            class_name,
+            str(SERIALIZATION_VERSION),
+            *extra,
+        )
 
     def from_data(
         self,
@@ -73,3 +551,347 @@ class LazyTypeHint(LazyTypeHintABC):
         **kwargs: Any,
     ) -> Tree:
         return Tree(super().from_data(data=data, class_name=class_name))
+
+    def from_csv_file(
+        self,
+        path: Union[Path, str],
+        *,
+        class_name: str,
+        chunksize: int = 100_000,
+        max_rows: Optional[int] = None,
+    ) -> Tree:
+        """Generate the type hints of the data frame stored in a CSV file, reading it in chunks.
+
+        Only one chunk is held in memory at a time. The dtypes of the chunks are widened as `pd.read_csv` does when
+        reading the whole file (e.g. integers and floats into floats), so that type hints are the same as the ones of
+        the whole data frame. Only `check_max_n_elements_within_container` rows are kept from each chunk, and only if
+        they change the dtype of any column.
+
+        Args:
+            path (Union[Path, str]): Path to the CSV file.
+            class_name (str): Name of the generated type.
+            chunksize (int, optional): Number of rows read at a time. Defaults to 100_000.
+            max_rows (Optional[int], optional): Maximum number of rows to read. Defaults to None (all of them).
+        """
+        import pandas as pd
+
+        from lazy_type_hint.data_type_tree.generic_type.pandas_data_frame_data_type_tree import fold_data_frames
+
+        with pd.read_csv(path, chunksize=chunksize, nrows=max_rows) as chunks:
+            data = fold_data_frames(chunks, n_rows=self.strategies.check_max_n_elements_within_container)
+        return self.from_data(data, class_name=class_name)
+
+    def from_sqlite(
+        self,
+        connection_or_path: Union[sqlite3.Connection, Path, str],
+        table_or_query: str,
+        *,
+        class_name: str,
+    ) -> Tree:
+        """Generate the type hints of the rows of a SQLite table or query, as a `TypedDict`.
+
+        Only `check_max_n_elements_within_container` rows are fetched. As SQLite allows any column to hold values of
+        any type, types are taken from those rows. Columns without rows (or with only `NULL` values) are type hinted
+        from their declared types instead, following SQLite's type affinity rules. `Optional` is used for columns
+        that are not declared as `NOT NULL` or, for views and queries, for those holding `NULL`. Columns must have
+        different names.
+
+        Args:
+            connection_or_path (Union[sqlite3.Connection, Path, str]): Connection or path to the database. Databases
+                given by their path are opened in read-only mode.
+            table_or_query (str): Name of a table (or view), or a query returning the rows.
+            class_name (str): Name of the generated type.
+        """
+        if isinstance(connection_or_path, sqlite3.Connection):
+            return self.from_data(self._get_sqlite_row(connection_or_path, table_or_query), class_name=class_name)
+        connection = sqlite3.connect(f"{Path(connection_or_path).resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            return self.from_data(self._get_sqlite_row(connection, table_or_query), class_name=class_name)
+        finally:
+            connection.close()
+
+    def from_directory(
+        self,
+        root: Union[Path, str],
+        *,
+        pattern: str = "**/*.json",
+        loader: Optional[Callable[[Path], object]] = None,
+        workers: Optional[int] = None,
+        comments_are: Optional[Union[YAML_COMMENTS_POSITION, Sequence[YAML_COMMENTS_POSITION]]] = "side",
+    ) -> DirectoryTrees:
+        """Generate the type hints of all the files within a directory, loading and parsing them in parallel.
+
+        Files are type hinted as with their `from_*` method (e.g. `from_yaml_file` or `from_csv_file`). JSON, CSV,
+        XML and numpy files are loaded without any `loader`, while YAML files and files with other formats need one.
+        Each file gets a class name built from its path (e.g. `configs/users.json` becomes `ConfigsUsers`). Nodes
+        with the same structure in multiple files are given the same name, so that they are written only once by
+        `DirectoryTrees.to_package`.
+
+        Files are distributed among `workers` processes, so `loader` must be picklable (e.g. a function defined at the
+        top level of a module) and, on platforms that spawn processes, the call must be guarded by
+        `if __name__ == "__main__":`.
+
+        Args:
+            root (Union[Path, str]): Directory holding the files.
+            pattern (str, optional): Glob pattern, relative to `root`, of the files to type hint. Defaults to
+                "**/*.json".
+            loader (Optional[Callable[[Path], object]], optional): Function that loads the data of a file. Defaults to
+                None (the format is given by the suffix of each file).
+            workers (Optional[int], optional): Number of processes. If 1, files are processed within the current
+                process. Defaults to None (as many as processors).
+            comments_are (Optional[Union[YAML_COMMENTS_POSITION, Sequence[YAML_COMMENTS_POSITION]]], optional):
+                Position of the comments of YAML files used as docstrings. None to ignore them. Defaults to "side".
+        """
+        root = Path(root)
+        relative_paths = sorted(path.relative_to(root) for path in root.glob(pattern) if path.is_file())
+        names_taken: set[str] = set()
+        class_names = [_get_class_name(path, names_taken=names_taken) for path in relative_paths]
+        jobs = [(root / path, class_name, loader) for path, class_name in zip(relative_paths, class_names)]
+        results = self._from_files_timed(jobs, workers=workers, comments_are=comments_are)
+        return DirectoryTrees(
+            trees={path: tree for path, (tree, _) in zip(relative_paths, results)},
+            timings={path: seconds for path, (_, seconds) in zip(relative_paths, results)},
+        )
+
+    def watch(
+        self,
+        outputs: Mapping[Union[Path, str], Union[Path, str]],
+        *,
+        loader: Optional[Callable[[Path], object]] = None,
+        comments_are: Optional[Union[YAML_COMMENTS_POSITION, Sequence[YAML_COMMENTS_POSITION]]] = "side",
+        poll_interval: float = 1.0,
+        debounce: float = 0.5,
+        stop: Optional[threading.Event] = None,
+        on_update: Optional[Callable[[list[Path]], None]] = None,
+        on_error: Optional[Callable[[Path, Exception], None]] = None,
+    ) -> None:
+        """Write the type hints of a set of files and keep them up to date as the files change.
+
+        Files are polled (without any external service) and only those that changed are loaded and parsed again.
+        Outputs are only written if the fingerprint of their type hints changed. Bursts of changes are gathered until
+        no change is seen for `debounce` seconds. This method runs until `stop` is set. See `Watch`.
+
+        Args:
+            outputs (Mapping[Union[Path, str], Union[Path, str]]): Path of the `.py` file where the type hints of
+                each watched file are written, indexed by the path of the watched file. The class name of each file
+                is built from its name (e.g. `config.yaml` becomes `Config`).
+            loader (Optional[Callable[[Path], object]], optional): Function that loads the data of a file. See
+                `from_directory`. Defaults to None (the format is given by the suffix of each file).
+            comments_are (Optional[Union[YAML_COMMENTS_POSITION, Sequence[YAML_COMMENTS_POSITION]]], optional):
+                Position of the comments of YAML files used as docstrings. None to ignore them. Defaults to "side".
+            poll_interval (float, optional): Seconds between polls. Defaults to 1.
+            debounce (float, optional): Seconds without changes needed to update the files that changed. Defaults
+                to 0.5.
+            stop (Optional[threading.Event], optional): Event that stops watching once set. Defaults to None (watch
+                until interrupted).
+            on_update (Optional[Callable[[list[Path]], None]], optional): Called with the outputs written after each
+                update. Defaults to None.
+            on_error (Optional[Callable[[Path, Exception], None]], optional): Called with the watched file and the
+                exception raised if it cannot be type hinted (e.g. while it is being edited), keeping its output as it
+                is. Defaults to None (exceptions are raised).
+        """
+        from lazy_type_hint.generators.watch import Watch
+
+        Watch(self, outputs, loader=loader, comments_are=comments_are).run(
+            poll_interval=poll_interval, debounce=debounce, stop=stop, on_update=on_update, on_error=on_error
+        )
+
+    def _from_file_timed(
+        self,
+        path: Path,
+        class_name: str,
+        *,
+        loader: Optional[Callable[[Path], object]],
+        comments_are: Optional[Union[YAML_COMMENTS_POSITION, Sequence[YAML_COMMENTS_POSITION]]],
+    ) -> tuple[Tree, float]:
+        """Generate the type hints of a file of any supported format, along with the seconds it took."""
+        start = time.perf_counter()
+        suffix = path.suffix.lower()
+        if suffix in (".yaml", ".yml"):
+            if loader is None:
+                raise LazyTypeHintError(f"A loader is needed to type hint YAML files: {path}")
+            tree = self.from_yaml_file(loader=loader, path=path, class_name=class_name, comments_are=comments_are)
+        elif loader is not None:
+            tree = self.from_data(loader(path), class_name=class_name)
+        elif suffix == ".json":
+            with open(path, encoding="utf-8") as file:
+                tree = self.from_data(json.load(file), class_name=class_name)
+        elif suffix == ".csv":
+            tree = self.from_csv_file(path, class_name=class_name)
+        elif suffix == ".xml":
+            tree = self.from_xml_file(path, class_name=class_name)
+        elif suffix == ".npy":
+            tree = self.from_npy_file(path, class_name=class_name)
+        elif suffix == ".npz":
+            tree = self.from_npz_file(path, class_name=class_name)
+        else:
+            raise LazyTypeHintError(f"A loader is needed to type hint files with the `{path.suffix}` suffix: {path}")
+        return tree, time.perf_counter() - start
+
+    def _from_file_timed_serialized(
+        self, path: Path, class_name: str, loader: Optional[Callable[[Path], object]], **kwargs: Any
+    ) -> tuple[str, float]:
+        """Same as `_from_file_timed`, but with the tree serialized so that it can be sent between processes."""
+        tree, seconds = self._from_file_timed(path, class_name, loader=loader, **kwargs)
+        return tree.dumps(), seconds
+
+    def _from_files_timed(
+        self,
+        jobs: Sequence[tuple[Path, str, Optional[Callable[[Path], object]]]],
+        *,
+        workers: Optional[int],
+        comments_are: Optional[Union[YAML_COMMENTS_POSITION, Sequence[YAML_COMMENTS_POSITION]]],
+    ) -> list[tuple[Tree, float]]:
+        """Generate the type hints of many files, along with the seconds each one took. See `_from_file_timed`.
+
+        Each job is given by the path of a file, its class name and its loader. Jobs are distributed among `workers`
+        processes (as many as processors if None), unless `workers` is 1 or there is a single job. Nodes with the same
+        structure in multiple files are given the same name. See `share_identical_nodes`.
+        """
+        if workers == 1 or len(jobs) <= 1:
+            results = [
+                self._from_file_timed(path, class_name, loader=loader, comments_are=comments_are)
+                for path, class_name, loader in jobs
+            ]
+        else:
+            # Trees are sent back serialized, as they are smaller than the data they were created from
+            infer_serialized = partial(self._from_file_timed_serialized, comments_are=comments_are)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunksize = max(1, len(jobs) // (4 * (workers or os.cpu_count() or 1)))
+                results = [
+                    (Tree.loads(serialized, strategies=self.strategies), seconds)
+                    for serialized, seconds in executor.map(infer_serialized, *zip(*jobs), chunksize=chunksize)
+                ]
+        if len(results) > 1:
+            share_identical_nodes([tree._tree for tree, _ in results])
+        return results
+
+    def _get_sqlite_row(self, connection: sqlite3.Connection, table_or_query: str) -> dict[str, Alternatives]:
+        """Get a row whose values hold, for each column, one value per type that the column can hold.
+
+        Types are taken from the sampled rows or, if none but `NULL` values were sampled, from the type declared for
+        the column. Columns are `Optional` if they are not declared as `NOT NULL` or, for views and queries (whose
+        columns do not tell so), if `NULL` values were sampled or if no rows were found.
+        """
+        kind = connection.execute(
+            "SELECT type FROM sqlite_master WHERE type IN ('table', 'view') AND name = ?", (table_or_query,)
+        ).fetchone()
+        declared_columns = self._get_sqlite_declared_columns(
+            connection, table_or_query, kind=None if kind is None else kind[0]
+        )
+        quoted_name = '"{}"'.format(table_or_query.replace('"', '""'))
+        cursor = connection.execute(f"SELECT * FROM {quoted_name}" if kind is not None else table_or_query)
+        columns = [description[0] for description in cursor.description]
+        repeated_columns = sorted({column for column in columns if columns.count(column) > 1})
+        if repeated_columns:
+            cursor.close()
+            raise LazyTypeHintError(
+                f"Columns must have different names to be type hinted as a dictionary: {', '.join(repeated_columns)}. "
+                "Rename them (e.g. with `AS`)."
+            )
+
+        n_rows = self.strategies.check_max_n_elements_within_container
+        values_per_column: defaultdict[int, dict[type[object], object]] = defaultdict(dict)
+        rows = cursor.fetchmany(n_rows) if n_rows is not None else iter(cursor)
+        for sampled_row in rows:
+            for position, value in enumerate(sampled_row):
+                values_per_column[position].setdefault(type(value), value)
+        cursor.close()
+        any_rows = bool(values_per_column)
+
+        row: dict[str, Alternatives] = {}
+        for position, column in enumerate(columns):
+            declared_type, not_null = declared_columns[position] if position < len(declared_columns) else ("", None)
+            sampled_values = values_per_column.get(position, {})
+            values = tuple(value for value in sampled_values.values() if value is not None)
+            values = values or _get_values_with_affinity(declared_type)
+            nullable = not not_null if not_null is not None else (type(None) in sampled_values or not any_rows)
+            if not values:
+                # Without any declared type, columns can hold values of any type
+                values = (None,) if type(None) in sampled_values else ()
+            elif nullable:
+                values = (*values, None)
+            row[column] = Alternatives(values)
+        return row
+
+    @staticmethod
+    def _get_sqlite_declared_columns(
+        connection: sqlite3.Connection, table_or_query: str, *, kind: Optional[str]
+    ) -> list[tuple[str, Optional[bool]]]:
+        """Get, for each column, its declared type and whether it is declared as `NOT NULL` (None if unknown).
+
+        The columns of a query are read from a temporary view created from it, if it can be created. Otherwise, no
+        columns are returned.
+
+        Args:
+            connection (sqlite3.Connection): Connection to the database.
+            table_or_query (str): Name of a table (or view), or a query.
+            kind (Optional[str]): `table` or `view` for tables and views, None for queries.
+        """
+        if kind is not None:
+            quoted_name = '"{}"'.format(table_or_query.replace('"', '""'))
+            return [
+                (declared_type, bool(not_null or primary_key) if kind == "table" else None)
+                for _, _, declared_type, not_null, _, primary_key in connection.execute(
+                    f"PRAGMA table_info({quoted_name})"
+                )
+            ]
+        try:
+            connection.execute(f"CREATE TEMP VIEW {_SQLITE_QUERY_VIEW} AS {table_or_query}")
+        except sqlite3.Error:
+            return []
+        try:
+            columns = connection.execute(f"PRAGMA temp.table_info({_SQLITE_QUERY_VIEW})")
+            return [(declared_type, None) for _, _, declared_type, *_ in columns]
+        finally:
+            connection.execute(f"DROP VIEW temp.{_SQLITE_QUERY_VIEW}")
+
+    def from_xml_file(self, path: Union[Path, str], *, class_name: str) -> Tree:
+        """Generate the type hints of the root element of an XML file.
+
+        Elements are streamed and cleared as soon as they are processed, so memory does not depend on the size of the
+        file. Elements with attributes or children are type hinted as dictionaries with a key per attribute and per
+        tag of their children (plus `text`, if they also hold any text), while the rest are type hinted as their text.
+        Children whose tag is repeated are gathered into a list, of which only `check_max_n_elements_within_container`
+        elements are kept.
+
+        Args:
+            path (Union[Path, str]): Path to the XML file.
+            class_name (str): Name of the generated type.
+        """
+        data = read_xml_file(path, max_n_repeated_elements=self.strategies.check_max_n_elements_within_container)
+        return self.from_data(data, class_name=class_name)
+
+    def from_npy_file(self, path: Union[Path, str], *, class_name: str) -> Tree:
+        """Generate the type hints of an array stored in a `.npy` file.
+
+        Only the header of the file (dtype and shape) is read, so the array is never loaded into memory. Type hints
+        are the same as the ones of the array, except for the elements of object arrays, which are type hinted with
+        `Any` as they would need to be unpickled.
+
+        Args:
+            path (Union[Path, str]): Path to the `.npy` file.
+            class_name (str): Name of the generated type.
+        """
+        from lazy_type_hint.data_type_tree.simple_data_type_tree.numpy_data_type_tree import read_array_header
+
+        with open(path, "rb") as stream:
+            return self.from_data(read_array_header(stream), class_name=class_name)
+
+    def from_npz_file(self, path: Union[Path, str], *, class_name: str) -> Tree:
+        """Generate the type hints of the arrays stored in a `.npz` file, as a dictionary indexed by their names.
+
+        Only the headers of the arrays are read. See `from_npy_file`.
+
+        Args:
+            path (Union[Path, str]): Path to the `.npz` file.
+            class_name (str): Name of the generated type.
+        """
+        from lazy_type_hint.data_type_tree.simple_data_type_tree.numpy_data_type_tree import read_array_header
+
+        arrays: dict[str, object] = {}
+        with zipfile.ZipFile(path) as archive:
+            for name in archive.namelist():
+                with archive.open(name) as stream:
+                    arrays[name[: -len(".npy")] if name.endswith(".npy") else name] = read_array_header(stream)
+        return self.from_data(arrays, class_name=class_name)
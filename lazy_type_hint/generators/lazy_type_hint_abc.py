@@ -67,13 +67,13 @@ class LazyTypeHintABC(ABC):
         if comments_are is None:
             return self.from_data(loader(path), class_name=class_name)
         yaml_file_modifier = YamlFileModifier(path, comments_are=comments_are)
-        original_data = loader(path)
         try:
-            new_path: PathT = type(path)(yaml_file_modifier.create_temporary_file_with_comments_as_keys())
-            potentially_modified_data = loader(new_path)
+            with yaml_file_modifier.temporary_file_with_comments_as_keys() as new_path:
+                potentially_modified_data = loader(type(path)(new_path))
             return self.from_data(potentially_modified_data, class_name=class_name)
         except Exception:  # noqa: BLE001
-            return self.from_data(original_data, class_name=class_name)
+            # The original file is only loaded if the one with comments as keys could not be used
+            return self.from_data(loader(path), class_name=class_name)
 
     def from_data(
         self,
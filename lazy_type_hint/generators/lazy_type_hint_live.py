@@ -1,3 +1,4 @@
+import json
 import os
 import re
 import shutil
@@ -18,7 +19,15 @@ from typing import (
 
 from typing_extensions import TypeAlias, override
 
-from lazy_type_hint.data_type_tree import DataTypeTree
+from lazy_type_hint.data_type_tree import (
+    DataTypeTree,
+    DataTypeTreeError,
+    SchemaChange,
+    diff_data_type_trees,
+    dump_data_type_tree,
+    get_fingerprint,
+    load_data_type_tree,
+)
 from lazy_type_hint.file_modifiers.py_file_modifier import PyFileModifier
 from lazy_type_hint.file_modifiers.yaml_file_modifier import YAML_COMMENTS_POSITION
 from lazy_type_hint.generators.lazy_type_hint_abc import LazyTypeHintABC
@@ -59,6 +68,10 @@ class LazyTypeHintLive(LazyTypeHintABC):
     """Path to the .pyi file associated to this same module."""
     _custom_class_dir_path: Final = _this_file_pyi_path.parent / "build"
     """Path where the new classes will be generated.c"""
+    _fingerprint_suffix: Final = ".fingerprint"
+    """Suffix of the files, stored next to each generated class, holding the fingerprints of its type hints."""
+    _tree_suffix: Final = ".tree.json"
+    """Suffix of the files, stored next to each generated class, holding the serialized tree it was generated from."""
 
     @final
     def __init__(
@@ -118,30 +131,68 @@ class LazyTypeHintLive(LazyTypeHintABC):
             raise LazyTypeHintLiveError(
                 f"Given class_name is not compatible with Python class naming conventions: {class_name}"
             )
-        custom_class_file_path = self._custom_class_dir_path / f"{class_name}.py"
-
-        if class_name in self._get_classes_added() and self.if_type_hint_exists == "validate":
-            string_representation = cast(
-                DataTypeTree, super().from_data(data=data, class_name=class_name)
-            ).get_str_all_nodes(make_parent_class_inherit_from_original_type=False)
-            if self._remove_docstrings(string_representation) != self._remove_docstrings(
-                custom_class_file_path.read_text(encoding="utf-8")
-            ):
+        classes_added = self._get_classes_added()
+        tree = cast(DataTypeTree, super().from_data(data=data, class_name=class_name))
+        fingerprints = self._get_fingerprints(tree)
+        existing_fingerprints = self._read_fingerprints(class_name) if class_name in classes_added else None
+
+        if class_name in classes_added and self.if_type_hint_exists == "validate":
+            matches = (existing_fingerprints or {}).get("structure") == fingerprints["structure"]
+            if not matches:
+                # Fingerprints might be missing or differ only because of strategies that do not affect the output
+                matches = self._remove_docstrings(
+                    tree.get_str_all_nodes(make_parent_class_inherit_from_original_type=False)
+                ) == self._remove_docstrings(classes_added[class_name].read_text(encoding="utf-8"))
+            if not matches:
+                changes = "".join(f"\n - {change}" for change in self._get_changes(tree, class_name))
                 raise LazyTypeHintLiveError(
                     f"Error in validation: Existing type hints were found for `{class_name}` and this one does not "
-                    "match the inner structure of the input data given."
+                    f"match the inner structure of the input data given.{changes}"
                 )
-        else:
-            string_representation = cast(
-                DataTypeTree, super().from_data(data=data, class_name=class_name)
-            ).get_str_all_nodes(make_parent_class_inherit_from_original_type=False)
 
-        self._create_custom_class_py(string_representation, class_name)
-        if class_name in self._get_classes_added():
+        if existing_fingerprints != fingerprints:
+            string_representation = tree.get_str_all_nodes(make_parent_class_inherit_from_original_type=False)
+            self._create_custom_class_py(string_representation, class_name)
+            self._write_fingerprints(fingerprints, class_name)
+            self._write_tree(tree, class_name)
+        if class_name in classes_added:
             return data
         self._add_new_class_to_loader_pyi(new_class=class_name)
         return data
 
+    @staticmethod
+    def _get_fingerprints(tree: DataTypeTree) -> dict[str, str]:
+        """Get the fingerprints that identify the type hints with (content) and without (structure) docstrings."""
+        return {
+            "structure": get_fingerprint(tree, include_docstrings=False),
+            "content": get_fingerprint(tree, include_docstrings=True),
+        }
+
+    def _read_fingerprints(self, class_name: str) -> Optional[dict[str, str]]:
+        path = self._custom_class_dir_path / f"{class_name}{self._fingerprint_suffix}"
+        try:
+            fingerprints = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return cast(dict[str, str], fingerprints)
+
+    def _write_fingerprints(self, fingerprints: Mapping[str, str], class_name: str) -> None:
+        path = self._custom_class_dir_path / f"{class_name}{self._fingerprint_suffix}"
+        path.write_text(json.dumps(fingerprints), encoding="utf-8")
+
+    def _write_tree(self, tree: DataTypeTree, class_name: str) -> None:
+        path = self._custom_class_dir_path / f"{class_name}{self._tree_suffix}"
+        path.write_text(json.dumps(dump_data_type_tree(tree), separators=(",", ":")), encoding="utf-8")
+
+    def _get_changes(self, tree: DataTypeTree, class_name: str) -> list[SchemaChange]:
+        """Get the changes between the existing type hints and the given tree (if the former was stored)."""
+        path = self._custom_class_dir_path / f"{class_name}{self._tree_suffix}"
+        try:
+            existing_tree = load_data_type_tree(json.loads(path.read_text(encoding="utf-8")))
+        except (FileNotFoundError, json.JSONDecodeError, DataTypeTreeError):
+            return []
+        return diff_data_type_trees(existing_tree, tree)
+
     @staticmethod
     def _remove_docstrings(string: str) -> str:
         if '"""' not in string:
@@ -0,0 +1,127 @@
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from lazy_type_hint.file_modifiers.yaml_file_modifier import YAML_COMMENTS_POSITION
+from lazy_type_hint.generators.lazy_type_hint import LazyTypeHint, Tree, _get_class_name
+from lazy_type_hint.utils.file_watcher import FileWatcher
+
+
+class Watch:
+    """Keep the type hints of a set of files up to date, regenerating only those of the files that changed.
+
+    The tree and fingerprint of each file are kept in memory. Whenever a file changes, only that file is loaded and
+    parsed again, and its output is only rendered and written if its fingerprint changed (e.g. not when only values
+    changed).
+    """
+
+    generator: LazyTypeHint
+    """Generator used to infer the type hints."""
+    outputs: dict[Path, Path]
+    """Path of the `.py` file where the type hints of each watched file are written."""
+    class_names: dict[Path, str]
+    """Class name of each watched file, built from its name."""
+    trees: dict[Path, Tree]
+    """Last tree inferred for each watched file."""
+    fingerprints: dict[Path, str]
+    """Fingerprint of the last output written for each watched file."""
+
+    def __init__(
+        self,
+        generator: LazyTypeHint,
+        outputs: Mapping[Union[Path, str], Union[Path, str]],
+        *,
+        loader: Optional[Callable[[Path], object]] = None,
+        comments_are: Optional[Union[YAML_COMMENTS_POSITION, Sequence[YAML_COMMENTS_POSITION]]] = "side",
+    ) -> None:
+        """Initialize the watch. No file is read until `update` or `run` are called.
+
+        Args:
+            generator (LazyTypeHint): Generator used to infer the type hints.
+            outputs (Mapping[Union[Path, str], Union[Path, str]]): Path of the `.py` file where the type hints of
+                each watched file are written, indexed by the path of the watched file.
+            loader (Optional[Callable[[Path], object]], optional): Function that loads the data of a file. See
+                `LazyTypeHint.from_directory`. Defaults to None (the format is given by the suffix of each file).
+            comments_are (Optional[Union[YAML_COMMENTS_POSITION, Sequence[YAML_COMMENTS_POSITION]]], optional):
+                Position of the comments of YAML files used as docstrings. None to ignore them. Defaults to "side".
+        """
+        self.generator = generator
+        self.outputs = {Path(path): Path(output) for path, output in outputs.items()}
+        names_taken: set[str] = set()
+        self.class_names = {path: _get_class_name(Path(path.name), names_taken=names_taken) for path in self.outputs}
+        self.trees = {}
+        self.fingerprints = {}
+        self._loader = loader
+        self._comments_are = comments_are
+
+    def update(self, paths: Optional[Iterable[Path]] = None) -> list[Path]:
+        """Infer again the type hints of the given files and write those whose fingerprint changed.
+
+        Files that do not exist are skipped, keeping their outputs as they are.
+
+        Args:
+            paths (Optional[Iterable[Path]], optional): Watched files to update. Defaults to None (all of them).
+
+        Returns:
+            list[Path]: Outputs that were written.
+        """
+        written: list[Path] = []
+        for path in self.outputs if paths is None else paths:
+            if not path.exists():
+                continue
+            tree, _ = self.generator._from_file_timed(
+                path, self.class_names[path], loader=self._loader, comments_are=self._comments_are
+            )
+            self.trees[path] = tree
+            fingerprint = tree.fingerprint()
+            if self.fingerprints.get(path) == fingerprint:
+                continue
+            output = self.outputs[path]
+            if tree.to_file(output, create_non_existing_dir=True):
+                written.append(output)
+            self.fingerprints[path] = fingerprint
+        return written
+
+    def run(
+        self,
+        *,
+        poll_interval: float = 1.0,
+        debounce: float = 0.5,
+        stop: Optional[threading.Event] = None,
+        on_update: Optional[Callable[[list[Path]], None]] = None,
+        on_error: Optional[Callable[[Path, Exception], None]] = None,
+    ) -> None:
+        """Write the type hints of all files and keep them up to date until `stop` is set.
+
+        Files are polled every `poll_interval` seconds. Once a file changes, changes are gathered until none is seen
+        for `debounce` seconds, so that bursts of changes lead to a single update.
+
+        Args:
+            poll_interval (float, optional): Seconds between polls. Defaults to 1.
+            debounce (float, optional): Seconds without changes needed to update the files that changed. Defaults
+                to 0.5.
+            stop (Optional[threading.Event], optional): Event that stops watching once set. Defaults to None (watch
+                until interrupted).
+            on_update (Optional[Callable[[list[Path]], None]], optional): Called with the outputs written after each
+                update. Defaults to None.
+            on_error (Optional[Callable[[Path, Exception], None]], optional): Called with the watched file and the
+                exception raised if it cannot be type hinted (e.g. while it is being edited), keeping its output as it
+                is. Defaults to None (exceptions are raised).
+        """
+        watcher = FileWatcher(self.outputs)
+        paths: Iterable[Path] = self.outputs
+        while True:
+            written: list[Path] = []
+            for path in paths:
+                try:
+                    written.extend(self.update([path]))
+                except Exception as error:  # noqa: BLE001
+                    if on_error is None:
+                        raise
+                    on_error(path, error)
+            if on_update is not None and written:
+                on_update(written)
+            paths = watcher.wait_for_changes(poll_interval=poll_interval, debounce=debounce, stop=stop)
+            if stop is not None and stop.is_set():
+                return
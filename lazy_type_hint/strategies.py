@@ -5,6 +5,8 @@ LIST_STRATEGIES = Literal["Sequence", "list"]
 TUPLE_SIZE_STRATEGIES = Literal["fixed", "any size"]
 MAPPING_STRATEGIES = Literal["TypedDict", "Mapping", "dict"]
 PANDAS_STRATEGIES = Literal["Full type hint", "Type hint only for autocomplete", "Do not type hint columns"]
+PANDAS_COLUMNS_OVERLOADS_STRATEGIES = Literal["per column", "grouped by type"]
+NUMPY_SHAPE_STRATEGIES = Literal["Do not type hint shape", "Type hint number of dimensions", "Type hint shape"]
 
 
 @dataclass(frozen=True)
@@ -18,6 +20,9 @@ class ParsingStrategies:
     merge_different_typed_dicts_if_similarity_above: int = 50
     typed_dict_read_only_values: bool = False
     check_max_n_elements_within_container: Optional[int] = 500
+    pandas_columns_overloads: PANDAS_COLUMNS_OVERLOADS_STRATEGIES = "per column"
+    max_n_categories_as_literal: int = 100
+    numpy_shape_strategy: NUMPY_SHAPE_STRATEGIES = "Do not type hint shape"
 
     def __post_init__(self) -> None:
         type_hints = get_type_hints(self)
@@ -41,3 +46,5 @@ class ParsingStrategies:
             raise ValueError("`merge_typed_dicts_if_similarity_above` must be less than 100")
         if self.check_max_n_elements_within_container and self.check_max_n_elements_within_container <= 0:
             raise ValueError("`chec_max_n_type_elements_within_container` must at least 1")
+        if self.max_n_categories_as_literal < 0:
+            raise ValueError("`max_n_categories_as_literal` must be greater or equal than 0")
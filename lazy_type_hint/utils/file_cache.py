@@ -0,0 +1,85 @@
+import hashlib
+import os
+import tempfile
+from contextlib import suppress
+from pathlib import Path
+from typing import Final, Optional, Union
+
+
+class FileCache:
+    """Directory-based cache that maps keys to strings.
+
+    Every entry is stored in its own file. Whenever the total size of the entries exceeds `max_size`, the least
+    recently used ones are removed.
+    """
+
+    directory: Path
+    """Directory where the entries are stored."""
+    max_size: int
+    """Maximum size, in bytes, of all the entries together."""
+
+    SUFFIX: Final = ".cache"
+
+    def __init__(self, directory: Union[str, Path], *, max_size: int = 100 * 1024**2) -> None:
+        if max_size <= 0:
+            raise ValueError("`max_size` must be greater than 0")
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    @staticmethod
+    def create_key(*parts: Union[str, bytes]) -> str:
+        """Create a key by hashing all the given parts."""
+        hasher = hashlib.sha256()
+        for part in parts:
+            hasher.update(part.encode("utf-8") if isinstance(part, str) else part)
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the value associated to the key, or None if it is not cached."""
+        path = self._get_path(key)
+        try:
+            value = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        with suppress(OSError):
+            os.utime(path)  # Mark it as recently used
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store the value, evicting the least recently used entries if the cache is full."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Written to a temporary file first so that concurrent readers never see partial entries
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                file.write(value)
+            os.replace(temporary_path, self._get_path(key))
+        except BaseException:
+            with suppress(OSError):
+                os.remove(temporary_path)
+            raise
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        for path in self.directory.glob(f"*{self.SUFFIX}"):
+            with suppress(OSError):
+                os.remove(path)
+
+    def _get_path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.SUFFIX}"
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.directory.glob(f"*{self.SUFFIX}"):
+            with suppress(OSError):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self.max_size:
+                break
+            with suppress(OSError):
+                os.remove(path)
+            total_size -= size
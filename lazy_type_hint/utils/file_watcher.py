@@ -0,0 +1,87 @@
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+from collections.abc import Iterable
+
+
+@dataclass(frozen=True)
+class _FileState:
+    """State of a file when it was last polled."""
+
+    mtime_ns: int
+    size: int
+    digest: bytes
+
+
+class FileWatcher:
+    """Polling-based watcher that detects changes in the content of a set of files.
+
+    Files are only hashed when their modification time or size changed, so that polling unchanged files only costs a
+    `stat` call and files that were touched without changing their content are not reported.
+    """
+
+    paths: tuple[Path, ...]
+    """Files being watched. They do not need to exist."""
+
+    def __init__(self, paths: Iterable[Union[Path, str]]) -> None:
+        self.paths = tuple(dict.fromkeys(Path(path) for path in paths))
+        self._states = {path: self._get_state(path, previous=None) for path in self.paths}
+
+    def poll(self) -> list[Path]:
+        """Get the files whose content changed (or that were created or removed) since the last poll."""
+        changed_paths: list[Path] = []
+        for path in self.paths:
+            previous = self._states[path]
+            state = self._get_state(path, previous=previous)
+            self._states[path] = state
+            if (state is None) != (previous is None) or (state and previous and state.digest != previous.digest):
+                changed_paths.append(path)
+        return changed_paths
+
+    def wait_for_changes(
+        self, *, poll_interval: float = 1.0, debounce: float = 0.5, stop: Optional[threading.Event] = None
+    ) -> list[Path]:
+        """Block until any file changes, gathering the changes until none is seen for `debounce` seconds.
+
+        Bursts of changes (such as the ones made by editors or by `git checkout`) are thus reported at once.
+
+        Args:
+            poll_interval (float, optional): Seconds between polls while waiting for the first change. Defaults to 1.
+            debounce (float, optional): Seconds without changes needed to report the ones gathered. Defaults to 0.5.
+            stop (Optional[threading.Event], optional): Event that, once set, makes this method return the changes
+                gathered so far (maybe none). Defaults to None.
+        """
+        changed_paths: dict[Path, None] = {}
+        last_change = 0.0
+        while stop is None or not stop.is_set():
+            new_changed_paths = self.poll()
+            now = time.monotonic()
+            if new_changed_paths:
+                changed_paths.update(dict.fromkeys(new_changed_paths))
+                last_change = now
+            elif changed_paths and now - last_change >= debounce:
+                break
+            interval = min(poll_interval, debounce) if changed_paths else poll_interval
+            if stop is None:
+                time.sleep(interval)
+            else:
+                stop.wait(interval)
+        return list(changed_paths)
+
+    @staticmethod
+    def _get_state(path: Path, *, previous: Optional[_FileState]) -> Optional[_FileState]:
+        try:
+            stat = os.stat(path)
+            if previous is not None and (stat.st_mtime_ns, stat.st_size) == (previous.mtime_ns, previous.size):
+                return previous
+            hasher = hashlib.blake2b(digest_size=16)
+            with open(path, "rb") as file:
+                while block := file.read(1024**2):
+                    hasher.update(block)
+        except OSError:
+            return None
+        return _FileState(mtime_ns=stat.st_mtime_ns, size=stat.st_size, digest=hasher.digest())
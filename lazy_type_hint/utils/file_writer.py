@@ -0,0 +1,49 @@
+import filecmp
+import os
+import secrets
+from contextlib import suppress
+from pathlib import Path
+from typing import IO, Callable, Optional, Union
+
+
+def write_file_if_changed(
+    path: Union[str, Path], write: Callable[[IO[str]], None], *, encoding: Optional[str] = None
+) -> bool:
+    """Atomically write a text file, leaving it untouched if its content did not change.
+
+    The content is first written into a temporary file within the same directory. This one either replaces the
+    existing file or is removed if both have the same content, so the existing file (and its modification time) is
+    never modified unless needed and readers never see partially written files.
+
+    Args:
+        path (Union[str, Path]): Path to the file.
+        write (Callable[[IO[str]], None]): Function that writes the content into the given text stream.
+        encoding (Optional[str], optional): Encoding of the file. Defaults to the one of the platform.
+
+    Returns:
+        bool: Whether the file was written.
+    """
+    path = Path(path)
+    temporary_path = path.with_name(f".{path.name}.{secrets.token_hex(8)}.tmp")
+    try:
+        # Created with `open` instead of `tempfile` so that it gets the default permissions
+        with open(temporary_path, "x", encoding=encoding) as file:
+            write(file)
+        if _have_same_content(temporary_path, path):
+            os.remove(temporary_path)
+            return False
+        os.replace(temporary_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(temporary_path)
+        raise
+    return True
+
+
+def _have_same_content(path1: Path, path2: Path) -> bool:
+    try:
+        if path1.stat().st_size != path2.stat().st_size:
+            return False
+    except FileNotFoundError:
+        return False
+    return filecmp.cmp(path1, path2, shallow=False)
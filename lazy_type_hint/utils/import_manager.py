@@ -1,6 +1,7 @@
 import re
 from collections import defaultdict
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Final, Literal, Optional
 
@@ -42,6 +43,8 @@ KEYWORDS_AVAILABLE: "TypeAlias" = Literal[
 @dataclass(frozen=True)
 class ImportManager:
     _set: set[KEYWORDS_AVAILABLE] = field(default_factory=set)
+    _recorders: list["ImportManager"] = field(default_factory=list, repr=False, compare=False)
+    """Managers gathering the imports added while recording. See `record`."""
 
     TEMPLATE: Final[str] = field(init=False, default="from {package} import {name}")
     PACKAGE: Mapping[KEYWORDS_AVAILABLE, tuple[str, ...]] = field(
@@ -75,8 +78,26 @@ class ImportManager:
 
     def add(self, keyword: KEYWORDS_AVAILABLE) -> "Self":
         self._set.add(keyword)
+        for recorder in self._recorders:
+            recorder.add(keyword)
         return self
 
+    def update(self, other: "ImportManager") -> "Self":
+        """Add all the imports of another manager."""
+        for keyword in other._set:
+            self.add(keyword)
+        return self
+
+    @contextmanager
+    def record(self) -> Iterator["ImportManager"]:
+        """Gather into a new manager those imports added within the context, apart from adding them to this one."""
+        recorder = ImportManager()
+        self._recorders.append(recorder)
+        try:
+            yield recorder
+        finally:
+            self._recorders.remove(recorder)
+
     def import_all_unkown_symbols_from_signature(self, signature: str) -> None:
         """
         Imports all unknown symbols from the given signature.
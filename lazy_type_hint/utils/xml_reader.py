@@ -0,0 +1,89 @@
+from xml.etree import ElementTree
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Final, Optional, Union
+
+TEXT_KEY: Final = "text"
+"""Key holding the text of those elements that also have attributes or children."""
+
+
+@dataclass
+class _Frame:
+    """Information gathered from the children of an element while it is being parsed."""
+
+    skip: bool = False
+    """Whether the element is not kept because of the maximum number of repeated elements."""
+    children: defaultdict[str, list[object]] = field(default_factory=lambda: defaultdict(list))
+    """Values of the children kept, grouped by their tag."""
+    counts: Counter[str] = field(default_factory=Counter)
+    """Number of children found (kept or not) per tag."""
+
+
+_SKIPPED_FRAME: Final = _Frame(skip=True)
+"""Frame shared by all elements that are not kept, as nothing is gathered from their children."""
+
+
+def read_xml_file(path: Union[Path, str], *, max_n_repeated_elements: Optional[int] = None) -> object:
+    """Read an XML file into the value of its root element, streaming its elements so that memory stays bounded.
+
+    Each element is mapped to:
+        - Its text, if it has neither attributes nor children.
+        - Otherwise, a dictionary with a key per attribute and per tag of its children, plus `TEXT_KEY` if it has
+          any text. Children whose tag is repeated within the same element are gathered into a list.
+
+    Namespaces are removed from tags and attributes. Elements are cleared as soon as they are processed.
+
+    Args:
+        path (Union[Path, str]): Path to the XML file.
+        max_n_repeated_elements (Optional[int], optional): Maximum number of children with the same tag kept per
+            element. Remaining ones are parsed but discarded. Defaults to None (all of them are kept).
+    """
+    frames: list[_Frame] = []
+    elements: list[ElementTree.Element] = []
+    value: object = None
+    for event, element in ElementTree.iterparse(path, events=("start", "end")):
+        if event == "start":
+            elements.append(element)
+            if not frames:
+                frames.append(_Frame())
+                continue
+            parent = frames[-1]
+            if parent.skip:
+                frames.append(parent)
+                continue
+            tag = _remove_namespace(element.tag)
+            parent.counts[tag] += 1
+            if max_n_repeated_elements is not None and parent.counts[tag] > max_n_repeated_elements:
+                frames.append(_SKIPPED_FRAME)
+            else:
+                frames.append(_Frame())
+            continue
+
+        frame = frames.pop()
+        elements.pop()
+        if not frame.skip:
+            value = _get_value(element, frame)
+            if frames:
+                frames[-1].children[_remove_namespace(element.tag)].append(value)
+        if elements:
+            # Previous siblings were already processed, so they are removed to keep memory bounded
+            del elements[-1][:]
+        element.clear()
+    return value
+
+
+def _get_value(element: ElementTree.Element, frame: _Frame) -> object:
+    text = (element.text or "").strip()
+    if not element.attrib and not frame.children:
+        return text
+    value: dict[str, object] = {_remove_namespace(key): attribute for key, attribute in element.attrib.items()}
+    for tag, children in frame.children.items():
+        value[tag] = children if frame.counts[tag] > 1 else children[0]
+    if text:
+        value[TEXT_KEY] = text
+    return value
+
+
+def _remove_namespace(name: str) -> str:
+    return name.rpartition("}")[2]
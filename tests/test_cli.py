@@ -0,0 +1,122 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from lazy_type_hint.cli import main
+
+
+@pytest.fixture
+def inputs(tmp_path: Path) -> list[Path]:
+    paths = [tmp_path / "users.json", tmp_path / "events.jsonl", tmp_path / "config.yaml", tmp_path / "sales.csv"]
+    paths[0].write_text(json.dumps([{"name": "Albert", "address": {"city": "Madrid"}}]))
+    paths[1].write_text('{"id": 1, "address": {"city": "Paris"}}\n\n{"id": 2, "address": {"city": "Rome"}}\n')
+    paths[2].write_text("name: service  # Name of the service\nport: 8080\n")
+    paths[3].write_text("product,price\na,1.0\nb,2.5\n")
+    return paths
+
+
+def test_single_input_to_stdout(inputs: list[Path], capsys: pytest.CaptureFixture[str]) -> None:
+    assert main([str(inputs[0]), "--list-strategy", "Sequence"]) == 0
+    output = capsys.readouterr().out
+    assert "class UsersDict(TypedDict):" in output
+    assert "Users: TypeAlias = Sequence[UsersDict]" in output
+
+
+def test_single_input_to_file(inputs: list[Path], tmp_path: Path) -> None:
+    output = tmp_path / "stubs" / "config.py"
+    assert main([str(inputs[2]), "-o", str(output), "-n", "ServiceConfig"]) == 0
+    content = output.read_text()
+    assert "class ServiceConfig(TypedDict):" in content
+    assert '"""Name of the service."""' in content
+
+
+@pytest.mark.parametrize(
+    "input_format, content", [("json", '{"a": 1}'), ("jsonl", '{"a": 1}\n{"a": "b"}'), ("yaml", "a: 1")]
+)
+def test_stdin(
+    input_format: str, content: str, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("sys.stdin", io.StringIO(content))
+    assert main(["-f", input_format, "-n", "MyData"]) == 0
+    assert "MyData" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_many_inputs_to_package(inputs: list[Path], tmp_path: Path, jobs: str) -> None:
+    output = tmp_path / "stubs"
+    assert main([*map(str, inputs), "-o", str(output), "--jobs", jobs]) == 0
+    assert sorted(path.name for path in output.iterdir()) == [
+        "__init__.py",
+        "_shared.py",
+        "config.py",
+        "events.py",
+        "sales.py",
+        "users.py",
+    ]
+    # The address is shared by users and events, so it is only defined once
+    assert "city: str" in (output / "_shared.py").read_text()
+
+
+@pytest.mark.parametrize(
+    "input_format, content, expected",
+    [("csv", "product,price\na,1.0\n", "price"), ("jsonl", '{"a": 1}\n', "a: int"), ("yaml", "a: 1", "a: int")],
+)
+def test_format_different_from_suffix(
+    input_format: str, content: str, expected: str, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    path = tmp_path / "data.txt"
+    path.write_text(content)
+    assert main([str(path), "-f", input_format]) == 0
+    assert expected in capsys.readouterr().out
+
+
+def test_strategies(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps([{"a": 1}, {"a": 1, "b": 2}]))
+    assert main([str(path), "--check-max-n-elements-within-container", "none", "--typed-dict-read-only-values"]) == 0
+    assert "ReadOnly[int]" in capsys.readouterr().out
+    with pytest.raises(SystemExit):
+        main([str(path), "--merge-different-typed-dicts-if-similarity-above", "0"])
+    assert "must be greater than 0" in capsys.readouterr().err
+
+
+def test_stats(inputs: list[Path], capsys: pytest.CaptureFixture[str]) -> None:
+    assert main([str(inputs[0]), "--stats"]) == 0
+    lines = capsys.readouterr().err.splitlines()
+    assert lines[0].split() == ["input", "nodes", "definitions", "seconds"]
+    assert lines[1].split()[:3] == [str(inputs[0]), "5", "3"]
+    assert lines[2].startswith("total")
+
+
+@pytest.mark.parametrize("profiler", ["auto", "cprofile"])
+def test_profile(inputs: list[Path], capsys: pytest.CaptureFixture[str], profiler: str) -> None:
+    assert main([str(inputs[0]), "--profile", "--profiler", profiler]) == 0
+    assert "_type_hint_input" in capsys.readouterr().err
+
+
+def test_errors(inputs: list[Path], tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    unknown = tmp_path / "data.txt"
+    unknown.write_text("{}")
+    assert main([str(unknown)]) == 1
+    assert "Unknown format" in capsys.readouterr().err
+    assert main([str(tmp_path / "missing.json")]) == 1
+    assert "No such file" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        main([*map(str, inputs)])
+    assert "--output is needed" in capsys.readouterr().err
+
+
+def test_invalid_class_name(inputs: list[Path], capsys: pytest.CaptureFixture[str]) -> None:
+    assert main([str(inputs[0]), "-n", "bad-name"]) == 1
+    assert "not compatible with Python class naming conventions" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("input_format, content", [("yaml", "x: ["), ("json", '{"x": ['), ("jsonl", '{"x": [\n')])
+def test_malformed_input(
+    input_format: str, content: str, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("sys.stdin", io.StringIO(content))
+    assert main(["-f", input_format]) == 1
+    assert capsys.readouterr().err.startswith("lazy-type-hint: error: ")
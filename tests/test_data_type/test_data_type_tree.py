@@ -1,6 +1,9 @@
+import io
 import itertools
+import json
 import re
 import subprocess
+import sys
 import timeit
 from dataclasses import dataclass
 from pathlib import Path
@@ -16,7 +19,7 @@ from collections.abc import Iterable, Mapping
 import pandas as pd
 import pytest
 
-from lazy_type_hint.data_type_tree import DataTypeTree, data_type_tree_factory
+from lazy_type_hint.data_type_tree import DataTypeTree, data_type_tree_factory, dump_data_type_tree
 from lazy_type_hint.strategies import ParsingStrategies
 from lazy_type_hint.utils import TAB, check_if_command_available
 
@@ -327,3 +330,96 @@ class TestRenameDeclaration:
     )
     def test(self, declaration: str, new_name: str, expected_output: tuple[str, str]) -> None:
         assert expected_output == DataTypeTree.rename_declaration(declaration, new_name=new_name)
+
+
+class TestWriteAllNodes:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            1,
+            [1, 2],
+            {"a": 1},
+            [{"a": 1, "b": [1, 2.0], "c": {"d": (1, "a")}}, {"a": 2}],
+            {"function": print, "data_frame": pd.DataFrame({"a": [1], "b": ["x"]}), "range": range(1)},
+        ],
+    )
+    @pytest.mark.parametrize("include_imports", [True, False])
+    @pytest.mark.parametrize("make_parent_class_inherit_from_original_type", [True, False])
+    def test_same_output_as_get_str_all_nodes(
+        self, data: object, include_imports: bool, make_parent_class_inherit_from_original_type: bool
+    ) -> None:
+        expected_string = data_type_tree_factory(data, name="Example").get_str_all_nodes(
+            include_imports=include_imports,
+            make_parent_class_inherit_from_original_type=make_parent_class_inherit_from_original_type,
+        )
+        stream = io.StringIO()
+        data_type_tree_factory(data, name="Example").write_all_nodes(
+            stream,
+            include_imports=include_imports,
+            make_parent_class_inherit_from_original_type=make_parent_class_inherit_from_original_type,
+        )
+        assert expected_string == stream.getvalue()
+
+
+class TestLazySubclasses:
+    @staticmethod
+    def run_python(code: str) -> str:
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=Path(__file__).parents[2]
+        )
+        return result.stdout.strip()
+
+    def test_optional_libraries_are_not_imported(self) -> None:
+        code = (
+            "import sys\n"
+            "from lazy_type_hint import LazyTypeHint\n"
+            "LazyTypeHint().from_data({'a': [1, 2.0], 'b': (print, range(1))}, class_name='A').to_string()\n"
+            "print(sorted(name for name in ('numpy', 'pandas') if name in sys.modules))"
+        )
+        assert self.run_python(code) == "[]"
+
+    def test_subclasses_are_imported_once_found(self) -> None:
+        code = (
+            "import numpy as np\n"
+            "import pandas as pd\n"
+            "from lazy_type_hint.data_type_tree import DataTypeTree\n"
+            "class MyDataFrame(pd.DataFrame): ...\n"
+            "print(DataTypeTree.get_subclass(np.zeros(1)).__name__)\n"
+            "print(DataTypeTree.get_subclass(MyDataFrame({'a': [1]})).__name__)\n"
+            "print(DataTypeTree.get_subclass(pd.Series([1])).__name__)\n"
+            "print(DataTypeTree.lazy_subclasses)"
+        )
+        assert self.run_python(code).splitlines() == [
+            "NumpyDataTypeTree",
+            "PandasDataFrameDataTypeTree",
+            "PandasSeriesDataTypeTree",
+            "{}",
+        ]
+
+    def test_subclasses_are_imported_when_loading_serialized_trees(self) -> None:
+        serialized = json.dumps(dump_data_type_tree(data_type_tree_factory(pd.Series([1]), name="Example")))
+        code = (
+            "import json, sys\n"
+            "from lazy_type_hint.data_type_tree import load_data_type_tree\n"
+            "from lazy_type_hint.data_type_tree import DataTypeTree\n"
+            f"print(type(load_data_type_tree(json.loads({serialized!r}))).__name__)\n"
+            "print(sorted(DataTypeTree.lazy_subclasses))"
+        )
+        # Only the subclasses used by the serialized tree are imported
+        assert self.run_python(code).splitlines() == [
+            "PandasSeriesDataTypeTree",
+            "['numpy.ndarray', 'pandas.DataFrame']",
+        ]
+
+    def test_subclasses_not_imported_are_kept(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(DataTypeTree.lazy_subclasses, "missing.Type", ("missing_module", "MissingDataTypeTree"))
+        with pytest.raises(ModuleNotFoundError):
+            DataTypeTree.import_lazy_subclasses(class_names={"MissingDataTypeTree"})
+        assert DataTypeTree.lazy_subclasses["missing.Type"] == ("missing_module", "MissingDataTypeTree")
+
+    def test_reexported_from_packages(self) -> None:
+        from lazy_type_hint.data_type_tree.generic_type import PandasDataFrameDataTypeTree
+        from lazy_type_hint.data_type_tree.simple_data_type_tree import NumpyDataTypeTree
+
+        assert DataTypeTree.get_subclass(pd.DataFrame()) is PandasDataFrameDataTypeTree
+        assert NumpyDataTypeTree.__name__ == "NumpyDataTypeTree"
@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from lazy_type_hint.data_type_tree import SchemaChange, data_type_tree_factory, diff_data_type_trees
+from lazy_type_hint.data_type_tree.serialization import dump_data_type_tree, load_data_type_tree
+
+
+@pytest.mark.parametrize(
+    "old, new, expected_changes",
+    [
+        ({"a": 1, "b": [1, 2]}, {"a": 2, "b": [3]}, []),
+        ({"a": 1}, {"a": 1, "b": "x"}, [SchemaChange("added_key", ("b",), new="str")]),
+        ({"a": 1, "b": "x"}, {"a": 1}, [SchemaChange("removed_key", ("b",), old="str")]),
+        ({"a": [1]}, {"a": [1, None]}, [SchemaChange("widened_union", ("a", ...), new="NoneType")]),
+        ({"a": {1.0, 2}}, {"a": {2}}, [SchemaChange("narrowed_union", ("a", ...), old="float")]),
+        ({"a": 1}, {"a": "1"}, [SchemaChange("changed_type", ("a",), old="int", new="str")]),
+        ({"a": [1]}, {"a": (1, 2)}, [SchemaChange("changed_container", ("a",), old="list", new="tuple of 2 elements")]),
+        ((1, 2), (1, "2"), [SchemaChange("changed_type", (1,), old="int", new="str")]),
+        (
+            [{"a": 1, "b": 1}],
+            [{"a": 1, "b": 1}, {"a": 1}],
+            [SchemaChange("required_to_optional", (..., "b"))],
+        ),
+        (
+            [{"a": {"b": 1}}],
+            [{"a": {"b": 1, "c": [1.0]}}],
+            [SchemaChange("added_key", (..., "a", "c"), new="list")],
+        ),
+    ],
+)
+def test_diff(old: object, new: object, expected_changes: list[SchemaChange]) -> None:
+    old_tree = data_type_tree_factory(old, name="Old")
+    new_tree = data_type_tree_factory(new, name="New")
+    assert diff_data_type_trees(old_tree, new_tree) == expected_changes
+
+
+def test_diff_with_serialized_tree() -> None:
+    old_tree = data_type_tree_factory({"a": [1, {"b": 1}], "___docstring_hidden_key_a": "Doc."}, name="Example")
+    loaded_tree = load_data_type_tree(json.loads(json.dumps(dump_data_type_tree(old_tree))))
+    new_tree = data_type_tree_factory({"a": [1, {"b": 1, "c": 1}]}, name="Example")
+    assert diff_data_type_trees(loaded_tree, old_tree) == []
+    assert diff_data_type_trees(loaded_tree, new_tree) == [SchemaChange("added_key", ("a", ..., "c"), new="int")]
+
+
+def test_str() -> None:
+    assert (
+        str(SchemaChange("changed_type", ("a", ..., 1), old="int", new="str"))
+        == "['a'][*][1]: changed type (int -> str)"
+    )
+    assert str(SchemaChange("added_key", ("a",), new="str")) == "['a']: added key (str)"
+    assert str(SchemaChange("required_to_optional", ())) == "<root>: required to optional"
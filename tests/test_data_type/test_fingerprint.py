@@ -0,0 +1,65 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from lazy_type_hint.data_type_tree import data_type_tree_factory, get_fingerprint
+from lazy_type_hint.data_type_tree.serialization import dump_data_type_tree, load_data_type_tree
+from lazy_type_hint.strategies import ParsingStrategies
+
+
+@pytest.mark.parametrize(
+    "data1, data2, expected_equal",
+    [
+        ([1, 2], [3, 4, 5], True),
+        ({"a": 1, "b": "x"}, {"a": 2, "b": "y"}, True),
+        ({"a": 1, "b": "x"}, {"b": "y", "a": 2}, False),
+        ([1, 2], [1, "2"], False),
+        ([{"a": 1}, {"a": 1, "b": 2}], [{"a": 1, "b": 2}], False),
+        ({"a": 1}, {"b": 1}, False),
+    ],
+)
+def test_fingerprint(data1: object, data2: object, expected_equal: bool) -> None:
+    tree1 = data_type_tree_factory(data1, name="Example")
+    tree2 = data_type_tree_factory(data2, name="Example")
+    assert (get_fingerprint(tree1) == get_fingerprint(tree2)) is expected_equal
+    assert (tree1.get_str_all_nodes() == tree2.get_str_all_nodes()) is expected_equal
+
+
+def test_fingerprint_depends_on_strategies() -> None:
+    tree1 = data_type_tree_factory([1, 2], name="Example")
+    tree2 = data_type_tree_factory([1, 2], name="Example", strategies=ParsingStrategies(list_strategy="Sequence"))
+    assert get_fingerprint(tree1) != get_fingerprint(tree2)
+
+
+def test_fingerprint_of_loaded_tree() -> None:
+    tree = data_type_tree_factory({"a": [1, {"b": 2.0}], "___docstring_hidden_key_a": "Doc."}, name="Example")
+    loaded_tree = load_data_type_tree(json.loads(json.dumps(dump_data_type_tree(tree))))
+    assert get_fingerprint(tree) == get_fingerprint(loaded_tree)
+
+
+def test_fingerprint_without_docstrings() -> None:
+    tree1 = data_type_tree_factory({"a": 1, "___docstring_hidden_key_a": "Doc 1."}, name="Example")
+    tree2 = data_type_tree_factory({"a": 1, "___docstring_hidden_key_a": "Doc 2."}, name="Example")
+    assert get_fingerprint(tree1) != get_fingerprint(tree2)
+    assert get_fingerprint(tree1, include_docstrings=False) == get_fingerprint(tree2, include_docstrings=False)
+
+
+def test_fingerprint_is_stable_across_sessions() -> None:
+    code = (
+        "from lazy_type_hint.data_type_tree import data_type_tree_factory, get_fingerprint;"
+        "print(get_fingerprint(data_type_tree_factory({'a': [1, 'b', {'c': None}], 'd': {1.0}}, name='Example')))"
+    )
+    fingerprints = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        for seed in ("1", "2")
+    }
+    assert len(fingerprints) == 1
@@ -4,7 +4,7 @@ import pandas as pd
 import pytest
 
 from lazy_type_hint.data_type_tree import data_type_tree_factory
-from lazy_type_hint.data_type_tree.generic_type import PandasDataFrameDataTypeTree
+from lazy_type_hint.data_type_tree.generic_type import PandasDataFrameDataTypeTree, pandas_data_frame_data_type_tree
 from lazy_type_hint.strategies import ParsingStrategies
 
 
@@ -864,3 +864,161 @@ class TestHash:
         tree2 = PandasDataFrameDataTypeTree(data2, name=self.NAME, strategies=strategy)
         assert expected_equal == ((tree1._get_hash()) == tree2._get_hash())
         assert expected_equal == (hash(tree1) == hash(tree2))
+
+
+class TestColumnsFromDtypes:
+    NAME: Final = "Example"
+
+    def test_columns_are_not_sliced(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        df = pd.DataFrame({"A": [1, 2], "B": [1.0, None], "C": ["a", "b"]})
+        monkeypatch.setattr(pd.DataFrame, "__getitem__", lambda *_: pytest.fail("A column was sliced"))
+        tree = PandasDataFrameDataTypeTree(df, name=self.NAME)
+        assert [child.get_str_top_node_without_lvalue() for child in tree.children.values()][:3] == [
+            "pd.Series[int]",
+            "pd.Series[float]",
+            "pd.Series[str]",
+        ]
+
+    @pytest.mark.parametrize(
+        "column, expected_hint",
+        [
+            (pd.array([1, None], dtype="Int64"), 'pd.Series[Union["NAType", int]]'),
+            (pd.array([1, 2], dtype="Int64"), "pd.Series[int]"),
+            (pd.to_datetime(["2020-01-01", None]), 'pd.Series[Union["NaTType", "Timestamp"]]'),
+            ([[1], [2]], "pd.Series[list[int]]"),
+            (["a", 1], "pd.Series[Union[int, str]]"),
+        ],
+    )
+    def test_missing_values_and_object_columns(self, column: object, expected_hint: str) -> None:
+        df = pd.DataFrame({"A": column, "B": [1, 2]})
+        tree = PandasDataFrameDataTypeTree(df, name=self.NAME)
+        assert tree.children["A"].get_str_top_node_without_lvalue() == expected_hint
+        assert tree.children["B"].get_str_top_node_without_lvalue() == "pd.Series[int]"
+
+
+class TestColumnsOverloadsPerColumn:
+    def test_get_str_top_node_keeps_the_order_of_the_columns(self) -> None:
+        df = pd.DataFrame({"a": [1], "b": [1.0], "c": [2]})
+        expected = (
+            "class Example(pd.DataFrame):\n"
+            "\n"
+            "    attrs: ExampleAttrs\n"
+            "\n"
+            "    @overload  # type: ignore\n"
+            "    def __getitem__(self, key: Literal['a']) -> pd.Series[int]:\n"
+            "        ...\n"
+            "\n"
+            "    @overload  # type: ignore\n"
+            "    def __getitem__(self, key: Literal['b']) -> pd.Series[float]:\n"
+            "        ...\n"
+            "\n"
+            "    @overload  # type: ignore\n"
+            "    def __getitem__(self, key: Literal['c']) -> pd.Series[int]:\n"
+            "        ...\n"
+            "\n"
+            "    def __getitem__(\n"
+            "        self,\n"
+            "        key: Union[\n"
+            "            Literal['a', 'b', 'c'],\n"
+            "            npt.NDArray[np.bool_],\n"
+            "            npt.NDArray[np.str_],\n"
+            "            list[Union[Scalar, tuple[Hashable, ...]]],\n"
+            "        ],\n"
+            "    ) -> Union[pd.Series, pd.DataFrame]:\n"
+            "        return super().__getitem__(key)"
+        )
+        assert PandasDataFrameDataTypeTree(df, name="Example").get_str_top_node() == expected
+
+
+class TestColumnsOverloadsGroupedByType:
+    NAME: Final = "Example"
+    STRATEGY: Final = ParsingStrategies(pandas_columns_overloads="grouped by type")
+
+    def test_get_str_top_node(self) -> None:
+        df = pd.DataFrame({"a": [1], "b": [1.0], "c": [2], "d": [[1]]})
+        tree = PandasDataFrameDataTypeTree(df, name=self.NAME, strategies=self.STRATEGY)
+        string = tree.get_str_top_node()
+        assert "def __getitem__(self, key: Literal['a', 'c']) -> pd.Series[int]:" in string
+        assert "def __getitem__(self, key: Literal['b']) -> pd.Series[float]:" in string
+        assert f"def __getitem__(self, key: Literal['d']) -> {self.NAME}D:" in string
+        assert string.count("@overload  # type: ignore") == 3
+
+    def test_overloads_are_split_in_chunks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(pandas_data_frame_data_type_tree, "MAX_LITERALS_PER_OVERLOAD", 2)
+        df = pd.DataFrame({key: [1] for key in "abcde"})
+        string = PandasDataFrameDataTypeTree(df, name=self.NAME, strategies=self.STRATEGY).get_str_top_node()
+        assert "Literal['a', 'b']) -> pd.Series[int]" in string
+        assert "Literal['c', 'd']) -> pd.Series[int]" in string
+        assert "Literal['e']) -> pd.Series[int]" in string
+
+    def test_implementation_does_not_list_all_labels(self) -> None:
+        df = pd.DataFrame({"a": [1], "b": [1.0], 3: [2]})
+        string = PandasDataFrameDataTypeTree(df, name=self.NAME, strategies=self.STRATEGY).get_str_top_node()
+        assert "Literal['a', 'b', 3]" not in string
+        assert "        key: Union[\n            str, int,\n" in string
+
+
+class TestDuplicatedColumns:
+    NAME: Final = "Example"
+
+    @pytest.mark.parametrize("pandas_columns_overloads", ["per column", "grouped by type"])
+    def test_duplicated_columns_return_a_data_frame(self, pandas_columns_overloads: str) -> None:
+        df = pd.DataFrame([[1, 1.0, "x"]], columns=["a", "b", "a"])
+        strategies = ParsingStrategies(pandas_columns_overloads=pandas_columns_overloads)  # type: ignore[arg-type]
+        tree = PandasDataFrameDataTypeTree(df, name=self.NAME, strategies=strategies)
+        string = tree.get_str_top_node()
+        assert "a" not in tree.children
+        assert "def __getitem__(self, key: Literal['b']) -> pd.Series[float]:" in string
+        assert "def __getitem__(self, key: Literal['a']) -> pd.DataFrame:" in string
+        assert isinstance(df["a"], pd.DataFrame)
+
+
+class TestMultiIndexColumns:
+    NAME: Final = "Example"
+
+    def test_columns_are_grouped_by_their_first_level(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        columns = pd.MultiIndex.from_tuples([("b", "x", 1), ("a", "y", 2), ("b", "z", 3), ("a", "y", 4)])
+        df = pd.DataFrame([[1, 1.0, "s", 2]], columns=columns)
+        monkeypatch.setattr(pd.DataFrame, "__getitem__", lambda *_: pytest.fail("Columns were sliced by label"))
+        tree = PandasDataFrameDataTypeTree(df, name=self.NAME)
+        assert list(tree.children) == ["b", "a", "Attrs"]
+        assert list(tree.children["b"].children) == ["x", "z", "Attrs"]
+        assert tree.children["b"].children["z"].children[3].get_str_top_node_without_lvalue() == "pd.Series[str]"
+        assert list(tree.children["a"].children["y"].children) == [2, 4, "Attrs"]
+        assert tree.children["a"].children["y"].children[2].get_str_top_node_without_lvalue() == "pd.Series[float]"
+
+    def test_empty_string_as_placeholder(self) -> None:
+        df = pd.DataFrame({("a", ""): [1], ("b", "c"): [1.0]})
+        tree = PandasDataFrameDataTypeTree(df, name=self.NAME)
+        assert tree.children["a"].get_str_top_node_without_lvalue() == "pd.Series[int]"
+
+
+class TestExactHash:
+    NAME: Final = "Example"
+
+    @pytest.mark.parametrize(
+        "columns1, columns2",
+        [
+            (list(range(1_000)), [*range(500), -1, *range(501, 1_000)]),
+            ([1, "a"], ["1", "a"]),
+            ([True, "a"], [1, "a"]),
+            (pd.MultiIndex.from_tuples([("a", 1), ("b", 2)]), pd.MultiIndex.from_tuples([("a", 1), ("b", "2")])),
+        ],
+    )
+    def test_different_columns(self, columns1: object, columns2: object) -> None:
+        df1 = pd.DataFrame([range(len(columns1))], columns=columns1)  # type: ignore[arg-type]
+        df2 = pd.DataFrame([range(len(columns2))], columns=columns2)  # type: ignore[arg-type]
+        tree1 = PandasDataFrameDataTypeTree(df1, name=self.NAME)
+        tree2 = PandasDataFrameDataTypeTree(df2, name=self.NAME)
+        assert tree1._get_hash() != tree2._get_hash()
+
+    def test_different_dtypes(self) -> None:
+        tree1 = PandasDataFrameDataTypeTree(pd.DataFrame({"a": [1]}), name=self.NAME)
+        tree2 = PandasDataFrameDataTypeTree(pd.DataFrame({"a": [1.0]}), name=self.NAME)
+        assert tree1._get_hash() != tree2._get_hash()
+
+    def test_unused_levels_are_ignored(self) -> None:
+        df = pd.DataFrame({("a", "b"): [1], ("c", "d"): [2]})
+        tree1 = PandasDataFrameDataTypeTree(df.iloc[:, :1], name=self.NAME)
+        tree2 = PandasDataFrameDataTypeTree(pd.DataFrame({("a", "b"): [3]}), name=self.NAME)
+        assert tree1._get_hash() == tree2._get_hash()
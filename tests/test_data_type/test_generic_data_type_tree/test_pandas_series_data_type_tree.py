@@ -1,9 +1,11 @@
+import json
 from typing import Final
 
 import pandas as pd
 import pytest
 
 from lazy_type_hint.data_type_tree.generic_type.pandas_series_data_type_tree import PandasSeriesDataTypeTree
+from lazy_type_hint.data_type_tree.serialization import dump_data_type_tree, load_data_type_tree
 from lazy_type_hint.strategies import ParsingStrategies
 
 
@@ -18,6 +20,15 @@ class TestSeries:
             [pd.Series([1, 2, 1.1]), f"{NAME}: TypeAlias = pd.Series[float]"],
             [pd.Series([1, 2, "a"]), f"{NAME}: TypeAlias = pd.Series[Union[int, str]]"],
             [pd.Series([1, 2, []]), f"{NAME}: TypeAlias = pd.Series[Union[{NAME}List, int]]"],
+            [pd.Series([], dtype=float), f"{NAME}: TypeAlias = pd.Series[float]"],
+            [pd.Series([True, False]), f"{NAME}: TypeAlias = pd.Series[bool]"],
+            [pd.Series([1, None], dtype="Int64"), f'{NAME}: TypeAlias = pd.Series[Union["NAType", int]]'],
+            [pd.Series(pd.to_datetime(["2020-01-01", None])), f'{NAME}: TypeAlias = pd.Series[Union["NaTType", "Timestamp"]]'],
+            [pd.Series(["a", "b"], dtype="category"), f"{NAME}: TypeAlias = pd.Series[Literal['a', 'b']]"],
+            [pd.Series(["a", None], dtype="category"), f"{NAME}: TypeAlias = pd.Series[Union[Literal['a'], float]]"],
+            [pd.Series([1.5], dtype="category"), f"{NAME}: TypeAlias = pd.Series[float]"],
+            [pd.Series(["a", "b"], dtype=object), f"{NAME}: TypeAlias = pd.Series[str]"],
+            [pd.Series([{"a": 1}]), f"{NAME}: TypeAlias = pd.Series[{NAME}Dict]"],
         ],
     )
     def test_get_str_top_node(self, data: object, expected_str: str) -> None:
@@ -26,3 +37,30 @@ class TestSeries:
         )
         assert expected_str == tree.get_str_top_node()
         assert "TypeAlias" in tree.imports
+
+    def test_elements_are_not_iterated(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        data = pd.Series(range(1_000))
+        monkeypatch.setattr(pd.Series, "__iter__", lambda _: pytest.fail("Elements were iterated"))
+        tree = PandasSeriesDataTypeTree(data, self.NAME)
+        assert tree.get_str_top_node() == f"{self.NAME}: TypeAlias = pd.Series[int]"
+
+    def test_only_a_sample_of_object_series_is_checked(self) -> None:
+        data = pd.Series(["a"] * 10 + [1], dtype=object)
+        tree = PandasSeriesDataTypeTree(
+            data, self.NAME, strategies=ParsingStrategies(check_max_n_elements_within_container=10)
+        )
+        assert tree.get_str_top_node() == f"{self.NAME}: TypeAlias = pd.Series[str]"
+
+    def test_categories_above_limit_are_not_literal(self) -> None:
+        data = pd.Series(["a", "b", "c"], dtype="category")
+        tree = PandasSeriesDataTypeTree(
+            data, self.NAME, strategies=ParsingStrategies(max_n_categories_as_literal=2)
+        )
+        assert tree.get_str_top_node() == f"{self.NAME}: TypeAlias = pd.Series[str]"
+
+    def test_categories_are_kept_when_serialized(self) -> None:
+        tree = PandasSeriesDataTypeTree(pd.Series(["a", "b"], dtype="category"), self.NAME)
+        loaded_tree = load_data_type_tree(json.loads(json.dumps(dump_data_type_tree(tree))))
+        assert loaded_tree.get_str_top_node() == tree.get_str_top_node()
+        other_tree = PandasSeriesDataTypeTree(pd.Series(["a", "c"], dtype="category"), self.NAME)
+        assert tree != other_tree
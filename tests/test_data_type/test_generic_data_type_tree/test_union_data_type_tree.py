@@ -0,0 +1,52 @@
+from collections.abc import Iterable
+from typing import Callable, Final
+
+import pytest
+
+from lazy_type_hint.data_type_tree.generic_type import UnionDataTypeTree
+from lazy_type_hint.data_type_tree.generic_type.union_data_type_tree import Alternatives
+from lazy_type_hint.data_type_tree.serialization import dump_data_type_tree, load_data_type_tree
+
+
+class TestGetStrPy:
+    NAME: Final = "Example"
+    """Name that will be used to create the class."""
+    imports_to_check: Final = ("Any", "Optional", "TypeAlias", "Union")
+    """Imports that will be checked in case they were needed."""
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "tree, expected_output, expected_n_children",
+        [
+            (UnionDataTypeTree(Alternatives((1,)), name=NAME), f"{NAME}: TypeAlias = int", 1),
+            (UnionDataTypeTree(Alternatives((1, 2.0)), name=NAME), f"{NAME}: TypeAlias = float", 2),
+            (UnionDataTypeTree(Alternatives((1, "a")), name=NAME), f"{NAME}: TypeAlias = Union[int, str]", 2),
+            (UnionDataTypeTree(Alternatives((1, None)), name=NAME), f"{NAME}: TypeAlias = Optional[int]", 2),
+            (UnionDataTypeTree(Alternatives((1, "a", None)), name=NAME), f"{NAME}: TypeAlias = Optional[Union[int, str]]", 3),
+            (UnionDataTypeTree(Alternatives((None,)), name=NAME), f"{NAME}: TypeAlias = None", 1),
+            (UnionDataTypeTree(Alternatives(()), name=NAME), f"{NAME}: TypeAlias = Any", 0),
+        ],
+    )
+    # fmt: on
+    def test_get_str_top_node(
+        self,
+        tree: UnionDataTypeTree,
+        expected_output: str,
+        expected_n_children: int,
+        assert_imports: Callable[[UnionDataTypeTree, Iterable[str]], None],
+    ) -> None:
+        assert expected_n_children == len(tree), "Not all children were correctly parsed"
+        assert expected_output == tree.get_str_top_node()
+        assert_imports(tree, self.imports_to_check)
+
+    def test_serialization(self) -> None:
+        tree = UnionDataTypeTree(Alternatives((1, "a", None)), name=self.NAME)
+        assert tree.get_str_top_node() == load_data_type_tree(dump_data_type_tree(tree)).get_str_top_node()
+
+    def test_hash(self) -> None:
+        assert UnionDataTypeTree(Alternatives((1, "a")), name=self.NAME) == UnionDataTypeTree(
+            Alternatives(("b", 2)), name=self.NAME
+        )
+        assert UnionDataTypeTree(Alternatives((1,)), name=self.NAME) != UnionDataTypeTree(
+            Alternatives((1, None)), name=self.NAME
+        )
@@ -0,0 +1,119 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+from lazy_type_hint.data_type_tree import (
+    DataTypeTreeError,
+    data_type_tree_factory,
+    iter_modules,
+    iter_modules_of_trees,
+    share_identical_nodes,
+)
+from lazy_type_hint.data_type_tree.package import SPLIT_STRATEGIES
+from lazy_type_hint.strategies import ParsingStrategies
+
+DATA = {
+    "database": {"host": "x", "port": 1, "replicas": [{"host": "y", "weight": 1.0}]},
+    "server": {"workers": 4, "db": {"host": "x", "port": 1, "replicas": [{"host": "y", "weight": 1.0}]}},
+    "class": {"name": "x"},
+    "tags": ["a"],
+}
+
+
+@pytest.mark.parametrize("split_by", ["key", "size"])
+def test_modules_can_be_imported(split_by: SPLIT_STRATEGIES, tmp_path: Path) -> None:
+    tree = data_type_tree_factory(DATA, name="Config")
+    package = tmp_path / f"package_{split_by}"
+    package.mkdir()
+    modules = list(iter_modules(tree, split_by=split_by, max_module_size=150))
+    for module in modules:
+        (package / f"{module.name}.py").write_text(module.content)
+
+    # All names are defined once and re-exported by the `__init__` module
+    assert modules[-1].name == "__init__"
+    assert list(modules[-1].names) == [name for module in modules[:-1] for name in module.names]
+    assert len(set(modules[-1].names)) == len(modules[-1].names)
+
+    # Modules only import from those preceding them, so there are no circular imports
+    for idx, module in enumerate(modules[:-1]):
+        for other_module in modules[idx:]:
+            assert f"from .{other_module.name} import" not in module.content
+
+    sys.path.insert(0, str(tmp_path))
+    try:
+        imported_package = importlib.import_module(package.name)
+        assert all(hasattr(imported_package, name) for name in modules[-1].names)
+    finally:
+        sys.path.remove(str(tmp_path))
+        for name in [name for name in sys.modules if name.split(".")[0] == package.name]:
+            del sys.modules[name]
+
+
+def test_split_by_key() -> None:
+    tree = data_type_tree_factory(DATA, name="Config")
+    modules = {module.name: module for module in iter_modules(tree, split_by="key")}
+    assert list(modules) == ["config_database", "config_server", "config_class", "config", "__init__"]
+    assert "from .config_database import ConfigDatabase\n" in modules["config"].content
+    assert "TypeAlias" not in modules["config_class"].content
+
+
+def test_split_by_size() -> None:
+    tree = data_type_tree_factory(DATA, name="Config")
+    modules = list(iter_modules(tree, split_by="size", max_module_size=150))
+    assert len(modules) > 2
+    assert all(len(module.names) == 1 or len(module.content) < 300 for module in modules[:-1])
+    assert len(list(iter_modules(tree, split_by="size"))) == 2
+
+
+def test_names_within_docstrings_are_not_imported() -> None:
+    data = {"a": {"doc": "See XB", "x": 1}, "b": {"doc": "See XA", "y": "z"}}
+    tree = data_type_tree_factory(data, name="X", strategies=ParsingStrategies(key_used_as_doc="doc"))
+    modules = {module.name: module for module in iter_modules(tree, split_by="key")}
+    assert "See XA" in modules["xb"].content
+    assert "from ." not in modules["xb"].content
+    assert "from .xa import XA\nfrom .xb import XB\n" in modules["x"].content
+
+
+@pytest.mark.parametrize("kwargs", [{"split_by": "other"}, {"max_module_size": 0}])
+def test_invalid_arguments(kwargs: dict[str, object]) -> None:
+    tree = data_type_tree_factory(DATA, name="Config")
+    with pytest.raises(DataTypeTreeError):
+        list(iter_modules(tree, **kwargs))  # type: ignore[arg-type]
+
+
+class TestModulesOfTrees:
+    def test_identical_nodes_are_shared(self) -> None:
+        trees = [
+            data_type_tree_factory(DATA, name="Config"),
+            data_type_tree_factory({"db": DATA["database"], "class": {"name": 1}}, name="Other"),
+        ]
+        share_identical_nodes(trees)
+        modules = {module.name: module for module in iter_modules_of_trees(trees)}
+        assert list(modules) == ["_shared", "config", "other", "__init__"]
+        assert modules["_shared"].names == ("ConfigDatabaseReplicasDict", "ConfigDatabaseReplicas", "ConfigDatabase")
+        assert "from ._shared import ConfigDatabase\n" in modules["other"].content
+        assert "ConfigDatabase:" not in modules["config"].content
+        # Same names but different structures are not shared
+        assert "class OtherClass(TypedDict):\n    name: int" in modules["other"].content
+        assert "class ConfigClass(TypedDict):\n    name: str" in modules["config"].content
+
+    def test_names_taken_are_not_reused(self) -> None:
+        trees = [
+            data_type_tree_factory({"a": {"b": 1}}, name="X"),
+            data_type_tree_factory({"c": {"b": 1}}, name="Y"),
+            data_type_tree_factory({"d": 1}, name="XA"),
+        ]
+        share_identical_nodes(trees)
+        assert [child.name for tree in trees[:2] for child in tree] == ["XA2", "XA2"]
+
+    def test_without_shared_nodes(self) -> None:
+        trees = [data_type_tree_factory({"a": 1}, name="X"), data_type_tree_factory({"a": "1"}, name="Y")]
+        share_identical_nodes(trees)
+        assert [module.name for module in iter_modules_of_trees(trees)] == ["x", "y", "__init__"]
+
+    def test_trees_with_same_name(self) -> None:
+        trees = [data_type_tree_factory({"a": 1}, name="X"), data_type_tree_factory({"a": "1"}, name="X")]
+        with pytest.raises(DataTypeTreeError):
+            list(iter_modules_of_trees(trees))
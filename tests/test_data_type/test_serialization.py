@@ -0,0 +1,68 @@
+import json
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lazy_type_hint.data_type_tree import DataTypeTreeError, data_type_tree_factory
+from lazy_type_hint.data_type_tree.serialization import dump_data_type_tree, load_data_type_tree
+from lazy_type_hint.strategies import ParsingStrategies
+
+
+@pytest.mark.parametrize("data_type", ["frozenset", "set", "list", "tuple", "dictionary", "mapping"])
+@pytest.mark.parametrize(
+    "strategies",
+    [
+        ParsingStrategies(),
+        ParsingStrategies(dict_strategy="Mapping", tuple_size_strategy="any size"),
+        ParsingStrategies(min_depth_to_define_type_alias=0, key_used_as_doc="string"),
+    ],
+)
+def test_round_trip(create_sample: Callable[[str], Any], data_type: str, strategies: ParsingStrategies) -> None:
+    tree = data_type_tree_factory(create_sample(data_type), name="Example", strategies=strategies)
+    serialized = json.loads(json.dumps(dump_data_type_tree(tree)))
+    loaded_tree = load_data_type_tree(serialized)
+
+    assert tree.get_str_all_nodes() == loaded_tree.get_str_all_nodes()
+    assert dump_data_type_tree(loaded_tree) == serialized
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [{"a": 1, "b": [1, 2]}, {"a": 2}],
+        {"a": 1, "___docstring_hidden_key_a": "Docstring.", "b": {1: "a", (1, "a"): 2.0}},
+        {"data_frame": pd.DataFrame({"a": [1], "b": ["x"], ("c", "d"): [1.0]})},
+        {"multi_index": pd.DataFrame({("a", "b"): [1], ("a", "c"): [1.0]}), "series": pd.Series([1, 2])},
+        {"array": np.zeros((2, 3), dtype=[("x", "<i4"), ("y", "<f8")]), "function": print},
+    ],
+)
+def test_round_trip_special_cases(data: object) -> None:
+    tree = data_type_tree_factory(data, name="Example")
+    loaded_tree = load_data_type_tree(json.loads(json.dumps(dump_data_type_tree(tree))))
+    assert tree.get_str_all_nodes() == loaded_tree.get_str_all_nodes()
+
+
+def test_shared_children_are_stored_once() -> None:
+    tree = data_type_tree_factory({"a": [1], "b": [2]}, name="Example")
+    serialized = dump_data_type_tree(tree)
+    assert len(serialized["nodes"]) == 3
+    loaded_tree = load_data_type_tree(serialized)
+    assert loaded_tree.children["a"] is loaded_tree.children["b"]  # type: ignore
+
+
+def test_render_with_other_strategies() -> None:
+    data = [{"a": 1, "b": [1, 2]}, {"a": 2}]
+    strategies = ParsingStrategies(list_strategy="Sequence", typed_dict_read_only_values=True)
+    tree = data_type_tree_factory(data, name="Example")
+    loaded_tree = load_data_type_tree(dump_data_type_tree(tree), strategies=strategies)
+    expected_tree = data_type_tree_factory(data, name="Example", strategies=strategies)
+    assert expected_tree.get_str_all_nodes() == loaded_tree.get_str_all_nodes()
+
+
+def test_wrong_version() -> None:
+    serialized = dump_data_type_tree(data_type_tree_factory([1], name="Example"))
+    serialized["version"] = -1
+    with pytest.raises(DataTypeTreeError):
+        load_data_type_tree(serialized)
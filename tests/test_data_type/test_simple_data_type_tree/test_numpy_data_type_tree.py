@@ -1,10 +1,15 @@
+import ast
+import json
+from fractions import Fraction
 from typing import Final
 
 import numpy as np
 import pytest
 from numpy.typing import NDArray
 
+from lazy_type_hint.data_type_tree.serialization import dump_data_type_tree, load_data_type_tree
 from lazy_type_hint.data_type_tree.simple_data_type_tree.numpy_data_type_tree import NumpyDataTypeTree
+from lazy_type_hint.strategies import NUMPY_SHAPE_STRATEGIES, ParsingStrategies
 
 
 class TestGetStr:
@@ -24,3 +29,67 @@ class TestGetStr:
         assert "numpy" in tree.imports
         assert "NDArray" in tree.imports
         assert "TypeAlias" in tree.imports
+
+    @pytest.mark.parametrize(
+        "strategy, expected_str",
+        [
+            ("Do not type hint shape", f'{name}: TypeAlias = "NDArray[np.float64]"'),
+            (
+                "Type hint number of dimensions",
+                f'{name}: TypeAlias = "np.ndarray[tuple[int, int], np.dtype[np.float64]]"',
+            ),
+            (
+                "Type hint shape",
+                f'{name}: TypeAlias = "np.ndarray[tuple[Literal[2], Literal[3]], np.dtype[np.float64]]"',
+            ),
+        ],
+    )
+    def test_shape_strategy(self, strategy: NUMPY_SHAPE_STRATEGIES, expected_str: str) -> None:
+        tree = NumpyDataTypeTree(
+            np.zeros((2, 3)), name=self.name, strategies=ParsingStrategies(numpy_shape_strategy=strategy)
+        )
+        assert expected_str == tree.get_str_top_node()
+
+    def test_structured_array(self) -> None:
+        data = np.zeros(3, dtype=[("x", "i4"), ("y", "f8", (2,))])
+        tree = NumpyDataTypeTree(data, name=self.name)
+        string = tree.get_str_top_node()
+        assert string.startswith(f"class {self.name}(np.ndarray[Any, np.dtype[np.void]]):")
+        assert "def __getitem__(self, key: Literal['x']) -> \"NDArray[np.int32]\":" in string
+        assert "def __getitem__(self, key: Literal['y']) -> \"NDArray[np.float64]\":" in string
+        assert "Literal" in tree.imports
+
+    @pytest.mark.parametrize(
+        "input_arr, expected_key, expected_rtype",
+        [
+            (np.array([1, "a", None], dtype=object), "int", "Union[None, int, str]"),
+            (np.array([[1, 2.0]], dtype=object), "tuple[int, int]", "float"),
+            (np.array([Fraction(1)], dtype=object), "int", "Any"),
+            (np.array({"x": 1}, dtype=object), "tuple[()]", "dict"),
+        ],
+    )
+    def test_object_array(self, input_arr: NDArray[np.generic], expected_key: str, expected_rtype: str) -> None:
+        tree = NumpyDataTypeTree(input_arr, name=self.name)
+        string = tree.get_str_top_node()
+        assert f"def __getitem__(self, key: {expected_key}) -> {expected_rtype}:" in string
+        ast.parse(string)
+
+    def test_only_a_sample_of_object_arrays_is_checked(self) -> None:
+        data = np.array(["a"] * 10 + [1], dtype=object)
+        tree = NumpyDataTypeTree(
+            data, name=self.name, strategies=ParsingStrategies(check_max_n_elements_within_container=10)
+        )
+        assert "def __getitem__(self, key: int) -> str:" in tree.get_str_top_node()
+
+    def test_arrays_with_different_dtypes_are_different(self) -> None:
+        assert NumpyDataTypeTree(np.zeros(1), name=self.name) != NumpyDataTypeTree(np.array(["a"]), name=self.name)
+        assert NumpyDataTypeTree(np.zeros(1), name=self.name) == NumpyDataTypeTree(np.zeros(3), name=self.name)
+
+    @pytest.mark.parametrize(
+        "input_arr",
+        [np.zeros((2, 2)), np.zeros(3, dtype=[("x", "i4")]), np.array([1, "a"], dtype=object)],
+    )
+    def test_serialization(self, input_arr: NDArray[np.generic]) -> None:
+        tree = NumpyDataTypeTree(input_arr, name=self.name)
+        loaded_tree = load_data_type_tree(json.loads(json.dumps(dump_data_type_tree(tree))))
+        assert loaded_tree.get_str_top_node() == tree.get_str_top_node()
@@ -112,6 +112,7 @@ class TestExtractKeyFromLine:
             ("{separator}key 1: text", "key 1"),
             ('{separator}"key:1": text', "key:1"),
             ('{separator}"key1" text', ""),
+            ("{separator}-", ""),  # List element in multiple lines
         ],
     )
     def test_method(self, line: str, expected_output: str, separator: str) -> None:
@@ -140,26 +141,6 @@ class TestJoinMultiLineComments:
         assert expected_output == YamlFileModifier._join_multi_line_comments(lines)
 
 
-class TestCountSpacesOrTabs:
-    @pytest.mark.parametrize(
-        "line, indentation, expected_output",
-        [
-            ("key: text", "spaces", 0),
-            (" key: text", "spaces", 1),
-            ("  key: text", "spaces", 2),
-            ("   key: text", "spaces", 3),
-            ("\tkey: text", "tabs", 1),
-            ("\t\tkey: text", "tabs", 2),
-            ("\t\t\tkey: text", "tabs", 3),
-            ("-key: text", "spaces", 1),  # From list
-            ("- key: text", "spaces", 2),  # From list
-            (" - key: text", "spaces", 3),  # From list
-        ],
-    )
-    def test_method(self, line: str, expected_output: int, indentation: Literal["spaces", "tabs"]) -> None:
-        assert expected_output == YamlFileModifier._count_spaces_or_tabs_at_start(line, indentation=indentation)
-
-
 class TestExtractSideComment:
     @pytest.mark.parametrize(
         "line, expected_output",
@@ -184,16 +165,14 @@ class TestExtractSideComment:
         assert expected_output == YamlFileModifier._extract_side_comment(line)
 
 
-class TestExtractSingleBlockComments:
+class TestExtractBlockComments:
     @pytest.fixture
-    def data_file_modifier(self, content: str, comments_are: Literal["above", "below"]) -> YamlFileModifier:
-        with patch("pathlib.Path.read_text", autospec=True) as mock_read:
-
-            def read_text_side_effect(self: Path, *args: Any, **kwargs: Any) -> str:  # noqa: ARG001
-                return content
-
-            mock_read.side_effect = read_text_side_effect
-            return YamlFileModifier(path="file.yaml", comments_are=comments_are)
+    def data_file_modifier(
+        self, content: str, comments_are: Literal["above", "below"], tmp_path: Path
+    ) -> YamlFileModifier:
+        path = tmp_path / "file.yaml"
+        path.write_text(content)
+        return YamlFileModifier(path=path, comments_are=comments_are)
 
     @pytest.fixture
     def comments_are(self) -> Literal["above", "below"]:
@@ -273,18 +252,20 @@ key: comment""",
                 "This is a comment that finishes in another line.",
             ),
             (
+                # Only keys starting with a letter are read, as when the file is modified
                 """'key': comment
 # This is a comment""",
                 "below",
                 0,
-                "This is a comment.",
+                "",
             ),
             (
+                # Only keys starting with a letter are read, as when the file is modified
                 """"key": comment
 # This is a comment""",
                 "below",
                 0,
-                "This is a comment.",
+                "",
             ),
             (
                 """key2: value
@@ -387,7 +368,12 @@ key: comment""",
         data_file_modifier: YamlFileModifier,
         comments_are: Literal["above", "below"],
     ) -> None:
-        assert expected_output == data_file_modifier._extract_single_block_comment(line_idx, comments_are=comments_are)
+        comments = {
+            comment.key_line: comment.full_string
+            for _, comment in data_file_modifier._iter_lines_with_comments()
+            if comment is not None
+        }
+        assert expected_output == comments.get(line_idx, "")
 
 
 class TestExtractComments:
@@ -541,80 +527,36 @@ class TestExtractComments:
 
 class TestMergeComments:
     @pytest.mark.parametrize(
-        "comments, expected_output",
+        "content, comments_are, expected_output",
         [
-            [
-                (
-                    Comment(
-                        full_string="Comment for key1.",
-                        associated_with_key="key1",
-                        key_line=2,
-                        spacing_element=("spaces", 0),
-                        must_replace_its_key_as_first_element_of_list=True,
-                    ),
-                    Comment(
-                        full_string="Comment 2 for key1.",
-                        associated_with_key="key1",
-                        key_line=2,
-                        spacing_element=("spaces", 0),
-                        must_replace_its_key_as_first_element_of_list=False,
-                    ),
-                ),
+            (
+                "  # Comment for key1\n- key1: 1  # Comment 2 for key1\n",
+                ["above", "side"],
                 (
                     Comment(
                         full_string="Comment for key1.\n\nComment 2 for key1.",
                         associated_with_key="key1",
-                        key_line=2,
-                        spacing_element=("spaces", 0),
+                        key_line=1,
+                        spacing_element=("spaces", 2),
                         must_replace_its_key_as_first_element_of_list=True,
                     ),
                 ),
-            ],
-            [
-                (
-                    Comment(
-                        full_string="Comment for key1.",
-                        associated_with_key="key1",
-                        key_line=2,
-                        spacing_element=("spaces", 0),
-                    ),
-                    Comment(
-                        full_string="Comment 2 for key1.",
-                        associated_with_key="key1",
-                        key_line=2,
-                        spacing_element=("spaces", 0),
-                    ),
-                ),
+            ),
+            (
+                "key1: 1  # Comment for key1\n# Comment 2 for key1\n",
+                ["side", "below"],
                 (
                     Comment(
                         full_string="Comment for key1.\n\nComment 2 for key1.",
                         associated_with_key="key1",
-                        key_line=2,
-                        spacing_element=("spaces", 0),
-                    ),
-                ),
-            ],
-            [
-                (
-                    Comment(
-                        full_string="Comment for key1.",
-                        associated_with_key="key1",
-                        key_line=2,
-                        spacing_element=("spaces", 0),
-                    ),
-                    Comment(
-                        full_string="Comment 2 for key1.",
-                        associated_with_key="key1",
-                        key_line=2,
+                        key_line=0,
                         spacing_element=("spaces", 0),
                     ),
-                    Comment(
-                        full_string="Comment for key2.",
-                        associated_with_key="key2",
-                        key_line=3,
-                        spacing_element=("spaces", 2),
-                    ),
                 ),
+            ),
+            (
+                "key0: 0\n# Comment for key1\nkey1:  # Comment 2 for key1\n  key2: 2  # Comment for key2\n",
+                ["above", "side"],
                 (
                     Comment(
                         full_string="Comment for key1.\n\nComment 2 for key1.",
@@ -629,39 +571,15 @@ class TestMergeComments:
                         spacing_element=("spaces", 2),
                     ),
                 ),
-            ],
-            [
-                (
-                    Comment(
-                        full_string="Comment for key1.",
-                        associated_with_key="key1",
-                        key_line=2,
-                        spacing_element=("spaces", 0),
-                    ),
-                    Comment(
-                        full_string="Comment 2 for key1.",
-                        associated_with_key="key1",
-                        key_line=2,
-                        spacing_element=("spaces", 0),
-                    ),
-                    Comment(
-                        full_string="Comment for key2.",
-                        associated_with_key="key2",
-                        key_line=3,
-                        spacing_element=("spaces", 2),
-                    ),
-                    Comment(
-                        full_string="Comment 2 for key2.",
-                        associated_with_key="key2",
-                        key_line=3,
-                        spacing_element=("spaces", 2),
-                    ),
-                ),
+            ),
+            (
+                "# Comment for key1\nkey1:  # Comment 2 for key1\n  # Comment for key2\n  key2: 2  # Comment 2 for key2\n",
+                ["above", "side"],
                 (
                     Comment(
                         full_string="Comment for key1.\n\nComment 2 for key1.",
                         associated_with_key="key1",
-                        key_line=2,
+                        key_line=1,
                         spacing_element=("spaces", 0),
                     ),
                     Comment(
@@ -671,11 +589,43 @@ class TestMergeComments:
                         spacing_element=("spaces", 2),
                     ),
                 ),
-            ],
+            ),
         ],
     )
-    def test_method(self, comments: Sequence[Comment], expected_output: Sequence[Comment]) -> None:
-        assert expected_output == YamlFileModifier._merge_comments(comments)
+    def test_method(
+        self,
+        content: str,
+        comments_are: Sequence[YAML_COMMENTS_POSITION],
+        expected_output: Sequence[Comment],
+        tmp_path: Path,
+    ) -> None:
+        path = tmp_path / "file.yaml"
+        path.write_text(content)
+        data_file_modifier = YamlFileModifier(path, comments_are=comments_are)
+        comments = tuple(
+            comment for _, comment in data_file_modifier._iter_lines_with_comments() if comment is not None
+        )
+        assert expected_output == comments
+
+
+class TestJoinBlockComment:
+    @pytest.mark.parametrize(
+        "lines, expected_output",
+        [
+            ([], ""),
+            (["", ""], ""),
+            (["this is a comment"], "This is a comment."),
+            (
+                ["This is a comment", "that finishes in another line."],
+                "This is a comment that finishes in another line.",
+            ),
+            (["First paragraph.", "", "Second paragraph."], "First paragraph.\n\nSecond paragraph."),
+            (['"""Quoted"""', "'''comment'''"], "Quoted comment."),
+        ],
+    )
+    def test_method(self, lines: Sequence[str], expected_output: str) -> None:
+        data_file_modifier = YamlFileModifier(TEST_FILES_DIR / "only_dicts_comments_above.yaml", comments_are="above")
+        assert expected_output == data_file_modifier._join_block_comment(lines)
 
 
 @pytest.mark.usefixtures("_serial")
@@ -838,8 +788,9 @@ class TestIntegration:
         object_to_be_created: Union[Mapping[str, object], Sequence[object]],
     ) -> None:
         data_file_modifier = YamlFileModifier(TEST_FILES_DIR / file, comments_are=comments_are)
-        path = data_file_modifier.create_temporary_file_with_comments_as_keys()
-        assert object_to_be_created == self.read_yaml(path)
+        with data_file_modifier.temporary_file_with_comments_as_keys() as path:
+            assert object_to_be_created == self.read_yaml(path)
+        assert not path.exists()
 
     def read_yaml(self, path: Union[Path, str]) -> Union[Mapping[str, object], Sequence[object]]:
         with open(path) as f:
@@ -852,3 +803,34 @@ class TestIntegration:
             elif isinstance(content, (tuple, list)):
                 return list(content)
             raise ValueError("Non recognized format.")
+
+
+def test_temporary_files_are_not_shared() -> None:
+    modifier = YamlFileModifier(TEST_FILES_DIR / "only_dicts_comments_side.yaml", comments_are="side")
+    create_file = modifier.temporary_file_with_comments_as_keys
+    with create_file() as path, create_file() as other_path:
+        assert path != other_path
+        assert path.read_text() == other_path.read_text()
+        assert path.name.endswith("_only_dicts_comments_side.yaml")
+    assert not path.exists()
+    assert not other_path.exists()
+
+
+@pytest.mark.parametrize("comments_are", ["above", "below"])
+def test_block_comments_do_not_wrap_around_the_file(tmp_path: Path, comments_are: YAML_COMMENTS_POSITION) -> None:
+    path = tmp_path / "file.yaml"
+    path.write_text("# Last comment\nkey: 1" if comments_are == "below" else "key: 1\n# Last comment")
+    data_file_modifier = YamlFileModifier(path, comments_are=comments_are)
+    assert data_file_modifier._extract_comments() == ()
+
+
+def test_lines_are_streamed_with_their_comments(tmp_path: Path) -> None:
+    path = tmp_path / "file.yaml"
+    path.write_text("a: 1  # Side\n# Below\n# and more\nb:\n  - 2\n")
+    data_file_modifier = YamlFileModifier(path, comments_are=["side", "below"])
+    lines_with_comments = list(data_file_modifier._iter_lines_with_comments())
+    assert [line for line, _ in lines_with_comments] == path.read_text().splitlines()
+    comment = lines_with_comments[0][1]
+    assert comment is not None
+    assert comment.full_string == "Side.\n\nBelow and more."
+    assert all(comment is None for _, comment in lines_with_comments[1:])
@@ -1,10 +1,27 @@
+import io
+import json
+import queue
+import sqlite3
+import threading
+from functools import partial
 from pathlib import Path
-from typing import Union
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Callable, Union
+from unittest.mock import patch
 
+import numpy as np
+import pandas as pd
 import pytest
 import yaml
 
-from lazy_type_hint.generators.lazy_type_hint import LazyTypeHint
+from lazy_type_hint.data_type_tree import DataTypeTree, data_type_tree_factory
+from lazy_type_hint.generators import lazy_type_hint as lazy_type_hint_module
+from lazy_type_hint.generators.lazy_type_hint import LazyTypeHint, LazyTypeHintError, Tree
+from lazy_type_hint.generators.watch import Watch
+from lazy_type_hint.strategies import ParsingStrategies
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
 
 
 @pytest.fixture
@@ -28,6 +45,150 @@ class TestLazyTypeHintFromData:
         result.to_file(Path(tmp_path) / "file.py")
 
 
+class TestTreeSerialization:
+    def test_dump_and_load(self, lazy_type_hint: LazyTypeHint, tmp_path: Path) -> None:
+        result = lazy_type_hint.from_data([{"a": 1, "b": [1]}, {"a": 2}], class_name="Example")
+        result.dump(tmp_path / "tree.json")
+        assert result.to_string() == Tree.load(tmp_path / "tree.json").to_string()
+        assert result.to_string() == Tree.loads(result.dumps()).to_string()
+
+    def test_load_with_other_strategies(self, lazy_type_hint: LazyTypeHint) -> None:
+        result = lazy_type_hint.from_data([[1, 2]], class_name="Example")
+        loaded = Tree.loads(result.dumps(), strategies=ParsingStrategies(list_strategy="Sequence"))
+        assert "Example: TypeAlias = Sequence[Sequence[int]]" in loaded.to_string()
+
+
+class TestLazyTypeHintFromSqlite:
+    @pytest.fixture
+    def connection(self, tmp_path: Path) -> sqlite3.Connection:
+        connection = sqlite3.connect(tmp_path / "database.db")
+        connection.execute("CREATE TABLE data (id INTEGER PRIMARY KEY, name TEXT NOT NULL, score REAL, misc)")
+        connection.executemany(
+            "INSERT INTO data VALUES (?, ?, ?, ?)", [(1, "a", 1.5, None), (2, "b", None, "x"), (3, "c", 2.0, 3)]
+        )
+        connection.execute("CREATE TABLE empty (id INTEGER NOT NULL, name VARCHAR(10), value NUMERIC, misc)")
+        connection.execute("CREATE TABLE notes (id INTEGER PRIMARY KEY, name text, note TEXT)")
+        connection.executemany("INSERT INTO notes VALUES (?, ?, ?)", [(1, "a", None), (2, "b", None)])
+        connection.commit()
+        return connection
+
+    def test_table(self, lazy_type_hint: LazyTypeHint, connection: sqlite3.Connection) -> None:
+        result = lazy_type_hint.from_sqlite(connection, "data", class_name="Example").to_string(include_imports=False)
+        assert "    score: Optional[float]\n" in result
+        assert "    misc: Optional[Union[int, str]]\n" in result
+
+    def test_table_without_rows(self, lazy_type_hint: LazyTypeHint, connection: sqlite3.Connection) -> None:
+        result = lazy_type_hint.from_sqlite(connection, "empty", class_name="Example").to_string(include_imports=False)
+        assert "    id: int\n    name: Optional[str]\n    value: Optional[float]\n    misc: Any" in result
+
+    def test_query(self, lazy_type_hint: LazyTypeHint, connection: sqlite3.Connection, tmp_path: Path) -> None:
+        connection.close()
+        result = lazy_type_hint.from_sqlite(
+            tmp_path / "database.db", "SELECT name, COUNT(*) AS n FROM data GROUP BY name", class_name="Example"
+        )
+        assert "class Example(TypedDict):\n    name: str\n    n: int" in result.to_string()
+
+    def test_declared_nullability_and_types(self, lazy_type_hint: LazyTypeHint, connection: sqlite3.Connection) -> None:
+        result = lazy_type_hint.from_sqlite(connection, "notes", class_name="Example").to_string(include_imports=False)
+        # Nullable columns are Optional and those only holding NULL take their declared type
+        assert "    id: int\n    name: Optional[str]\n    note: Optional[str]\n" in result
+
+    def test_query_without_rows(self, lazy_type_hint: LazyTypeHint, connection: sqlite3.Connection) -> None:
+        result = lazy_type_hint.from_sqlite(
+            connection, "SELECT id, name, score * 2 AS double FROM data WHERE id < 0", class_name="Example"
+        ).to_string(include_imports=False)
+        assert "    id: Optional[int]\n    name: Optional[str]\n    double: Any\n" in result
+        assert not connection.execute("SELECT * FROM sqlite_temp_master").fetchall()
+
+    def test_repeated_column_names(self, lazy_type_hint: LazyTypeHint, connection: sqlite3.Connection) -> None:
+        with pytest.raises(LazyTypeHintError, match="different names.*: id"):
+            lazy_type_hint.from_sqlite(
+                connection, "SELECT a.id, b.id FROM data AS a JOIN notes AS b", class_name="Example"
+            )
+
+    def test_only_a_sample_of_rows_is_fetched(self, connection: sqlite3.Connection) -> None:
+        lazy_type_hint = LazyTypeHint(ParsingStrategies(check_max_n_elements_within_container=1))
+        result = lazy_type_hint.from_sqlite(connection, "data", class_name="Example").to_string(include_imports=False)
+        assert "    misc: None" in result
+
+
+class TestLazyTypeHintFromXmlFile:
+    def test_from_xml_file(self, lazy_type_hint: LazyTypeHint, tmp_path: Path) -> None:
+        path = tmp_path / "file.xml"
+        path.write_text('<root version="1"><item><name>a</name></item><item><name>b</name></item></root>')
+        result = lazy_type_hint.from_xml_file(path, class_name="Example").to_string(include_imports=False)
+        assert "class ExampleItemDict(TypedDict):\n    name: str" in result
+        assert "class Example(TypedDict):\n    version: str\n    item: ExampleItem" in result
+
+
+class TestLazyTypeHintFromNumpyFiles:
+    @pytest.mark.parametrize(
+        "array",
+        (
+            np.zeros((3, 4), dtype=np.float32),
+            np.zeros((2, 2), order="F"),
+            np.zeros(2, dtype=[("x", "i4"), ("y", "f8", (2,))]),
+            np.array([], dtype=object),
+        ),
+    )
+    def test_from_npy_file(self, lazy_type_hint: LazyTypeHint, array: np.ndarray, tmp_path: Path) -> None:
+        np.save(tmp_path / "array.npy", array)
+        expected = lazy_type_hint.from_data(array, class_name="Example").to_string()
+        assert expected == lazy_type_hint.from_npy_file(tmp_path / "array.npy", class_name="Example").to_string()
+
+    @pytest.mark.parametrize("version", [(1, 0), (2, 0), (3, 0)])
+    def test_npy_versions(self, lazy_type_hint: LazyTypeHint, tmp_path: Path, version: tuple[int, int]) -> None:
+        array = np.zeros(2, dtype=[("x", "i4"), ("é", "f8")])
+        with open(tmp_path / "array.npy", "wb") as file:
+            np.lib.format.write_array(file, array, version=version)
+        expected = lazy_type_hint.from_data(array, class_name="Example").to_string()
+        assert expected == lazy_type_hint.from_npy_file(tmp_path / "array.npy", class_name="Example").to_string()
+
+    def test_array_data_is_not_read(self, lazy_type_hint: LazyTypeHint, tmp_path: Path) -> None:
+        path = tmp_path / "array.npy"
+        np.save(path, np.zeros(1000))
+        path.write_bytes(path.read_bytes()[:-8000])  # Keep the header only
+        assert '"NDArray[np.float64]"' in lazy_type_hint.from_npy_file(path, class_name="Example").to_string()
+
+    def test_object_elements_are_any(self, lazy_type_hint: LazyTypeHint, tmp_path: Path) -> None:
+        np.save(tmp_path / "array.npy", np.array([1, "a"], dtype=object))
+        result = lazy_type_hint.from_npy_file(tmp_path / "array.npy", class_name="Example").to_string()
+        assert "def __getitem__(self, key: int) -> Any:" in result
+
+    def test_from_npz_file(self, lazy_type_hint: LazyTypeHint, tmp_path: Path) -> None:
+        arrays: dict[str, NDArray[Any]] = {"x": np.arange(3), "y": np.zeros((2, 2), dtype=np.float32)}
+        np.savez_compressed(tmp_path / "arrays.npz", x=arrays["x"], y=arrays["y"])
+        expected = lazy_type_hint.from_data(arrays, class_name="Example").to_string()
+        assert expected == lazy_type_hint.from_npz_file(tmp_path / "arrays.npz", class_name="Example").to_string()
+
+
+class TestLazyTypeHintFromCsvFile:
+    @pytest.mark.parametrize(
+        "content",
+        (
+            "a,b,c\n1,x,True\n2,y,False\n",
+            "a\n1\n2\n2.5\n",
+            "a\n1\n2\nx\n",
+            "a,b\nx,True\ny,\nz,False\n,True\n",
+            "a,b\n",
+        ),
+    )
+    @pytest.mark.parametrize("chunksize", (1, 2, 100))
+    def test_from_csv_file(self, lazy_type_hint: LazyTypeHint, content: str, chunksize: int, tmp_path: Path) -> None:
+        path = tmp_path / "data.csv"
+        path.write_text(content)
+        expected = lazy_type_hint.from_data(pd.read_csv(path), class_name="Example").to_string()
+        assert expected == lazy_type_hint.from_csv_file(path, class_name="Example", chunksize=chunksize).to_string()
+
+    def test_max_rows(self, lazy_type_hint: LazyTypeHint, tmp_path: Path) -> None:
+        path = tmp_path / "data.csv"
+        path.write_text("a\n1\n2\nx\n")
+        result = lazy_type_hint.from_csv_file(path, class_name="Example", chunksize=1, max_rows=2)
+        assert (
+            result.to_string() == lazy_type_hint.from_data(pd.read_csv(path, nrows=2), class_name="Example").to_string()
+        )
+
+
 class TestLazyTypeHintFromYamlFile:
     @pytest.fixture
     def yaml_file(self, data: object, tmp_path: str) -> Path:
@@ -60,3 +221,312 @@ class TestLazyTypeHintFromYamlFile:
         result = lazy_type_hint.from_yaml_file(loader=self.yaml_file_loader, path=yaml_file, class_name="Example")
         result.to_string()
         result.to_file(Path(tmp_path) / "file.py")
+
+
+class TestLazyTypeHintFromYamlFileLoadsOnce:
+    def test_file_is_loaded_once(self, lazy_type_hint: LazyTypeHint, tmp_path: Path) -> None:
+        calls: list[Union[Path, str]] = []
+
+        def loader(path: Union[Path, str]) -> object:
+            calls.append(path)
+            with open(path) as f:
+                return yaml.load(f, Loader=yaml.SafeLoader)
+
+        path = tmp_path / "file.yaml"
+        path.write_text("a: 1  # Comment\n")
+        assert "Comment." in lazy_type_hint.from_yaml_file(loader=loader, path=path, class_name="Example").to_string()
+        assert len(calls) == 1
+        assert not Path(calls[0]).exists()
+
+    def test_original_file_is_loaded_if_comments_cannot_be_used(
+        self, lazy_type_hint: LazyTypeHint, tmp_path: Path
+    ) -> None:
+        def loader(path: Union[Path, str]) -> object:
+            if Path(path).name != "file.yaml":
+                raise ValueError("Only the original file can be loaded")
+            with open(path) as f:
+                return yaml.load(f, Loader=yaml.SafeLoader)
+
+        path = tmp_path / "file.yaml"
+        path.write_text("a: 1  # Comment\n")
+        result = lazy_type_hint.from_yaml_file(loader=loader, path=path, class_name="Example").to_string()
+        assert "a: int" in result
+        assert "Comment" not in result
+
+
+class TestLazyTypeHintFromYamlDocuments:
+    CONTENT = (
+        "kind: Deployment  # Kind of the resource\nreplicas: 1\n---\n"
+        "kind: Service\nports: [80]  # Ports exposed\n---\n"
+        "kind: Deployment\nreplicas: 3\n"
+    )
+
+    @staticmethod
+    def yaml_documents_loader(path: Union[Path, str]) -> Iterator[object]:
+        with open(path) as f:
+            yield from yaml.safe_load_all(f)
+
+    @pytest.fixture
+    def yaml_file(self, tmp_path: Path) -> Path:
+        path = tmp_path / "file.yaml"
+        path.write_text(self.CONTENT)
+        return path
+
+    def test_from_yaml_documents(self, lazy_type_hint: LazyTypeHint, yaml_file: Path) -> None:
+        result = lazy_type_hint.from_yaml_documents(
+            self.yaml_documents_loader, yaml_file, class_name="Example", comments_are=None
+        )
+        documents = list(yaml.safe_load_all(self.CONTENT))
+        assert result.to_string() == lazy_type_hint.from_data(documents, class_name="Example").to_string()
+
+    def test_group_by_key(self, lazy_type_hint: LazyTypeHint, yaml_file: Path) -> None:
+        result = lazy_type_hint.from_yaml_documents(
+            self.yaml_documents_loader, yaml_file, class_name="Example", group_by_key="kind"
+        ).to_string(include_imports=False)
+        assert 'class ExampleDeploymentDict(TypedDict):\n    kind: str\n    """Kind of the resource."""' in result
+        assert 'class ExampleServiceDict(TypedDict):\n    kind: str\n    ports: list[int]\n    """Ports' in result
+        assert "class Example(TypedDict):\n    Deployment: ExampleDeployment\n    Service: ExampleService" in result
+
+    def test_only_different_documents_are_kept(
+        self, lazy_type_hint: LazyTypeHint, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = tmp_path / "file.yaml"
+        path.write_text("---\n".join(f"name: {idx}\n" for idx in range(100)) + "---\nname: [1]\n")
+        inferred: list[object] = []
+
+        def spy_data_type_tree_factory(data: object, **kwargs: Any) -> DataTypeTree:
+            inferred.append(data)
+            tree: DataTypeTree = data_type_tree_factory(data, **kwargs)
+            return tree
+
+        monkeypatch.setattr(lazy_type_hint_module, "data_type_tree_factory", spy_data_type_tree_factory)
+        result = lazy_type_hint.from_yaml_documents(self.yaml_documents_loader, path, class_name="Example")
+        # Each document is inferred once and the list is built from the trees of the different ones
+        assert inferred[:-1] == [{"name": idx} for idx in range(100)] + [{"name": [1]}]
+        assert [child.holding_type for child in inferred[-1]] == [dict, dict]  # type: ignore[attr-defined]
+        expected = lazy_type_hint.from_data([{"name": 0}, {"name": [1]}], class_name="Example")
+        assert result.to_string() == expected.to_string()
+
+    def test_group_by_unhashable_value(self, lazy_type_hint: LazyTypeHint, tmp_path: Path) -> None:
+        path = tmp_path / "file.yaml"
+        path.write_text("kind: [a]\nname: x\n---\nkind: b\nname: 1\n")
+        result = lazy_type_hint.from_yaml_documents(
+            self.yaml_documents_loader, path, class_name="Example", group_by_key="kind", comments_are=None
+        ).to_string(include_imports=False)
+        assert "class ExampleADict(TypedDict):\n    kind: list[str]\n    name: str" in result
+        assert '"[\'a\']": ExampleA,\n        "b": ExampleB,' in result
+
+    def test_group_by_values_with_the_same_string(self, lazy_type_hint: LazyTypeHint, tmp_path: Path) -> None:
+        path = tmp_path / "file.yaml"
+        path.write_text("name: x\n---\nkind: 'None'\nname: 1\n---\nkind: 1\n---\nkind: '1'\n")
+        result = lazy_type_hint.from_yaml_documents(
+            self.yaml_documents_loader, path, class_name="Example", group_by_key="kind", comments_are=None
+        ).to_string(include_imports=False)
+        assert (
+            '"None (NoneType)": ExampleNoneNoneType,\n        "None (str)": ExampleNoneStr,\n'
+            '        "1 (int)": ExampleInt,\n        "1 (str)": ExampleStr,\n'
+        ) in result
+
+
+class TestLazyTypeHintFromYamlFileWithCache:
+    def test_cache_is_used(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.yaml"
+        path.write_text("a: 1  # Comment\nb: [1, 2]\n")
+        lazy_type_hint = LazyTypeHint(cache_dir=tmp_path / "cache")
+        with patch.object(yaml, "safe_load", wraps=yaml.safe_load) as safe_load:
+            expected = lazy_type_hint.from_yaml_file(loader=load_yaml, path=path, class_name="Example").to_string()
+            n_calls = safe_load.call_count
+            assert n_calls > 0
+
+            result = LazyTypeHint(cache_dir=tmp_path / "cache").from_yaml_file(
+                loader=load_yaml, path=path, class_name="Example"
+            )
+            assert safe_load.call_count == n_calls
+            assert result.to_string() == expected
+            assert "Comment" in expected
+
+            result = LazyTypeHint(
+                ParsingStrategies(list_strategy="Sequence"), cache_dir=tmp_path / "cache"
+            ).from_yaml_file(loader=load_yaml, path=path, class_name="Example")
+            assert safe_load.call_count > n_calls
+            assert "Sequence[int]" in result.to_string()
+
+            n_calls = safe_load.call_count
+            path.write_text("a: 1  # Comment\nb: [1, 2.0]\n")
+            result = lazy_type_hint.from_yaml_file(loader=load_yaml, path=path, class_name="Example")
+            assert safe_load.call_count > n_calls
+            assert "float" in result.to_string()
+
+    def test_different_loaders_do_not_share_entries(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.yaml"
+        path.write_text("a: 1\n")
+        lazy_type_hint = LazyTypeHint(cache_dir=tmp_path / "cache")
+        loaders: list[Callable[[Path], object]] = [
+            lambda _path: {"a": 1},
+            lambda _path: {"a": "b"},
+            partial(load_yaml_with_key, key="int"),
+            partial(load_yaml_with_key, key="str"),
+        ]
+        results = [
+            lazy_type_hint.from_yaml_file(loader=loader, path=path, class_name="Example", comments_are=None)
+            for loader in loaders
+        ]
+        assert ["a: int" in result.to_string() for result in results] == [True, False, True, False]
+
+    def test_loaders_capturing_objects_are_not_cached(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.yaml"
+        path.write_text("a: 1\n")
+        lazy_type_hint = LazyTypeHint(cache_dir=tmp_path / "cache")
+        data: dict[str, object] = {"a": 1}
+        lazy_type_hint.from_yaml_file(loader=lambda _path: data, path=path, class_name="Example", comments_are=None)
+        data["a"] = "b"
+        result = lazy_type_hint.from_yaml_file(
+            loader=lambda _path: data, path=path, class_name="Example", comments_are=None
+        )
+        assert "a: str" in result.to_string()
+        assert not list((tmp_path / "cache").glob("*"))
+
+
+def load_yaml(path: Path) -> object:
+    with open(path) as file:
+        return yaml.safe_load(file)
+
+
+def load_yaml_with_key(_path: Path, *, key: str) -> object:
+    return {"a": 1 if key == "int" else "b"}
+
+
+class TestLazyTypeHintFromDirectory:
+    @pytest.fixture
+    def root(self, tmp_path: Path) -> Path:
+        database = {"host": "x", "port": 1, "replicas": [{"host": "y", "weight": 1.0}]}
+        root = tmp_path / "configs"
+        (root / "services").mkdir(parents=True)
+        (root / "services" / "service-a.json").write_text(json.dumps({"name": "a", "database": database}))
+        (root / "services" / "service_b.json").write_text(json.dumps({"title": "b", "db": database}))
+        (root / "settings.yaml").write_text("debug: true  # Whether to debug\n")
+        return root
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_from_directory(self, lazy_type_hint: LazyTypeHint, root: Path, workers: int, tmp_path: Path) -> None:
+        result = lazy_type_hint.from_directory(root, workers=workers)
+        assert list(result.trees) == [Path("services/service-a.json"), Path("services/service_b.json")]
+        assert list(result.timings) == list(result.trees)
+        assert all(seconds > 0 for seconds in result.timings.values())
+        assert "db: ServicesServiceADatabase" in result.trees[Path("services/service_b.json")].to_string()
+
+        package = tmp_path / "package"
+        paths = result.to_package(package, create_non_existing_dir=True)
+        assert sorted(path.name for path in paths) == [
+            "__init__.py",
+            "_shared.py",
+            "services_service_a.py",
+            "services_service_b.py",
+        ]
+        assert "class ServicesServiceADatabase(TypedDict):" in (package / "_shared.py").read_text()
+        assert "from ._shared import ServicesServiceADatabase" in (package / "services_service_b.py").read_text()
+        assert not result.to_package(package)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_yaml_files(self, lazy_type_hint: LazyTypeHint, root: Path, workers: int) -> None:
+        result = lazy_type_hint.from_directory(root, pattern="*.yaml", loader=load_yaml, workers=workers)
+        assert "Whether to debug." in result.trees[Path("settings.yaml")].to_string()
+
+    def test_loader_is_needed(self, lazy_type_hint: LazyTypeHint, root: Path) -> None:
+        with pytest.raises(LazyTypeHintError, match="loader"):
+            lazy_type_hint.from_directory(root, pattern="**/*.yaml", workers=1)
+
+
+class TestLazyTypeHintWatch:
+    def test_update(self, lazy_type_hint: LazyTypeHint, tmp_path: Path) -> None:
+        path = tmp_path / "config.json"
+        output = tmp_path / "stubs" / "config.py"
+        path.write_text(json.dumps({"name": "a"}))
+        watch = Watch(lazy_type_hint, {path: output})
+        assert watch.update() == [output]
+        assert "class Config(TypedDict):" in output.read_text()
+
+        # Outputs are not rendered again if only the values changed
+        path.write_text(json.dumps({"name": "b"}))
+        with patch.object(Tree, "to_file") as to_file:
+            assert watch.update() == []
+        to_file.assert_not_called()
+
+        path.write_text(json.dumps({"name": "b", "port": 1}))
+        assert watch.update([path]) == [output]
+        assert "port: int" in output.read_text()
+
+    def test_watch(self, lazy_type_hint: LazyTypeHint, tmp_path: Path) -> None:
+        paths = [tmp_path / "config.json", tmp_path / "other.json"]
+        outputs = {path: tmp_path / f"{path.stem}.py" for path in paths}
+        for path in paths:
+            path.write_text(json.dumps({"name": "a"}))
+        updates: queue.Queue[list[Path]] = queue.Queue()
+        errors: queue.Queue[tuple[Path, Exception]] = queue.Queue()
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=lazy_type_hint.watch,
+            args=(outputs,),
+            kwargs={
+                "poll_interval": 0.01,
+                "debounce": 0.05,
+                "stop": stop,
+                "on_update": updates.put,
+                "on_error": lambda path, error: errors.put((path, error)),
+            },
+        )
+        thread.start()
+        try:
+            assert updates.get(timeout=5) == list(outputs.values())
+            paths[1].write_text(json.dumps({"name": "a", "port": 1}))
+            assert updates.get(timeout=5) == [outputs[paths[1]]]
+            paths[0].write_text("{")
+            assert errors.get(timeout=5)[0] == paths[0]
+            assert "class Config(TypedDict):" in outputs[paths[0]].read_text()
+        finally:
+            stop.set()
+            thread.join()
+
+
+class TestTreeWrite:
+    def test_write(self, lazy_type_hint: LazyTypeHint, tmp_path: Path) -> None:
+        data = [{"a": 1, "b": [1, 2.0]}, {"a": 2}]
+        expected = lazy_type_hint.from_data(data, class_name="Example").to_string()
+        stream = io.StringIO()
+        lazy_type_hint.from_data(data, class_name="Example").write(stream)
+        assert expected == stream.getvalue()
+        lazy_type_hint.from_data(data, class_name="Example").to_file(tmp_path / "file.py")
+        assert expected == (tmp_path / "file.py").read_text()
+
+    def test_to_file_skips_unchanged_content(self, lazy_type_hint: LazyTypeHint, tmp_path: Path) -> None:
+        path = tmp_path / "file.py"
+        assert lazy_type_hint.from_data({"a": 1}, class_name="Example").to_file(path)
+        assert not lazy_type_hint.from_data({"a": 2}, class_name="Example").to_file(path)
+        assert lazy_type_hint.from_data({"a": "2"}, class_name="Example").to_file(path)
+
+    def test_write_many(self, lazy_type_hint: LazyTypeHint, tmp_path: Path) -> None:
+        trees = {
+            tmp_path / "dir" / f"file{idx}.py": lazy_type_hint.from_data([idx], class_name="Example")
+            for idx in range(3)
+        }
+        with pytest.raises(ValueError, match="does not exist"):
+            Tree.write_many(trees)
+        assert Tree.write_many(trees, create_non_existing_dir=True) == list(trees)
+        trees[tmp_path / "dir" / "file0.py"] = lazy_type_hint.from_data(["a"], class_name="Example")
+        assert Tree.write_many(trees) == [tmp_path / "dir" / "file0.py"]
+        assert "list[str]" in (tmp_path / "dir" / "file0.py").read_text()
+
+    def test_to_package(self, lazy_type_hint: LazyTypeHint, tmp_path: Path) -> None:
+        data = {"users": [{"name": "Albert"}], "scores": {"Albert": 1.0}}
+        path = tmp_path / "package"
+        with pytest.raises(ValueError, match="does not exist"):
+            lazy_type_hint.from_data(data, class_name="Example").to_package(path)
+        paths = lazy_type_hint.from_data(data, class_name="Example").to_package(path, create_non_existing_dir=True)
+        assert sorted(path.name for path in paths) == [
+            "__init__.py",
+            "example.py",
+            "example_scores.py",
+            "example_users.py",
+        ]
+        assert "from .example import Example as Example" in (path / "__init__.py").read_text()
+        assert not lazy_type_hint.from_data(data, class_name="Example").to_package(path)
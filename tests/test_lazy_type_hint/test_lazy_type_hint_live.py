@@ -5,6 +5,7 @@ from collections.abc import Mapping
 import pytest
 import yaml
 
+from lazy_type_hint.data_type_tree import DataTypeTree
 from lazy_type_hint.generators.lazy_type_hint_live import LazyTypeHintLive, LazyTypeHintLiveError
 from lazy_type_hint.strategies import ParsingStrategies
 from lazy_type_hint.utils import Mypy
@@ -119,6 +120,34 @@ class TestLazyTypeHintLiveValidationFromData:
                 if_type_hint_exists="validate", strategies=ParsingStrategies(list_strategy="list")
             ).from_data([1, 2], class_name="Example")
 
+    @pytest.mark.parametrize("if_type_hint_exists", ["overwrite", "validate"])
+    def test_unchanged_type_hints_are_not_rendered(
+        self, if_type_hint_exists: Literal["overwrite", "validate"], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        LazyTypeHintLive(if_type_hint_exists=if_type_hint_exists).from_data({"a": [1, 2]}, class_name=self.name)
+        type_hints_before = self.read_type_hints()
+
+        def get_str_all_nodes(*args: Any, **kwargs: Any) -> str:  # noqa: ARG001
+            raise AssertionError("Type hints were rendered")
+
+        with monkeypatch.context() as context:
+            context.setattr(DataTypeTree, "get_str_all_nodes", get_str_all_nodes)
+            LazyTypeHintLive(if_type_hint_exists=if_type_hint_exists).from_data({"a": [3]}, class_name=self.name)
+        assert type_hints_before == self.read_type_hints()
+
+    def test_validation_without_fingerprints(self) -> None:
+        LazyTypeHintLive(if_type_hint_exists="validate").from_data([1, 2], class_name=self.name)
+        for path in LazyTypeHintLive._custom_class_dir_path.glob(f"*{LazyTypeHintLive._fingerprint_suffix}"):
+            path.unlink()
+        LazyTypeHintLive(if_type_hint_exists="validate").from_data([3], class_name=self.name)
+        with pytest.raises(LazyTypeHintLiveError):
+            LazyTypeHintLive(if_type_hint_exists="validate").from_data(["3"], class_name=self.name)
+
+    def test_validation_error_reports_changes(self) -> None:
+        LazyTypeHintLive(if_type_hint_exists="validate").from_data({"a": [1], "b": 1}, class_name=self.name)
+        with pytest.raises(LazyTypeHintLiveError, match=r"\['a'\]\[\*\]: widened union \(str\)"):
+            LazyTypeHintLive(if_type_hint_exists="validate").from_data({"a": [1, "2"], "b": 1}, class_name=self.name)
+
     def read_type_hints(self) -> str:
         return Path(LazyTypeHintLive._custom_class_dir_path / f"{self.name}.py").read_text(encoding="utf-8")
 
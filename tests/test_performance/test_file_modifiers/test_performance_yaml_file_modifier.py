@@ -0,0 +1,27 @@
+from pathlib import Path
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from lazy_type_hint.file_modifiers.yaml_file_modifier import YamlFileModifier
+
+
+def create_yaml_file(path: Path, *, n_keys: int) -> Path:
+    with open(path, "w") as file:
+        for idx in range(n_keys):
+            file.write(f"key_{idx}:  # Side comment\n  # Comment below\n  child: 'va:l#ue'\n  items:\n    - name: 1\n")
+    return path
+
+
+class TestManyComments:
+    def test_create_temporary_file(self, benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+        modifier = YamlFileModifier(
+            create_yaml_file(tmp_path / "file.yaml", n_keys=10_000), comments_are=["side", "below"]
+        )
+
+        def create_temporary_file() -> None:
+            with modifier.temporary_file_with_comments_as_keys():
+                pass
+
+        benchmark(create_temporary_file)
+        assert benchmark.stats is not None
+        assert benchmark.stats.stats.mean < 1.5
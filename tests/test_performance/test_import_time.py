@@ -0,0 +1,33 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def get_import_times(module: str) -> dict[str, float]:
+    """Import the module in a new interpreter and get the cumulative seconds spent importing each module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parents[2],
+    )
+    import_times: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        import_times[name.strip()] = int(cumulative) / 1e6
+    return import_times
+
+
+class TestImportTime:
+    def test_import(self, benchmark: BenchmarkFixture) -> None:
+        import_times = benchmark.pedantic(  # type: ignore[no-untyped-call]
+            get_import_times, args=("lazy_type_hint",), rounds=5
+        )
+        assert "pandas" not in import_times
+        assert "numpy" not in import_times
+        assert import_times["lazy_type_hint"] < 0.35
@@ -0,0 +1,39 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from lazy_type_hint.utils.file_cache import FileCache
+
+
+def test_get_and_set(tmp_path: Path) -> None:
+    cache = FileCache(tmp_path / "cache")
+    key = FileCache.create_key(b"content", "loader")
+    assert cache.get(key) is None
+    cache.set(key, "value")
+    assert cache.get(key) == "value"
+    cache.clear()
+    assert cache.get(key) is None
+
+
+def test_create_key() -> None:
+    assert FileCache.create_key("a", "b") == FileCache.create_key(b"a", "b")
+    assert FileCache.create_key("ab", "") != FileCache.create_key("a", "b")
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    cache = FileCache(tmp_path, max_size=25)
+    for idx, key in enumerate("abc"):
+        cache.set(key, "0123456789")
+        os.utime(tmp_path / f"{key}{FileCache.SUFFIX}", (idx, idx))
+    assert cache.get("a") is None
+    assert cache.get("b") == "0123456789"  # Marks "b" as the most recently used one
+    cache.set("d", "0123456789")
+    assert cache.get("b") is not None
+    assert cache.get("c") is None
+    assert cache.get("d") is not None
+
+
+def test_invalid_max_size(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="max_size"):
+        FileCache(tmp_path, max_size=0)
@@ -0,0 +1,55 @@
+import os
+import threading
+from pathlib import Path
+
+from lazy_type_hint.utils.file_watcher import FileWatcher
+
+
+def set_content(path: Path, content: str, *, mtime_ns: int) -> None:
+    path.write_text(content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestPoll:
+    def test_changes_are_detected(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.json"
+        set_content(path, "1", mtime_ns=1_000_000_000)
+        watcher = FileWatcher([path, tmp_path / "other.json"])
+        assert watcher.poll() == []
+
+        set_content(path, "2", mtime_ns=2_000_000_000)
+        assert watcher.poll() == [path]
+        assert watcher.poll() == []
+
+    def test_touched_files_are_not_reported(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.json"
+        set_content(path, "1", mtime_ns=1_000_000_000)
+        watcher = FileWatcher([path])
+        set_content(path, "1", mtime_ns=2_000_000_000)
+        assert watcher.poll() == []
+
+    def test_created_and_removed_files(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.json"
+        watcher = FileWatcher([path])
+        path.write_text("1")
+        assert watcher.poll() == [path]
+        path.unlink()
+        assert watcher.poll() == [path]
+
+
+class TestWaitForChanges:
+    def test_bursts_are_debounced(self, tmp_path: Path) -> None:
+        paths = [tmp_path / "file0.json", tmp_path / "file1.json"]
+        watcher = FileWatcher(paths)
+        paths[0].write_text("1")
+        timer = threading.Timer(0.05, paths[1].write_text, args=("1",))
+        timer.start()
+        try:
+            assert watcher.wait_for_changes(poll_interval=0.01, debounce=0.2) == paths
+        finally:
+            timer.cancel()
+
+    def test_stop(self, tmp_path: Path) -> None:
+        stop = threading.Event()
+        stop.set()
+        assert FileWatcher([tmp_path / "file.json"]).wait_for_changes(stop=stop) == []
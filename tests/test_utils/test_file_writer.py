@@ -0,0 +1,41 @@
+import os
+from pathlib import Path
+from typing import IO, Callable
+
+import pytest
+
+from lazy_type_hint.utils.file_writer import write_file_if_changed
+
+
+def write_text(content: str) -> Callable[[IO[str]], None]:
+    def write(file: IO[str]) -> None:
+        file.write(content)
+
+    return write
+
+
+def test_write_file_if_changed(tmp_path: Path) -> None:
+    path = tmp_path / "file.py"
+    assert write_file_if_changed(path, write_text("content"))
+    assert path.read_text() == "content"
+
+    os.utime(path, ns=(0, 0))
+    assert not write_file_if_changed(path, write_text("content"))
+    assert path.stat().st_mtime_ns == 0
+
+    assert write_file_if_changed(path, write_text("other content"))
+    assert path.read_text() == "other content"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_write_file_if_changed_does_not_modify_file_on_error(tmp_path: Path) -> None:
+    path = tmp_path / "file.py"
+    path.write_text("content")
+
+    def write(file: object) -> None:  # noqa: ARG001
+        raise RuntimeError("Error while writing")
+
+    with pytest.raises(RuntimeError, match="Error while writing"):
+        write_file_if_changed(path, write)
+    assert path.read_text() == "content"
+    assert list(tmp_path.iterdir()) == [path]
@@ -92,3 +92,14 @@ from typing import (
         formatted_imports = import_manager.format(line_length=80)
         expected_output = ""
         assert expected_output == formatted_imports
+
+
+class TestRecord:
+    def test_record(self, import_manager: ImportManager) -> None:
+        import_manager.add("Any")
+        with import_manager.record() as recorder:
+            import_manager.add("Literal").add("Any")
+        import_manager.add("Protocol")
+        assert recorder._set == {"Literal", "Any"}
+        assert import_manager._set == {"Any", "Literal", "Protocol"}
+        assert import_manager.update(ImportManager().add("Union"))._set == {"Any", "Literal", "Protocol", "Union"}
@@ -0,0 +1,58 @@
+from xml.etree import ElementTree
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from lazy_type_hint.utils.xml_reader import read_xml_file
+
+CONTENT = """<?xml version="1.0"?>
+<feed xmlns="http://example.com" version="2">
+    <title>Title</title>
+    <entry id="1"><name>a</name><tag>x</tag><tag>y</tag></entry>
+    <entry id="2"><name>b</name><tag>z</tag></entry>
+    <note lang="en">Note</note>
+    <empty/>
+</feed>
+"""
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    path = tmp_path / "file.xml"
+    path.write_text(CONTENT)
+    return path
+
+
+def test_read_xml_file(path: Path) -> None:
+    assert read_xml_file(path) == {
+        "version": "2",
+        "title": "Title",
+        "entry": [{"id": "1", "name": "a", "tag": ["x", "y"]}, {"id": "2", "name": "b", "tag": "z"}],
+        "note": {"lang": "en", "text": "Note"},
+        "empty": "",
+    }
+
+
+def test_max_n_repeated_elements(path: Path) -> None:
+    value = read_xml_file(path, max_n_repeated_elements=1)
+    assert isinstance(value, dict)
+    assert value["entry"] == [{"id": "1", "name": "a", "tag": ["x"]}]
+
+
+def test_processed_elements_are_cleared(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "file.xml"
+    item = '<item id="1"><value>1</value></item>'
+    path.write_text(f"<root>{item * 100}</root>")
+    elements: list[ElementTree.Element] = []
+    iterparse = ElementTree.iterparse
+
+    def recording_iterparse(*args: Any, **kwargs: Any) -> Iterator[tuple[str, ElementTree.Element]]:
+        for event, element in iterparse(*args, **kwargs):
+            elements.append(element)
+            yield event, element
+
+    monkeypatch.setattr(ElementTree, "iterparse", recording_iterparse)
+    assert read_xml_file(path, max_n_repeated_elements=2) == {"item": [{"id": "1", "value": "1"}] * 2}
+    assert all(not len(element) and not element.attrib for element in elements)